@@ -5,17 +5,24 @@
 # Code adapted from flyingpigeon.dissimilarity, Nov 2020.
 from __future__ import annotations
 
+import os
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal
 
 import numpy as np
 import pandas as pd
 import xarray as xr
 from boltons.funcutils import wraps
+from numba import float64, guvectorize, int64, njit
 from scipy import spatial
 from scipy.spatial import cKDTree as KDTree
 
 metrics: dict[str, Any] = {}
+# Implementations of the metrics comparing one target sample to a batch of candidate samples at once.
+_batched_metrics: dict[str, Callable] = {}
+# Batched metrics whose compiled code releases the GIL, and can thus split the candidates between threads.
+_threaded_metrics = ["zech_aslan", "szekely_rizzo"]
 
 
 def spatial_analogs(
@@ -25,6 +32,10 @@ def spatial_analogs(
     method: Literal[
         "seuclidean", "nearest_neighbor", "zech_aslan", "kolmogorov_smirnov", "friedman_rafsky", "kldiv"
     ] = "kldiv",
+    top_k: int | None = None,
+    prefilter: Literal["seuclidean", "mahalanobis"] = "seuclidean",
+    shortlist: int | None = None,
+    n_workers: int | None = 1,
     **kwargs,
 ):
     r"""
@@ -47,6 +58,17 @@ def spatial_analogs(
         The dimension over which the *distributions* are constructed. This can be a multi-index dimension.
     method : {"seuclidean", "nearest_neighbor", "zech_aslan", "kolmogorov_smirnov", "friedman_rafsky", "kldiv"}
         Which method to use when computing the dissimilarity statistic.
+    top_k : int, optional
+        If given, only the `top_k` best analogs are returned. The candidates are first ranked with the `prefilter`
+        metric, and `method` is only computed on the `shortlist` best of them. Requires a single target.
+    prefilter : {"seuclidean", "mahalanobis"}
+        The metric used to shortlist the candidates when `top_k` is given. It should be cheap to compute.
+    shortlist : int, optional
+        The number of candidates retained by the `prefilter` metric. Defaults to ten times `top_k`.
+    n_workers : int, optional
+        Number of threads comparing the candidates of a block to the target, with the batched "zech_aslan" and
+        "szekely_rizzo" metrics, the only ones releasing the GIL. It has no effect on the other metrics.
+        If None, the default of :py:class:`concurrent.futures.ThreadPoolExecutor` is used. Default: 1.
     **kwargs : dict
         Any other parameter passed directly to the dissimilarity method.
 
@@ -54,8 +76,25 @@ def spatial_analogs(
     -------
     xr.DataArray
         The dissimilarity statistic over the union of candidates' and target's dimensions.
-        The range depends on the method.
+        The range depends on the method. With `top_k`, the dissimilarity of the best analogs, sorted along a new
+        "analog" dimension, with the coordinates of the candidates along it.
+
+    Notes
+    -----
+    When the target has no other dimension than `dist_dim`, the metrics are computed by batched implementations,
+    which prepare the target sample once and compare it to all candidates of a block in compiled loops. The
+    "zech_aslan" and "szekely_rizzo" metrics sum the distances between points as they are computed, without
+    allocating the distance matrices, in threads releasing the GIL. With `dask`, `dist_dim` is rechunked into a
+    single chunk. Otherwise, the metric is called for each candidate and target.
+
+    With `top_k`, the analogs are only searched among the candidates whose means are the closest to the target's, as
+    measured by the `prefilter` metric. Analogs with similar means but different distributions are ranked by
+    `method`, but a candidate outside the shortlist is never returned, even if it would have ranked better. The
+    result is computed, even if the inputs are dask-backed.
     """
+    if top_k is not None:
+        return _top_k_analogs(target, candidates, dist_dim, method, top_k, prefilter, shortlist, n_workers, kwargs)
+
     # Create the target DataArray:
     target_array = target.to_array("_indices", "target")
 
@@ -83,6 +122,21 @@ def spatial_analogs(
     if target_array.chunks is not None:
         target_array = target_array.chunk({"_indices": -1})
 
+    # With a single target, the batched implementation prepares the target sample once
+    # and compares it to all candidates of a block at once.
+    single_target = set(target_array.dims) == {dist_dim, "_indices"}
+    if method in _batched_metrics and single_target and not np.iterable(kwargs.get("k", 1)):
+        metric_func = _batched_metrics[method]
+        if target_array.chunks is not None:
+            target_array = target_array.chunk({dist_dim: -1})
+        if candidate_array.chunks is not None:
+            candidate_array = candidate_array.chunk({"_dist_dim": -1})
+        if method in _threaded_metrics:
+            kwargs = {**kwargs, "n_workers": n_workers}
+        vectorize = False
+    else:
+        vectorize = True
+
     # Compute dissimilarity
     diss = xr.apply_ufunc(
         metric_func,
@@ -90,7 +144,7 @@ def spatial_analogs(
         candidate_array,
         input_core_dims=[(dist_dim, "_indices"), ("_dist_dim", "_indices")],
         output_core_dims=[()],
-        vectorize=True,
+        vectorize=vectorize,
         dask="parallelized",
         output_dtypes=[float],
         kwargs=kwargs,
@@ -105,6 +159,57 @@ def spatial_analogs(
     return diss
 
 
+def _top_k_analogs(
+    target: xr.Dataset,
+    candidates: xr.Dataset,
+    dist_dim: str,
+    method: str,
+    top_k: int,
+    prefilter: str,
+    shortlist: int | None,
+    n_workers: int | None,
+    kwargs: dict,
+) -> xr.DataArray:
+    """Find the `top_k` best analogs among the candidates shortlisted by the `prefilter` metric."""
+    if any(set(da.dims) - {dist_dim} for da in target.data_vars.values()):
+        raise ValueError(f"`top_k` requires a single target, with no other dimension than `{dist_dim}`.")
+    if prefilter not in ["seuclidean", "mahalanobis"]:
+        raise ValueError(f"Prefilter `{prefilter}` is not supported. Use 'seuclidean' or 'mahalanobis'.")
+    shortlist = max(shortlist or 10 * top_k, top_k)
+
+    spatial_dims = [dim for dim in candidates.dims if dim != dist_dim]
+    candidates = candidates.stack(_candidates=spatial_dims)
+
+    # Candidates with missing values are NaN and sorted last.
+    coarse = spatial_analogs(target, candidates, dist_dim, method=prefilter).values
+    selected = np.argsort(coarse, kind="stable")[: min(shortlist, (~np.isnan(coarse)).sum())]
+
+    if method == prefilter:
+        diss = xr.DataArray(coarse[selected], dims=("_candidates",))
+    else:
+        diss = spatial_analogs(
+            target, candidates.isel(_candidates=selected), dist_dim, method=method, n_workers=n_workers, **kwargs
+        )
+    best = np.argsort(diss.values, kind="stable")[:top_k]
+    best = best[~np.isnan(diss.values[best])]
+
+    # The coordinates of the analogs, including the levels of the stacked index.
+    coords = {
+        name: ("analog", crd.values[selected[best]])
+        for name, crd in candidates.coords.items()
+        if crd.dims == ("_candidates",) and name != "_candidates"
+    }
+    out = xr.DataArray(diss.values[best], dims=("analog",), coords=coords)
+    out.name = "dissimilarity"
+    out.attrs.update(
+        long_name=f"Dissimilarity between target and its {top_k} best analogs, using metric {method}.",
+        indices=",".join(target.data_vars),
+        metric=method,
+        prefilter=prefilter,
+    )
+    return out
+
+
 # ---------------------------------------------------------------------------- #
 # -------------------------- Utility functions ------------------------------- #
 # ---------------------------------------------------------------------------- #
@@ -173,6 +278,49 @@ def metric(func: Callable):
     return _metric_overhead
 
 
+def batched_metric(name: str) -> Callable:
+    """
+    Register the batched implementation of a metric, used by :py:func:`spatial_analogs` with a single target.
+
+    Parameters
+    ----------
+    name : str
+        The name of the metric, as registered in `metrics`.
+
+    Returns
+    -------
+    callable
+        A decorator for functions comparing a target sample (n, d) to a batch of candidate samples (b, m, d) and
+        returning the metric for each candidate (b,).
+
+    Notes
+    -----
+    The wrapper accepts candidates with any number of leading dimensions and returns an array of the same leading
+    shape. As with `metric`, the result is NaN for candidates with missing values, and everywhere if the target has
+    any.
+    """
+
+    def _register(func: Callable) -> Callable:
+        @wraps(func)
+        def _batch_overhead(x, y, **kwargs):
+            # `apply_ufunc` may have added size-1 dimensions to the target
+            x = np.asarray(x, dtype=np.float64).reshape(x.shape[-2:])
+            batch = y.shape[:-2]
+            y = np.asarray(y, dtype=np.float64).reshape(-1, *y.shape[-2:])
+
+            out = np.full(y.shape[0], np.nan)
+            if not np.any(np.isnan(x)):
+                valid = ~np.isnan(y).any(axis=(1, 2))
+                if valid.any():
+                    out[valid] = func(x, y[valid], **kwargs)
+            return out.reshape(batch)
+
+        _batched_metrics[name] = _batch_overhead
+        return _batch_overhead
+
+    return _register
+
+
 # ---------------------------------------------------------------------------- #
 # ------------------------ Dissimilarity metrics ----------------------------- #
 # ---------------------------------------------------------------------------- #
@@ -304,19 +452,10 @@ def zech_aslan(x: np.ndarray, y: np.ndarray, *, dmin: float = 1e-12) -> float:
     ----------
     :cite:cts:`grenier_assessment_2013,zech_multivariate_2003,aslan_new_2003`
     """
-    nx, _ = x.shape
-    ny, _ = y.shape
-
-    v = (x.std(axis=0, ddof=1) * y.std(axis=0, ddof=1)).astype(np.double)
-
-    dx = spatial.distance.pdist(x, "seuclidean", V=v)
-    dy = spatial.distance.pdist(y, "seuclidean", V=v)
-    dxy = spatial.distance.cdist(x, y, "seuclidean", V=v)
-
-    phix = -np.log(dx.clip(dmin)).sum() / (nx * (nx - 1))
-    phiy = -np.log(dy.clip(dmin)).sum() / (ny * (ny - 1))
-    phixy = -np.log(dxy.clip(dmin)).sum() / (nx * ny)
-    return phix + phiy - phixy
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    w = 1 / (x.std(axis=0, ddof=1) * y.std(axis=0, ddof=1))
+    return _zech_aslan_value(x, y, w, dmin)
 
 
 @metric
@@ -367,22 +506,13 @@ def szekely_rizzo(x: np.ndarray, y: np.ndarray, *, standardize: bool = True) ->
     ----------
     :cite:cts:`grenier_assessment_2013,szekely_testing_2004,rizzo_energy_2016`
     """
-    n, _ = x.shape
-    m, _ = y.shape
-
-    # Mean of the distance pairs
-    # We are not taking "mean" because of the condensed output format of pdist
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
     if standardize:
-        v = (x.std(axis=0, ddof=1) * y.std(axis=0, ddof=1)).astype(np.double)
-        sXY = spatial.distance.cdist(x, y, "seuclidean", V=v).sum() / (n * m)
-        sXX = spatial.distance.pdist(x, "seuclidean", V=v).sum() * 2 / n**2
-        sYY = spatial.distance.pdist(y, "seuclidean", V=v).sum() * 2 / m**2
+        w = 1 / (x.std(axis=0, ddof=1) * y.std(axis=0, ddof=1))
     else:
-        sXY = spatial.distance.cdist(x, y, "euclidean").sum() / (n * m)
-        sXX = spatial.distance.pdist(x, "euclidean").sum() * 2 / n**2
-        sYY = spatial.distance.pdist(y, "euclidean").sum() * 2 / m**2
-    w = n * m / (n + m)
-    return w * (sXY + sXY - sXX - sYY)
+        w = np.ones(x.shape[1])
+    return _szekely_rizzo_value(x, y, w)
 
 
 @metric
@@ -617,6 +747,12 @@ def mahalanobis(x: np.ndarray, y: np.ndarray, *, VI: np.ndarray | None = None) -
     ----------
     :cite:cts:`Deza2016`
     """
+    VI = _inverse_covariance(x, VI)
+    return spatial.distance.mahalanobis(x.mean(axis=0), y.mean(axis=0), VI)
+
+
+def _inverse_covariance(x: np.ndarray, VI: np.ndarray | None = None) -> np.ndarray:
+    """Return the given inverse of the covariance matrix, or the (pseudo-)inverse of the covariance of `x`."""
     if not isinstance(VI, np.ndarray):
         if VI is not None:
             raise AttributeError("VI not a matrix")
@@ -625,4 +761,308 @@ def mahalanobis(x: np.ndarray, y: np.ndarray, *, VI: np.ndarray | None = None) -
             VI = np.linalg.inv(v)
         except np.linalg.LinAlgError:
             VI = np.linalg.pinv(v)
-    return spatial.distance.mahalanobis(x.mean(axis=0), y.mean(axis=0), VI)
+    return VI
+
+
+# ---------------------------------------------------------------------------- #
+# ------------------------- Batched metrics ---------------------------------- #
+# ---------------------------------------------------------------------------- #
+# These compare one target sample x (n, d) to candidate samples y (b, m, d). The target is standardized or indexed
+# once and the candidates are compared in compiled loops, instead of calling the metric once per candidate.
+
+
+@batched_metric("seuclidean")
+def _seuclidean_batch(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    mx = x.mean(axis=0)
+    vx = x.var(axis=0, ddof=1)
+    my = y.mean(axis=1)
+    return np.sqrt(((mx - my) ** 2 / vx).sum(axis=-1))
+
+
+@batched_metric("mahalanobis")
+def _mahalanobis_batch(x: np.ndarray, y: np.ndarray, *, VI: np.ndarray | None = None) -> np.ndarray:
+    VI = _inverse_covariance(x, VI)
+    delta = x.mean(axis=0) - y.mean(axis=1)
+    return np.sqrt(np.einsum("bi,ij,bj->b", delta, VI, delta))
+
+
+@njit(cache=True)
+def _column_std(y, k):  # pragma: no cover
+    """Standard deviation (ddof=1) of column k of y."""
+    n = y.shape[0]
+    m = 0.0
+    for i in range(n):
+        m += y[i, k]
+    m /= n
+    v = 0.0
+    for i in range(n):
+        v += (y[i, k] - m) ** 2
+    return np.sqrt(v / (n - 1))
+
+
+@njit(cache=True)
+def _sq_dist(a, i, b, j):  # pragma: no cover
+    """Squared euclidean distance between a[i] and b[j]."""
+    out = 0.0
+    for k in range(a.shape[1]):
+        out += (a[i, k] - b[j, k]) ** 2
+    return out
+
+
+@njit(nogil=True, cache=True)
+def _weighted_dist(a, i, b, j, w):  # pragma: no cover
+    """Euclidean distance between a[i] and b[j], the squared differences weighted by w."""
+    out = 0.0
+    for k in range(a.shape[1]):
+        out += (a[i, k] - b[j, k]) ** 2 * w[k]
+    return np.sqrt(out)
+
+
+@njit(nogil=True, cache=True)
+def _zech_aslan_value(x, y, w, dmin):  # pragma: no cover
+    """Zech-Aslan metric, the distances between points being summed as they are computed."""
+    nx = x.shape[0]
+    ny = y.shape[0]
+    phix = 0.0
+    for i in range(nx):
+        for j in range(i + 1, nx):
+            phix -= np.log(max(_weighted_dist(x, i, x, j, w), dmin))
+    phiy = 0.0
+    for i in range(ny):
+        for j in range(i + 1, ny):
+            phiy -= np.log(max(_weighted_dist(y, i, y, j, w), dmin))
+    phixy = 0.0
+    for i in range(nx):
+        for j in range(ny):
+            phixy -= np.log(max(_weighted_dist(x, i, y, j, w), dmin))
+    return phix / (nx * (nx - 1)) + phiy / (ny * (ny - 1)) - phixy / (nx * ny)
+
+
+@njit(nogil=True, cache=True)
+def _szekely_rizzo_value(x, y, w):  # pragma: no cover
+    """Székely-Rizzo metric, the distances between points being summed as they are computed."""
+    n = x.shape[0]
+    m = y.shape[0]
+    sxx = 0.0
+    for i in range(n):
+        for j in range(i + 1, n):
+            sxx += _weighted_dist(x, i, x, j, w)
+    syy = 0.0
+    for i in range(m):
+        for j in range(i + 1, m):
+            syy += _weighted_dist(y, i, y, j, w)
+    sxy = 0.0
+    for i in range(n):
+        for j in range(m):
+            sxy += _weighted_dist(x, i, y, j, w)
+    return n * m / (n + m) * (2 * sxy / (n * m) - 2 * sxx / n**2 - 2 * syy / m**2)
+
+
+@guvectorize(
+    [(float64[:, :], float64[:], float64[:, :], float64[:])],
+    "(n,d),(d),(m,d)->()",
+    nopython=True,
+    cache=True,
+)
+def _nearest_neighbor_kernel(x, sx, y, out):  # pragma: no cover
+    nx, d = x.shape
+    n = nx + y.shape[0]
+
+    # Standardize the pooled sample with the target's standard deviation computed beforehand
+    xy = np.empty((n, d))
+    for k in range(d):
+        s = np.sqrt(sx[k] * _column_std(y, k))
+        for i in range(nx):
+            xy[i, k] = x[i, k] / s
+        for i in range(y.shape[0]):
+            xy[nx + i, k] = y[i, k] / s
+
+    # Count the points whose nearest neighbour is from the same sample
+    same = 0
+    for i in range(n):
+        best = np.inf
+        jbest = 0
+        for j in range(n):
+            if j != i:
+                dist = _sq_dist(xy, i, xy, j)
+                if dist < best:
+                    best = dist
+                    jbest = j
+        if (i < nx) == (jbest < nx):
+            same += 1
+    out[0] = same / n
+
+
+@batched_metric("nearest_neighbor")
+def _nearest_neighbor_batch(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    return _nearest_neighbor_kernel(x, x.std(0, ddof=1), y)
+
+
+@guvectorize(
+    [(float64[:, :], float64[:, :], float64[:])],
+    "(n,d),(m,d)->()",
+    nopython=True,
+    cache=True,
+)
+def _friedman_rafsky_kernel(x, y, out):  # pragma: no cover
+    nx = x.shape[0]
+    n = nx + y.shape[0]
+    xy = np.empty((n, x.shape[1]))
+    xy[:nx] = x
+    xy[nx:] = y
+
+    # Prim's algorithm on the complete graph of the pooled sample
+    intree = np.zeros(n, dtype=np.bool_)
+    dist = np.full(n, np.inf)
+    parent = np.zeros(n, dtype=np.int64)
+    dist[0] = 0
+    diff = 0
+    for _ in range(n):
+        v = -1
+        for i in range(n):
+            if not intree[i] and (v == -1 or dist[i] < dist[v]):
+                v = i
+        intree[v] = True
+        # Edges of length 0 (identical points) are not counted, as in scipy's sparse graphs.
+        if v != 0 and dist[v] > 0 and (v < nx) != (parent[v] < nx):
+            diff += 1
+        for i in range(n):
+            if not intree[i]:
+                dvi = _sq_dist(xy, v, xy, i)
+                if dvi < dist[i]:
+                    dist[i] = dvi
+                    parent[i] = v
+    out[0] = 1.0 - (1.0 + diff) / n
+
+
+@batched_metric("friedman_rafsky")
+def _friedman_rafsky_batch(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    return _friedman_rafsky_kernel(x, y)
+
+
+@njit(cache=True)
+def _quadrant_counts(pivots, points):  # pragma: no cover
+    """Number of points in each quadrant (2**d) around each pivot, quadrants numbered as in `kolmogorov_smirnov`."""
+    npiv, d = pivots.shape
+    counts = np.zeros((2**d, npiv), dtype=np.int64)
+    for j in range(npiv):
+        for i in range(points.shape[0]):
+            q = 0
+            for k in range(d):
+                if pivots[j, k] <= points[i, k]:
+                    q += 2**k
+            counts[q, j] += 1
+    return counts
+
+
+@njit(cache=True)
+def _max_abs_diff(ca, na, cb, nb):  # pragma: no cover
+    out = 0.0
+    for q in range(ca.shape[0]):
+        for j in range(ca.shape[1]):
+            out = max(out, abs(ca[q, j] / na - cb[q, j] / nb))
+    return out
+
+
+@guvectorize(
+    [(float64[:, :], int64[:, :], float64[:, :], float64[:])],
+    "(n,d),(q,n),(m,d)->()",
+    nopython=True,
+    cache=True,
+)
+def _kolmogorov_smirnov_kernel(x, cxx, y, out):  # pragma: no cover
+    nx = x.shape[0]
+    ny = y.shape[0]
+    # Pivots from the target, the target's own counts are computed beforehand
+    dx = _max_abs_diff(cxx, nx, _quadrant_counts(x, y), ny)
+    # Pivots from the candidate
+    dy = _max_abs_diff(_quadrant_counts(y, y), ny, _quadrant_counts(y, x), nx)
+    out[0] = max(dx, dy)
+
+
+@batched_metric("kolmogorov_smirnov")
+def _kolmogorov_smirnov_batch(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    return _kolmogorov_smirnov_kernel(x, _quadrant_counts(x, x), y)
+
+
+@guvectorize(
+    [(float64[:, :], float64[:, :], int64, float64[:])],
+    "(n,d),(m,d),()->(n)",
+    nopython=True,
+    cache=True,
+)
+def _kth_neighbour_distance(x, y, k, out):  # pragma: no cover
+    # Keep the k smallest distances from each x[i] to the points of y, sorted
+    best = np.empty(k)
+    for i in range(x.shape[0]):
+        best[:] = np.inf
+        for j in range(y.shape[0]):
+            dist = _sq_dist(x, i, y, j)
+            if dist < best[k - 1]:
+                p = k - 1
+                while p > 0 and best[p - 1] > dist:
+                    best[p] = best[p - 1]
+                    p -= 1
+                best[p] = dist
+        out[i] = np.sqrt(best[k - 1])
+
+
+@batched_metric("kldiv")
+def _kldiv_batch(x: np.ndarray, y: np.ndarray, *, k: int = 1) -> np.ndarray:
+    nx, d = x.shape
+    ny = y.shape[1]
+
+    if d > 10:
+        raise ValueError(f"Too many dimensions: {d}.")
+
+    if nx < 5 or ny < 5:
+        return np.full(y.shape[0], np.nan)
+
+    # Distances to the kth neighbour within the target, excluding the point itself, are computed once.
+    r, _ = KDTree(x).query(x, k=k + 1, eps=0, p=2, workers=2)
+    s = _kth_neighbour_distance(x, y, k)
+    return -np.log(r[:, k] / s).sum(axis=-1) * d / nx + np.log(ny / (nx - 1.0))
+
+
+def _in_threads(kernel: Callable, x: np.ndarray, sx: np.ndarray, y: np.ndarray, *args, n_workers: int | None = 1):
+    """Apply a kernel releasing the GIL on the candidates y (b, m, d), split between `n_workers` threads."""
+    if n_workers == 1 or y.shape[0] < 2:
+        return kernel(x, sx, y, *args)
+    parts = np.array_split(y, min(n_workers or os.cpu_count() or 1, y.shape[0]))
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        return np.concatenate(list(executor.map(lambda part: kernel(x, sx, part, *args), parts)))
+
+
+@njit(nogil=True, cache=True)
+def _zech_aslan_kernel(x, sx, y, dmin):  # pragma: no cover
+    out = np.empty(y.shape[0])
+    w = np.empty(x.shape[1])
+    for b in range(y.shape[0]):
+        for k in range(x.shape[1]):
+            w[k] = 1 / (sx[k] * _column_std(y[b], k))
+        out[b] = _zech_aslan_value(x, y[b], w, dmin)
+    return out
+
+
+@batched_metric("zech_aslan")
+def _zech_aslan_batch(x: np.ndarray, y: np.ndarray, *, dmin: float = 1e-12, n_workers: int | None = 1) -> np.ndarray:
+    return _in_threads(_zech_aslan_kernel, x, x.std(0, ddof=1), y, dmin, n_workers=n_workers)
+
+
+@njit(nogil=True, cache=True)
+def _szekely_rizzo_kernel(x, sx, y, standardize):  # pragma: no cover
+    out = np.empty(y.shape[0])
+    w = np.ones(x.shape[1])
+    for b in range(y.shape[0]):
+        if standardize:
+            for k in range(x.shape[1]):
+                w[k] = 1 / (sx[k] * _column_std(y[b], k))
+        out[b] = _szekely_rizzo_value(x, y[b], w)
+    return out
+
+
+@batched_metric("szekely_rizzo")
+def _szekely_rizzo_batch(
+    x: np.ndarray, y: np.ndarray, *, standardize: bool = True, n_workers: int | None = 1
+) -> np.ndarray:
+    return _in_threads(_szekely_rizzo_kernel, x, x.std(0, ddof=1), y, standardize, n_workers=n_workers)
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import datetime as pydt
 import warnings
+import weakref
 from collections.abc import Sequence
 from typing import Any, Literal, TypeVar
 
@@ -16,12 +17,14 @@ import cftime
 import numpy as np
 import pandas as pd
 import xarray as xr
+from dask import array as dsk
+from numba import boolean, float64, guvectorize, int64, vectorize
 from packaging.version import Version
 from xarray import CFTimeIndex
 
 from xclim.core._types import DayOfYearStr
 from xclim.core.formatting import update_xclim_history
-from xclim.core.utils import uses_dask
+from xclim.core.utils import _chunk_like, uses_dask
 
 XR2409 = Version(xr.__version__) >= Version("2024.09")
 
@@ -92,6 +95,97 @@ uniform_calendars = ("noleap", "all_leap", "365_day", "366_day", "360_day")
 # Type hint for xarray DataArray and Dataset
 DataType = TypeVar("DataType", xr.DataArray, xr.Dataset)
 
+# Time components and inferred frequencies of time indexes, keyed by the id of the index.
+# Indexes are immutable, entries are removed when the index is garbage collected.
+_TIME_INDEX_CACHE: dict[int, dict[str, Any]] = {}
+
+# Cumulative number of days at the start of each month, for years of 365 and 366 days.
+_CUMULATIVE_DAYS = {
+    365: np.cumsum([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]),
+    366: np.cumsum([0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]),
+}
+
+
+def _get_index_cache(time: xr.DataArray) -> dict[str, Any] | None:
+    """Get the cache of the index of a time coordinate, None if `time` is not an indexed coordinate."""
+    if time.dims != (time.name,) or time.name not in time.indexes:
+        return None
+    index = time.indexes[time.name]
+    key = id(index)
+    if key not in _TIME_INDEX_CACHE:
+        try:
+            weakref.finalize(index, _TIME_INDEX_CACHE.pop, key, None)
+        except TypeError:
+            return None
+        _TIME_INDEX_CACHE[key] = {}
+    return _TIME_INDEX_CACHE[key]
+
+
+def _cftime_fields(dates: np.ndarray, calendar: str) -> dict[str, np.ndarray]:
+    """
+    Compute the year, month, day and day of year of an array of cftime dates.
+
+    Instead of getting the attributes of each date, the dates are converted to numbers of days with
+    :py:func:`cftime.date2num` and the fields are computed from the calendar arithmetic.
+    """
+    if calendar in ["proleptic_gregorian", "standard", "gregorian"]:
+        days = np.floor(cftime.date2num(dates, "days since 1970-01-01", calendar=calendar)).astype("int64")
+        # Numpy's datetime64 follows the proleptic gregorian calendar, as does "standard" after 1582-10-15.
+        if calendar == "proleptic_gregorian" or days.min() >= -141427:
+            days = days.astype("datetime64[D]")
+            return {
+                "year": days.astype("datetime64[Y]").astype("int64") + 1970,
+                "month": days.astype("datetime64[M]").astype("int64") % 12 + 1,
+                "day": (days - days.astype("datetime64[M]")).astype("int64") + 1,
+                "dayofyear": (days - days.astype("datetime64[Y]")).astype("int64") + 1,
+            }
+    elif calendar in uniform_calendars:
+        ndays = max_doy[calendar]
+        days = np.floor(cftime.date2num(dates, "days since 0001-01-01", calendar=calendar)).astype("int64")
+        doy = days % ndays + 1
+        if ndays == 360:
+            month = (doy - 1) // 30 + 1
+            day = (doy - 1) % 30 + 1
+        else:
+            month = np.searchsorted(_CUMULATIVE_DAYS[ndays], doy, side="left")
+            day = doy - _CUMULATIVE_DAYS[ndays][month - 1]
+        return {"year": days // ndays + 1, "month": month, "day": day, "dayofyear": doy}
+    # Julian calendar and "standard" dates before the gregorian reform
+    fields = np.array([(d.year, d.month, d.day, d.dayofyr) for d in dates], dtype="int64").reshape(-1, 4)
+    return dict(zip(["year", "month", "day", "dayofyear"], fields.T, strict=True))
+
+
+def _time_field(time: xr.DataArray, field: Literal["year", "month", "day", "dayofyear"]) -> xr.DataArray:
+    """
+    Get a time component of a time coordinate, like ``time.dt.<field>``.
+
+    For cftime axes, the components are computed once for all dates with :py:func:`_cftime_fields`
+    and cached with the index of the coordinate, so they can be reused by the next calls on the same axis.
+    The cached arrays are read-only.
+    """
+    if time.dtype != "O":
+        return getattr(time.dt, field)
+    cache = _get_index_cache(time)
+    if cache is None:
+        return getattr(time.dt, field)
+    if "fields" not in cache:
+        fields = _cftime_fields(time.values, get_calendar(time))
+        # The arrays are shared by all the following calls, they must not be modified in place.
+        for arr in fields.values():
+            arr.setflags(write=False)
+        cache["fields"] = fields
+    return xr.DataArray(cache["fields"][field], dims=time.dims, coords=time.coords, name=field)
+
+
+def _infer_freq(time: xr.DataArray) -> str | None:
+    """Infer the frequency of a time coordinate with :py:func:`xarray.infer_freq`, cached with its index."""
+    cache = _get_index_cache(time)
+    if cache is None:
+        return xr.infer_freq(time)
+    if "freq" not in cache:
+        cache["freq"] = xr.infer_freq(time)
+    return cache["freq"]
+
 
 def doy_from_string(doy: DayOfYearStr, year: int, calendar: str) -> int:
     """
@@ -229,20 +323,95 @@ def _convert_doy_date(doy: int, year: int, src, tgt):
     return float(same_date.dayofyr) + fracpart
 
 
-# Copied from xarray.coding.calendar_ops
 def _is_leap_year(years, calendar):
+    """Whether the years are leap years in the given calendar."""
+    years = np.asarray(years)
+    if calendar in ["noleap", "365_day", "360_day"]:
+        return np.zeros(years.shape, dtype=bool)
+    if calendar in ["all_leap", "366_day"]:
+        return np.ones(years.shape, dtype=bool)
+    # The arithmetic rules are only valid for positive years, cftime handles the rest.
+    if calendar in ["standard", "gregorian", "proleptic_gregorian", "julian"] and (years.size == 0 or years.min() > 0):
+        leap = years % 4 == 0
+        if calendar == "proleptic_gregorian":
+            leap &= (years % 100 != 0) | (years % 400 == 0)
+        elif calendar != "julian":
+            # The "standard" calendar follows the julian rules before the gregorian reform of 1582.
+            leap &= (years % 100 != 0) | (years % 400 == 0) | (years < 1583)
+        return leap
     func = np.vectorize(cftime.is_leap_year)
     return func(years, calendar=calendar)
 
 
-# Copied from xarray.coding.calendar_ops
 def _days_in_year(years, calendar):
     """The number of days in the year according to given calendar."""
     if calendar == "360_day":
-        return xr.full_like(years, 360)
+        return np.full(np.shape(years), 360)
     return _is_leap_year(years, calendar).astype(int) + 365
 
 
+def _month_day_from_doy(doy: np.ndarray, years: np.ndarray, calendar: str) -> tuple[np.ndarray, np.ndarray]:
+    """Month and day of integer days of year, in the given years and calendar."""
+    if calendar == "360_day":
+        return (doy - 1) // 30 + 1, (doy - 1) % 30 + 1
+    leap = _is_leap_year(years, calendar)
+    month = np.where(
+        leap,
+        np.searchsorted(_CUMULATIVE_DAYS[366], doy, side="left"),
+        np.searchsorted(_CUMULATIVE_DAYS[365], doy, side="left"),
+    )
+    day = doy - np.where(leap, _CUMULATIVE_DAYS[366][month - 1], _CUMULATIVE_DAYS[365][month - 1])
+    return month, day
+
+
+def _doy_from_month_day(month: np.ndarray, day: np.ndarray, years: np.ndarray, calendar: str) -> np.ndarray:
+    """Day of year of dates given by their year, month and day in the given calendar, NaN for non-existent dates."""
+    if calendar == "360_day":
+        return np.where(day <= 30, (month - 1) * 30 + day, np.nan)
+    leap = _is_leap_year(years, calendar)
+    start = np.where(leap, _CUMULATIVE_DAYS[366][month - 1], _CUMULATIVE_DAYS[365][month - 1])
+    end = np.where(leap, _CUMULATIVE_DAYS[366][month], _CUMULATIVE_DAYS[365][month])
+    return np.where(start + day <= end, start + day, np.nan)
+
+
+def _convert_doy_date_array(doy: np.ndarray, years: np.ndarray, source_cal: str, target_cal: str) -> np.ndarray:
+    """
+    Convert days of year between calendars, aligning on the dates.
+
+    Array version of :py:func:`_convert_doy_date`, the dates are computed with the calendar arithmetic
+    instead of creating a datetime object for each element. The years around and before the gregorian
+    reform in the "standard" calendar are still converted element by element.
+    """
+    doy, years = np.broadcast_arrays(np.asarray(doy, dtype=float), np.asarray(years))
+    out = np.full(doy.shape, np.nan)
+    valid = np.isfinite(doy) & (doy >= 1)
+    reform = {"standard", "gregorian"}.intersection({source_cal, target_cal})
+    elementwise = valid & ((years < 1584) if reform else (years < 1))
+    valid &= ~elementwise
+
+    if valid.any():
+        day_src = np.floor(doy[valid])
+        fracpart = doy[valid] - day_src
+        day_src = day_src.astype("int64")
+        year = years[valid].astype("int64")
+        # Days of year larger than the length of the year refer to the start of the next year.
+        ndays = _days_in_year(year, source_cal)
+        over = day_src > ndays
+        year = year + over
+        day_src = day_src - ndays * over
+
+        month, day = _month_day_from_doy(day_src, year, source_cal)
+        out[valid] = _doy_from_month_day(month, day, year, target_cal) + fracpart
+
+    if elementwise.any():
+        src = datetime_classes[source_cal]
+        tgt = datetime_classes[target_cal]
+        out[elementwise] = [
+            _convert_doy_date(d, int(y), src, tgt) for d, y in zip(doy[elementwise], years[elementwise], strict=True)
+        ]
+    return out
+
+
 def convert_doy(
     source: xr.DataArray | xr.Dataset,
     target_cal: str,
@@ -295,12 +464,12 @@ def convert_doy(
         )
 
     source_cal = source_cal or source.attrs.get("calendar", get_calendar(source[dim]))
-    is_calyear = xr.infer_freq(source[dim]) in ("YS-JAN", "Y-DEC", "YE-DEC")
+    is_calyear = _infer_freq(source[dim]) in ("YS-JAN", "Y-DEC", "YE-DEC")
 
     if is_calyear:  # Fast path
-        year_of_the_doy = source[dim].dt.year
+        year_of_the_doy = _time_field(source[dim], "year")
     else:  # Doy might refer to a date from the year after the timestamp.
-        year_of_the_doy = source[dim].dt.year + 1 * (source < source[dim].dt.dayofyear)
+        year_of_the_doy = _time_field(source[dim], "year") + 1 * (source < _time_field(source[dim], "dayofyear"))
 
     if align_on == "year":
         if source_cal in ["noleap", "all_leap", "360_day"]:
@@ -309,7 +478,6 @@ def convert_doy(
             max_doy_src = xr.apply_ufunc(
                 _days_in_year,
                 year_of_the_doy,
-                vectorize=True,
                 dask="parallelized",
                 kwargs={"calendar": source_cal},
             )
@@ -319,22 +487,18 @@ def convert_doy(
             max_doy_tgt = xr.apply_ufunc(
                 _days_in_year,
                 year_of_the_doy,
-                vectorize=True,
                 dask="parallelized",
                 kwargs={"calendar": target_cal},
             )
         new_doy = source.copy(data=source * max_doy_tgt / max_doy_src)
     elif align_on == "date":
         new_doy = xr.apply_ufunc(
-            _convert_doy_date,
+            _convert_doy_date_array,
             source,
             year_of_the_doy,
-            vectorize=True,
             dask="parallelized",
-            kwargs={
-                "src": datetime_classes[source_cal],
-                "tgt": datetime_classes[target_cal],
-            },
+            output_dtypes=[float],
+            kwargs={"source_cal": source_cal, "target_cal": target_cal},
         )
     else:
         raise NotImplementedError('"align_on" must be one of "date" or "year".')
@@ -424,14 +588,14 @@ def percentile_doy(
 
     # Ensure arr sampling frequency is daily or coarser
     # but cowardly escape the non-inferrable case.
-    if compare_offsets(xr.infer_freq(arr.time) or "D", "<", "D"):
+    if compare_offsets(_infer_freq(arr.time) or "D", "<", "D"):
         raise ValueError("input data should have daily or coarser frequency")
 
     rr = arr.rolling(min_periods=1, center=True, time=window).construct("window")
 
     crd = xr.Coordinates.from_pandas_multiindex(
         pd.MultiIndex.from_arrays(
-            (rr.time.dt.year.values, rr.time.dt.dayofyear.values),
+            (_time_field(rr.time, "year").values, _time_field(rr.time, "dayofyear").values),
             names=("year", "dayofyear"),
         ),
         "time",
@@ -703,9 +867,25 @@ def _interpolate_doy_calendar(source: xr.DataArray, doy_max: int, doy_min: int =
     filled_na = da.interpolate_na(dim="dayofyear")
 
     # Interpolate to target dayofyear range
-    filled_na.coords["dayofyear"] = np.linspace(start=doy_min, stop=doy_max, num=len(filled_na.coords["dayofyear"]))
-
-    return filled_na.interp(dayofyear=range(doy_min, doy_max + 1))
+    nsrc = filled_na.dayofyear.size
+    if nsrc < 2:
+        filled_na.coords["dayofyear"] = np.linspace(start=doy_min, stop=doy_max, num=nsrc)
+        return filled_na.interp(dayofyear=range(doy_min, doy_max + 1))
+
+    # Linear interpolation as a weighted sum of the two neighbouring source days, this only needs
+    # two integer selections instead of a call to `interp` on the whole array.
+    src_doy = np.linspace(start=doy_min, stop=doy_max, num=nsrc)
+    tgt_doy = np.arange(doy_min, doy_max + 1)
+    left = np.clip(np.searchsorted(src_doy, tgt_doy, side="right") - 1, 0, nsrc - 2)
+    weight = xr.DataArray((tgt_doy - src_doy[left]) / (src_doy[left + 1] - src_doy[left]), dims=("dayofyear",))
+    lower = filled_na.isel(dayofyear=left).drop_vars("dayofyear")
+    upper = filled_na.isel(dayofyear=left + 1).drop_vars("dayofyear")
+    with xr.set_options(keep_attrs=True):
+        out = lower + (upper - lower) * weight
+    if uses_dask(out):
+        # The integer selections split the chunks, keep a single one along `dayofyear` as `interp` does.
+        out = out.chunk({"dayofyear": -1})
+    return out.assign_coords(dayofyear=tgt_doy).rename(filled_na.name)
 
 
 def adjust_doy_calendar(source: xr.DataArray, target: xr.DataArray | xr.Dataset) -> xr.DataArray:
@@ -726,8 +906,8 @@ def adjust_doy_calendar(source: xr.DataArray, target: xr.DataArray | xr.Dataset)
     xr.DataArray
         Interpolated source array over coordinates spanning the target `dayofyear` range.
     """
-    max_target_doy = int(target.time.dt.dayofyear.max())
-    min_target_doy = int(target.time.dt.dayofyear.min())
+    max_target_doy = int(_time_field(target.time, "dayofyear").max())
+    min_target_doy = int(_time_field(target.time, "dayofyear").min())
 
     def has_same_calendar(_source, _target):  # numpydoc ignore=GL08
         # case of full year (doys between 1 and 360|365|366)
@@ -766,7 +946,7 @@ def resample_doy(doy: xr.DataArray, arr: xr.DataArray | xr.Dataset) -> xr.DataAr
     # Adjust calendar
     adoy = adjust_doy_calendar(doy, arr)
 
-    out = adoy.rename(dayofyear="time").reindex(time=arr.time.dt.dayofyear)
+    out = adoy.rename(dayofyear="time").reindex(time=_time_field(arr.time, "dayofyear"))
     out["time"] = arr.time
 
     return out
@@ -960,11 +1140,11 @@ def _doy_days_since_doys(
         Number of days (maximum doy) for the year of each value in base.
     """
     calendar = get_calendar(base)
-    base_doy = base.dt.dayofyear
+    base_doy = _time_field(base, "dayofyear")
+    base_year = _time_field(base, "year")
     doy_max = xr.apply_ufunc(
         _days_in_year,
-        base.dt.year,
-        vectorize=True,
+        base_year,
         kwargs={"calendar": calendar},
     )
 
@@ -972,7 +1152,7 @@ def _doy_days_since_doys(
         mm, dd = map(int, start.split("-"))
         starts = xr.apply_ufunc(
             lambda y: datetime_classes[calendar](y, mm, dd),
-            base.dt.year,
+            base_year,
             vectorize=True,
         )
         start_doy = starts.dt.dayofyear
@@ -1147,6 +1327,33 @@ def _get_doys(start: int, end: int, inclusive: tuple[bool, bool]):
     return doys
 
 
+@vectorize([boolean(float64, float64, int64)], nopython=True, cache=True)
+def _doy_in_bounds(start, end, doy):  # pragma: no cover
+    """Whether a day of year is within bounds, which cross the new year if `start > end`. NaN bounds are open."""
+    if np.isnan(start):
+        start = 1
+    if np.isnan(end):
+        end = 366
+    if start <= end:
+        return start <= doy <= end
+    return not (end < doy < start)
+
+
+@guvectorize(
+    [(int64, int64, float64[:], float64[:], boolean[:])],
+    "(),(),(m),(m)->()",
+    nopython=True,
+    cache=True,
+)
+def _days_since_in_bounds(days, period, start, end, out):  # pragma: no cover
+    """
+    Whether the days since the start of their period are within the bounds of this period.
+
+    `period` is the index of the period of the day in the bounds, -1 if the period has no bounds.
+    """
+    out[0] = period >= 0 and days >= 0 and start[period] <= days <= end[period]
+
+
 def mask_between_doys(
     da: xr.DataArray,
     doy_bounds: tuple[int | xr.DataArray, int | xr.DataArray],
@@ -1179,7 +1386,7 @@ def mask_between_doys(
         True value inside the period of interest and False outside.
     """
     if isinstance(doy_bounds[0], int) and isinstance(doy_bounds[1], int):  # Simple case
-        mask = da.time.dt.dayofyear.isin(_get_doys(*doy_bounds, include_bounds))
+        mask = _time_field(da.time, "dayofyear").isin(_get_doys(*doy_bounds, include_bounds))
     else:
         start, end = doy_bounds
         # convert ints to DataArrays
@@ -1197,7 +1404,7 @@ def mask_between_doys(
             end -= 1
 
         if "time" in start.dims:
-            freq = xr.infer_freq(start.time)
+            freq = _infer_freq(start.time)
             # Convert the doy bounds to a duration since the beginning of each period defined
             # in the bound's time coordinate.
             # Also ensures the bounds share the same time calendar as the input.
@@ -1206,40 +1413,57 @@ def mask_between_doys(
             start = doy_to_days_since(start.convert_calendar(**calkws)).fillna(0)
             end = doy_to_days_since(end.convert_calendar(**calkws)).fillna(366)
 
-            out = []
-            # For each period, mask the days since between start and end
-            for base_time, indexes in da.resample(time=freq).groups.items():
-                group = da.isel(time=indexes)
-
-                if base_time in start.time:
-                    start_d = start.sel(time=base_time)
-                    end_d = end.sel(time=base_time)
-
-                    # select days between start and end for group
-                    days = (group.time - base_time).dt.days
-                    days = days.where(days >= 0)
-                    mask = (days >= start_d) & (days <= end_d)
-                else:  # This group has no defined bounds : put False in the mask
-                    # Array with the same shape as the "mask" in the other case : broadcast of time and bounds dims
-                    template = xr.broadcast(group.time.dt.day, start.isel(time=0, drop=True))[0]
-                    mask = xr.full_like(template, False, dtype="bool")
-                out.append(mask)
-            mask = xr.concat(out, dim="time")
+            # For each time step, the number of days since the start of its period and the index of this period
+            # in the bounds (-1 if the period has no bounds). These are 1D, the bounds are never broadcast on time.
+            groups = da.resample(time=freq).groups
+            period = np.full(da.time.size, -1, dtype="int64")
+            days = np.zeros(da.time.size, dtype="int64")
+            for (base_time, indexes), i in zip(
+                groups.items(), start.indexes["time"].get_indexer(list(groups.keys())), strict=True
+            ):
+                period[indexes] = i
+                days[indexes] = (da.time[indexes] - base_time).dt.days.values
+            days = xr.DataArray(days, dims=("time",), coords={"time": da.time})
+            period = xr.DataArray(period, dims=("time",), coords={"time": da.time})
+            days, period = _chunk_like(days, period, chunks=_time_chunks(da))
+
+            # Mask the days since between start and end of their period. The bounds are a core dimension of the kernel.
+            start, end = (bnd.astype(float).rename(time="_bounds_time") for bnd in (start, end))
+            if uses_dask(start, end):
+                start, end = start.chunk(_bounds_time=-1), end.chunk(_bounds_time=-1)
+            mask = xr.apply_ufunc(
+                _days_since_in_bounds,
+                days,
+                period,
+                start,
+                end,
+                input_core_dims=[[], [], ["_bounds_time"], ["_bounds_time"]],
+                dask="parallelized",
+                output_dtypes=[bool],
+            ).transpose("time", ...)
         else:  # Only "Spatial" dims, we can't constrain as in days since, so there are two cases
-            doys = da.time.dt.dayofyear  # for readability
-            # Any missing value is replaced with the min/max of possible values
-            start = start.fillna(1)
-            end = end.fillna(366)
-            mask = xr.where(
-                start <= end,
-                # case 1 : start <= end, ROI is within a calendar year
-                (doys >= start) & (doys <= end),
-                # case 2 : start >  end, ROI crosses the new year
-                ~((doys > end) & (doys < start)),
+            (doys,) = _chunk_like(_time_field(da.time, "dayofyear"), chunks=_time_chunks(da))
+            # Missing values are replaced with the min/max of possible values.
+            # If start <= end, the ROI is within a calendar year, otherwise it crosses the new year.
+            mask = xr.apply_ufunc(
+                _doy_in_bounds,
+                start.astype(float),
+                end.astype(float),
+                doys,
+                dask="parallelized",
+                output_dtypes=[bool],
             )
     return mask
 
 
+def _time_chunks(da: xr.DataArray | xr.Dataset) -> dict[str, Any] | None:
+    """Chunks of `da` along time, to compute a mask on the time coordinate lazily. None if `da` doesn't use dask."""
+    if not uses_dask(da):
+        return None
+    chunks = da.chunksizes if isinstance(da, xr.DataArray) else da.chunks
+    return {"time": chunks["time"]} if "time" in chunks else None
+
+
 def select_time(
     da: xr.DataArray | xr.Dataset,
     drop: bool = False,
@@ -1318,12 +1542,15 @@ def select_time(
     if season is not None:
         if isinstance(season, str):
             season = [season]
-        mask = da.time.dt.season.isin(season)
+        # Same as `da.time.dt.season`, but from the cached months
+        months = _time_field(da.time, "month")
+        seasons = np.array(["DJF", "DJF", "MAM", "MAM", "MAM", "JJA", "JJA", "JJA", "SON", "SON", "SON", "DJF"])
+        mask = months.copy(data=seasons[months.values - 1]).isin(season)
 
     elif month is not None:
         if isinstance(month, int):
             month = [month]
-        mask = da.time.dt.month.isin(month)
+        mask = _time_field(da.time, "month").isin(month)
 
     elif doy_bounds is not None:
         if not (isinstance(doy_bounds[0], int) and isinstance(doy_bounds[1], int)) and drop:
@@ -1350,7 +1577,7 @@ def select_time(
             cftime.datetime.strptime(f"2000-{end}", "%Y-%m-%d", calendar=calendar).dayofyr,
             include_bounds,
         )
-        mask = time.time.dt.dayofyear.isin(doys)
+        mask = _time_field(time.time, "dayofyear").isin(doys)
         # Needed if we converted calendar, this puts back the correct coord
         mask["time"] = da.time
 
@@ -1377,6 +1604,41 @@ def _month_is_first_period_month(time, freq):
     return frq.is_on_offset(frq_monthly.rollback(time))
 
 
+def _stack_windows(
+    da: xr.Dataset | xr.DataArray, first: int, step: int, nperiods: int, length: int, dim: str
+) -> xr.Dataset | xr.DataArray:
+    """
+    Stack equally spaced windows of the same length along a new dimension, without copying the data.
+
+    The windows of the variables along `time` are read-only strided views of their data, made with
+    :py:func:`numpy.lib.stride_tricks.sliding_window_view`. Dask arrays are sliced window by window instead,
+    which keeps the chunks of the other dimensions and a graph with one selection per window and chunk.
+    Variables without the `time` dimension are broadcast along `dim` (data variables) or left as is (coordinates),
+    as with :py:func:`xarray.concat`. The `time` coordinate is dropped.
+    """
+
+    def _stack(var: xr.Variable, broadcast: bool) -> xr.Variable:
+        if "time" not in var.dims:
+            return var.set_dims({dim: nperiods, **var.sizes}) if broadcast else var
+        axis = var.get_axis_num("time")
+        if isinstance(var.data, dsk.Array):
+            starts = range(first, first + step * nperiods, step)
+            windows = dsk.stack([var.data[(slice(None),) * axis + (slice(start, start + length),)] for start in starts])
+            return xr.Variable((dim, *var.dims), windows, var.attrs)
+        windows = np.lib.stride_tricks.sliding_window_view(var.data, length, axis=axis)
+        # The time axis now indexes the start of the windows, and the window axis is the last one
+        windows = windows[(slice(None),) * axis + (slice(first, first + step * (nperiods - 1) + 1, step),)]
+        windows = windows.transpose(axis, *(var.ndim if i == axis else i for i in range(var.ndim)))
+        return xr.Variable((dim, *var.dims), windows, var.attrs)
+
+    coords = {name: _stack(crd.variable, False) for name, crd in da.coords.items() if name != "time"}
+    if isinstance(da, xr.DataArray):
+        return xr.DataArray(_stack(da.variable, True), coords=coords, name=da.name)
+    return xr.Dataset(
+        {name: _stack(var.variable, True) for name, var in da.data_vars.items()}, coords=coords, attrs=da.attrs
+    )
+
+
 def stack_periods(
     da: xr.Dataset | xr.DataArray,
     window: int = 30,
@@ -1447,6 +1709,9 @@ def stack_periods(
         it might make sense. But for unequal periods or non-uniform calendars, it will certainly not.
         If ``stride`` is a divisor of ``window``, the correct timeseries can be reconstructed with
         :py:func:`unstack_periods`. The coordinate of `period` is the first timestep of each window.
+        When all periods have the same length and are equally spaced, the data of the output is a read-only
+        view of the data of `da` and no copy is made. Call ``.copy()`` on the output before modifying it in place.
+        Dask arrays are sliced lazily, period by period.
     """
     # Import in function to avoid cyclical imports
     from xclim.core.units import (  # pylint: disable=import-outside-toplevel
@@ -1459,7 +1724,7 @@ def stack_periods(
     if stride > window:
         raise ValueError(f"Stride must be less than or equal to window. Got {stride} > {window}.")
 
-    srcfreq = xr.infer_freq(da.time)
+    srcfreq = _infer_freq(da.time)
     cal = da.time.dt.calendar
     use_cftime = da.time.dtype == "O"
 
@@ -1563,14 +1828,23 @@ def stack_periods(
     )
     # The "fake" axis that all periods share
     fake_time = xr.date_range(start, periods=longest, freq=srcfreq, calendar=cal, use_cftime=use_cftime)
-    # Slice and concat along new dim. We drop the index and add a new one so that xarray can concat them together.
-    kwargs = {"fill_value": pad_value} if pad_value != "<NA>" else {}
-    out = xr.concat(
-        [da.isel(time=slc).drop_vars("time").assign_coords(time=np.arange(slc.stop - slc.start)) for slc in periods],
-        dim,
-        join="outer",
-        **kwargs,
-    )
+    steps = np.unique(np.diff([slc.start for slc in periods]))
+    if not starts.attrs["unequal_lengths"] and steps.size <= 1:
+        # Periods of equal lengths, equally spaced: the stacked array is a view of the data
+        step = int(steps[0]) if steps.size else 1
+        out = _stack_windows(da, periods[0].start, step, len(periods), longest, dim)
+    else:
+        # Slice and concat along new dim. We drop the index and add a new one so that xarray can concat them together.
+        kwargs = {"fill_value": pad_value} if pad_value != "<NA>" else {}
+        out = xr.concat(
+            [
+                da.isel(time=slc).drop_vars("time").assign_coords(time=np.arange(slc.stop - slc.start))
+                for slc in periods
+            ],
+            dim,
+            join="outer",
+            **kwargs,
+        )
     out = out.assign_coords(
         time=(("time",), fake_time, da.time.attrs.copy()),
         **{f"{dim}_length": lengths, dim: starts},
@@ -1633,7 +1907,7 @@ def unstack_periods(da: xr.DataArray | xr.Dataset, dim: str = "period") -> xr.Da
             f"`unstack_periods` can't find the window, stride and freq attributes on the {dim} coordinates."
         ) from err
 
-    src_freq = xr.infer_freq(da.time)
+    src_freq = _infer_freq(da.time)
     # Ok freqs are < D and uniform-calendar >= Y.
     if not (
         compare_offsets(src_freq, "<", "MS")
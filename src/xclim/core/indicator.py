@@ -164,6 +164,7 @@ from xclim.core.options import (
 from xclim.core.units import check_units, convert_units_to, declare_units, units
 from xclim.core.utils import (
     InputKind,
+    cast_to_preserved_dtype,
     infer_kind_from_parameter,
     is_percentile_dataarray,
     load_module,
@@ -917,6 +918,8 @@ class Indicator(IndicatorRegistrar):
         outs = [convert_units_to(out, attrs, self.context) for out, attrs in zip(outs, out_attrs, strict=False)]
 
         outs = self._postprocess(outs, das, params)
+        # Masking missing values promotes integer outputs, and some computations upcast float32 inputs
+        outs = [cast_to_preserved_dtype(out, *das.values()) for out in outs]
 
         # Update variable attributes
         for out, attrs in zip(outs, out_attrs, strict=False):
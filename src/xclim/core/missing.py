@@ -31,6 +31,7 @@ import numpy as np
 import xarray as xr
 
 from xclim.core.calendar import (
+    _infer_freq,
     compare_offsets,
     is_offset_divisor,
     parse_offset,
@@ -95,7 +96,7 @@ def expected_count(
         Integer array at the resampling frequency with the number of expected elements in each period.
     """
     if src_timestep is None:
-        src_timestep = xr.infer_freq(time)
+        src_timestep = _infer_freq(time)
         if src_timestep is None:
             raise ValueError("A src_timestep must be passed when it can't be inferred from the data.")
 
@@ -281,7 +282,7 @@ class MissingBase:
             True on the periods that should be considered missing or invalid.
         """
         if src_timestep is None:
-            src_timestep = xr.infer_freq(da.time)
+            src_timestep = _infer_freq(da.time)
             if src_timestep is None:
                 raise ValueError(
                     "The source timestep can't be inferred from the data, but it is required"
@@ -24,6 +24,8 @@ MISSING_OPTIONS = "missing_options"
 RUN_LENGTH_UFUNC = "run_length_ufunc"
 AS_DATASET = "as_dataset"
 MAP_BLOCKS = "resample_map_blocks"
+SOLAR_GEOMETRY_CACHE = "solar_geometry_cache"
+PRESERVE_DTYPE = "preserve_dtype"
 
 MISSING_METHODS: dict[str, Callable] = {}
 
@@ -36,6 +38,8 @@ OPTIONS = {
     RUN_LENGTH_UFUNC: "auto",
     AS_DATASET: False,
     MAP_BLOCKS: False,
+    SOLAR_GEOMETRY_CACHE: 0,
+    PRESERVE_DTYPE: False,
 }
 
 _LOUDNESS_OPTIONS = frozenset(["log", "warn", "raise"])
@@ -64,6 +68,8 @@ _VALIDATORS = {
     RUN_LENGTH_UFUNC: _RUN_LENGTH_UFUNC_OPTIONS.__contains__,
     AS_DATASET: lambda opt: isinstance(opt, bool),
     MAP_BLOCKS: lambda opt: isinstance(opt, bool),
+    SOLAR_GEOMETRY_CACHE: lambda opt: isinstance(opt, int) and not isinstance(opt, bool) and opt >= 0,
+    PRESERVE_DTYPE: lambda opt: isinstance(opt, bool),
 }
 
 
@@ -222,6 +228,18 @@ class set_options:  # numpydoc ignore=PR01,PR02
         If True, some indicators will wrap their resampling operations with `xr.map_blocks`,
         using :py:func:`xclim.indices.helpers.resample_map`.
         This requires `flox` to be installed in order to ensure the chunking is appropriate.
+    solar_geometry_cache : int
+        Maximum number of solar geometry fields (solar declination, eccentricity correction factor, cosine of the
+        solar zenith angle, extraterrestrial solar radiation and day lengths) kept in memory by
+        :py:mod:`xclim.indices.helpers`. These only depend on the time and latitude (and longitude) coordinates,
+        so they can be reused between variables and members of an ensemble sharing the same grid.
+        Default: ``0``, which disables the cache.
+    preserve_dtype : bool
+        If True, computations on single precision (float32) inputs are kept in single precision instead of being
+        promoted to double precision: unit conversions, converters, generic indices and run length algorithms
+        cast their results to the floating point type of their inputs, as do indicators for their outputs.
+        This halves the memory and storage needs of the outputs, at the cost of some precision. Run lengths and
+        positions are then also returned as float32, which represents them exactly. Default: ``False``.
 
     Examples
     --------
@@ -12,6 +12,7 @@ import logging
 import warnings
 from collections.abc import Callable
 from copy import deepcopy
+from functools import lru_cache
 from importlib.resources import files
 from inspect import signature
 from typing import Any, Literal, cast
@@ -28,7 +29,7 @@ from xclim.core._exceptions import ValidationError
 from xclim.core._types import Quantified
 from xclim.core.calendar import get_calendar, parse_offset
 from xclim.core.options import datacheck
-from xclim.core.utils import InputKind, infer_kind_from_parameter
+from xclim.core.utils import InputKind, cast_to_preserved_dtype, infer_kind_from_parameter, preserved_dtype
 
 try:
     from xarray import DataTree
@@ -178,6 +179,12 @@ def units2pint(
     else:
         raise NotImplementedError(f"Value of type `{type(value)}` not supported.")
 
+    return _parse_units(unit, metadata)
+
+
+@lru_cache(maxsize=1024)
+def _parse_units(unit: str, metadata: str | None = None) -> pint.Unit:
+    """Parse a unit string and its `units_metadata` attribute, memoized as pint's parsing is slow."""
     # Catch user errors undetected by Pint
     degree_ex = ["deg", "degree", "degrees"]
     unit_ex = [
@@ -218,6 +225,12 @@ def pint2cfunits(value: units.Quantity | units.Unit) -> str:
     if isinstance(value, pint.Quantity | units.Quantity):
         value = value.units
 
+    return _format_cf_units(value)
+
+
+@lru_cache(maxsize=1024)
+def _format_cf_units(value: pint.Unit) -> str:
+    """Format a pint unit as a CF-compliant string, memoized as pint's formatting is slow."""
     # Force "1" if the formatted string is "" (pint < 0.24)
     return f"{value:~cf}" or "1"
 
@@ -240,6 +253,15 @@ def pint2cfattrs(value: units.Quantity | units.Unit, is_difference=None) -> dict
     dict
         Units following CF-Convention, using symbols.
     """
+    if isinstance(value, pint.Quantity | units.Quantity):
+        value = value.units
+    # Copy, so the memoized attributes can't be modified by the caller
+    return dict(_cf_units_attrs(value, is_difference))
+
+
+@lru_cache(maxsize=1024)
+def _cf_units_attrs(value: pint.Unit, is_difference: bool | None = None) -> dict:
+    """Get the CF-compliant units attributes of a pint unit, memoized."""
     s = pint2cfunits(value)
     if "delta_" in s:
         is_difference = True
@@ -320,13 +342,20 @@ def str2pint(val: str) -> pint.Quantity:
     pint.Quantity
         Magnitude is 1 if no magnitude was present in the string.
     """
+    # A new quantity is returned every time, as quantities are mutable
+    return units.Quantity(*_split_quantity(val))
+
+
+@lru_cache(maxsize=1024)
+def _split_quantity(val: str) -> tuple[float, pint.Unit]:
+    """Split a quantity string into its magnitude and its parsed units, memoized."""
     mstr, *ustr = val.split(" ", maxsplit=1)
     try:
         if ustr:
-            return units.Quantity(float(mstr), units=units2pint(ustr[0]))
-        return units.Quantity(float(mstr))
+            return float(mstr), units2pint(ustr[0])
+        return float(mstr), units.dimensionless
     except ValueError:
-        return units.Quantity(1, units2pint(val))
+        return 1, units2pint(val)
 
 
 # FIXME: The typing here is difficult to determine, as Generics cannot be used to track the type of the output.
@@ -438,10 +467,18 @@ def convert_units_to(
             out = source.assign_attrs(**target_cf_attrs)
             return out
 
-        with units.context(context or "none"):
-            out = source.copy(data=units.convert(source.data, source_unit, target_unit))
-            out = out.assign_attrs(**target_cf_attrs)
-            return out
+        scale = _conversion_factor(source_unit, target_unit, context or "none")
+        if scale is None:
+            with units.context(context or "none"):
+                data = units.convert(source.data, source_unit, target_unit)
+        elif scale == 1:
+            # Same units with a different symbol, or an identity within the context: no need to copy the data
+            data = source.data
+        else:
+            data = source.data * scale
+        out = source.copy(data=data)
+        out = cast_to_preserved_dtype(out, source).assign_attrs(**target_cf_attrs)
+        return out
 
     # TODO remove backwards compatibility of int/float thresholds after v1.0 release
     if isinstance(source, float | int):
@@ -450,6 +487,44 @@ def convert_units_to(
     raise NotImplementedError(f"Source of type `{type(source)}` is not supported.")
 
 
+@lru_cache(maxsize=1024)
+def _conversion_factor(source: pint.Unit, target: pint.Unit, context: str) -> float | None:
+    """
+    Get the factor of the multiplicative conversion between two units, memoized.
+
+    Converting arrays through pint is slow, this allows conversions to be applied as a single multiplication.
+    Returns None if the conversion is not a single multiplication in pint, in which case pint must be used. This
+    includes offset units (e.g. degF to degC) and context transformations (e.g. mm/d to kg m-2 s-1), which pint applies
+    in steps that a single factor would not round in the same way, shifting values that sit exactly on a threshold
+    converted by pint. Identities within a context are kept, so their data doesn't need to be copied.
+    This raises pint's errors if the units are not compatible within the given context.
+    """
+    with units.context(context), np.errstate(all="ignore"):
+        x0, x1, x2 = units.convert(np.array([0.0, 1.0, 2.0]), source, target)
+    if x0 != 0 or not np.isclose(x2, 2 * x1, rtol=1e-9, atol=0):
+        return None
+    if x1 != 1 and context != "none" and source.dimensionality != target.dimensionality:
+        return None
+    return float(x1)
+
+
+def _scale_factor(source: pint.Unit, target: str) -> float | None:
+    """
+    Get the factor of a multiplicative conversion to the target units, without context.
+
+    Returns None if there is no such conversion, in which case :py:func:`convert_units_to` must be used.
+    This allows conversions to be folded into the scalar factors of other operations, instead of going over the data
+    twice. Temperature units are excluded, as their conversion also sets the `units_metadata` attribute.
+    """
+    target_unit = units2pint(target)
+    if "[temperature]" in target_unit.dimensionality:
+        return None
+    try:
+        return _conversion_factor(source, target_unit, "none")
+    except pint.errors.PintError:
+        return None
+
+
 def cf_conversion(standard_name: str, conversion: str, direction: Literal["to", "from"]) -> str | None:
     """
     Get the standard name of the specific conversion for the given standard name.
@@ -748,6 +823,8 @@ def _rate_and_amount_converter(
     out_units: str | None = None,
 ) -> xr.DataArray:
     """Internal converter for :py:func:`xclim.core.units.rate2amount` and :py:func:`xclim.core.units.amount2rate`."""
+    if to not in ["amount", "rate"]:
+        raise ValueError("Argument `to` must be one of 'amount' or 'rate'.")
     m = 1
     u = None  # Default to assume a non-uniform axis
     label: Literal["lower", "upper"] = "lower"  # Default to "lower" label for diff
@@ -817,25 +894,25 @@ def _rate_and_amount_converter(
         # and `label` has been updated accordingly.
         dt = time.diff(dim, label=label).reindex({dim: time}, method="ffill").astype(float)
         dt = dt / 1e9  # Convert to seconds
+        # Period lengths in seconds are exact in single precision, avoid promoting `da` to float64
+        dt = dt.astype(preserved_dtype(da) or dt.dtype)
 
         if to == "amount":
             tu = (str2pint(da.units) * str2pint("s")).to_reduced_units()
-            out = da * dt * tu.m
-        elif to == "rate":
+        else:
             tu = (str2pint(da.units) / str2pint("s")).to_reduced_units()
-            out = (da / dt) * tu.m
+        tu, out_units = _fold_out_units(tu, out_units)
+
+        # The period lengths are 1D, multiply them by the factor before the data
+        if to == "amount":
+            out = da * (dt * tu.m)
         else:
-            raise ValueError("Argument `to` must be one of 'amount' or 'rate'.")
+            out = da / (dt / tu.m)
 
         out.attrs["units"] = pint2cfunits(tu)
     else:
-        q = units.Quantity(m, u)
-        if to == "amount":
-            out = pint_multiply(da, q)
-        elif to == "rate":
-            out = pint_multiply(da, 1 / q)
-        else:
-            raise ValueError("Argument `to` must be one of 'amount' or 'rate'.")
+        q = units.Quantity(m, u) if to == "amount" else 1 / units.Quantity(m, u)
+        out, out_units = _pint_multiply_folded(da, q, out_units)
 
     old_name = da.attrs.get("standard_name")
     if old_name and (new_name := cf_conversion(old_name, "amount2rate", "to" if to == "rate" else "from")):
@@ -849,6 +926,28 @@ def _rate_and_amount_converter(
     return out
 
 
+def _fold_out_units(factor: pint.Quantity, out_units: str | None) -> tuple[pint.Quantity, str | None]:
+    """
+    Fold the conversion to `out_units` in a multiplicative factor, so the data is only multiplied once.
+
+    Returns the factor and the units the product must still be converted to, None if the conversion was folded.
+    """
+    if out_units and (scale := _scale_factor(factor.units, out_units)) is not None:
+        return units.Quantity(factor.m * scale, units2pint(out_units)), None
+    return factor, out_units
+
+
+def _pint_multiply_folded(da: xr.DataArray, q: pint.Quantity, out_units: str | None) -> tuple[xr.DataArray, str | None]:
+    """
+    Multiply `da` by `q` with :py:func:`pint_multiply`, folding the conversion to `out_units` when it is multiplicative.
+
+    Returns the product and the units it must still be converted to, None if the conversion was folded.
+    """
+    if out_units and _scale_factor((1 * units2pint(da) * q).units, out_units) is not None:
+        return pint_multiply(da, q, out_units=out_units), None
+    return pint_multiply(da, q), out_units
+
+
 @_register_conversion("amount2rate", "from")
 def rate2amount(
     rate: Quantified,
@@ -199,6 +199,59 @@ def uses_dask(*das) -> bool:
     return any(_is_dask_array(da) for da in das)
 
 
+def preserved_dtype(*args) -> np.dtype | None:
+    r"""
+    Get the floating point type to keep in computations on the given inputs.
+
+    Parameters
+    ----------
+    \*args : xr.DataArray or np.ndarray
+        Inputs of the computation. Arguments without a floating point dtype are ignored.
+
+    Returns
+    -------
+    np.dtype or None
+        The promoted dtype of the floating point inputs if the "preserve_dtype" option is set,
+        None if it is not set or if there are no floating point inputs.
+    """
+    from xclim.core.options import (  # pylint: disable=import-outside-toplevel
+        OPTIONS,
+        PRESERVE_DTYPE,
+    )
+
+    if not OPTIONS[PRESERVE_DTYPE]:
+        return None
+    dtypes = [arg.dtype for arg in args if hasattr(arg, "dtype") and np.issubdtype(arg.dtype, np.floating)]
+    if not dtypes:
+        return None
+    return np.result_type(*dtypes)
+
+
+def cast_to_preserved_dtype(out: xr.DataArray, *args) -> xr.DataArray:
+    r"""
+    Cast a floating point output back to the floating point type of the inputs, if the "preserve_dtype" option is set.
+
+    Only outputs of a wider floating point type than the inputs are cast,
+    integer, boolean and datetime outputs are returned as is.
+
+    Parameters
+    ----------
+    out : xr.DataArray
+        Output of the computation.
+    \*args : xr.DataArray or np.ndarray
+        Inputs of the computation.
+
+    Returns
+    -------
+    xr.DataArray
+        The output, cast to the dtype given by :py:func:`preserved_dtype` if needed.
+    """
+    dtype = preserved_dtype(*args)
+    if dtype is not None and np.issubdtype(out.dtype, np.floating) and out.dtype.itemsize > dtype.itemsize:
+        return out.astype(dtype)
+    return out
+
+
 def lazy_indexing(da: xr.DataArray, index: xr.DataArray, dim: str | None = None) -> xr.DataArray:
     """
     Get values of `da` at indices `index` in a NaN-aware and lazy manner.
@@ -12,6 +12,7 @@ from __future__ import annotations
 from xclim.ensembles._base import (
     create_ensemble,
     ensemble_mean_std_max_min,
+    ensemble_mean_std_max_min_streaming,
     ensemble_percentiles,
 )
 from xclim.ensembles._partitioning import (
@@ -6,12 +6,14 @@ Ensembles Creation and Statistics
 from __future__ import annotations
 
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 from pathlib import Path
 from typing import Any, Literal
 
 import numpy as np
 import xarray as xr
+from numba import float32, float64, guvectorize
 
 from xclim.core.calendar import common_calendar, get_calendar
 from xclim.core.formatting import update_history
@@ -35,6 +37,7 @@ def create_ensemble(
     calendar: str | None = None,
     realizations: Sequence[Any] | None = None,
     cal_kwargs: dict | None = None,
+    n_workers: int | None = 1,
     **xr_kwargs,
 ) -> xr.Dataset:
     r"""
@@ -75,6 +78,10 @@ def create_ensemble(
     cal_kwargs : dict, optional
         Additional arguments to pass to py:func:`xclim.core.calendar.convert_calendar`.
         For conversions involving '360_day', the align_on='date' option is used by default.
+    n_workers : int, optional
+        Number of threads used to open the members and decode their time coordinate concurrently.
+        Only the coordinates are read, the data stays lazy. If None, the default of
+        :py:class:`concurrent.futures.ThreadPoolExecutor` is used. Default: 1 (members are opened one after the other).
     **xr_kwargs : dict
         Any keyword arguments to be given to `xr.open_dataset` when opening the files
         (or to `xr.open_mfdataset` if `multifile` is True).
@@ -122,6 +129,7 @@ def create_ensemble(
         resample_freq,
         calendar=calendar,
         cal_kwargs=cal_kwargs or {},
+        n_workers=n_workers,
         **xr_kwargs,
     )
 
@@ -211,6 +219,135 @@ def ensemble_mean_std_max_min(
     return ds_out
 
 
+def ensemble_mean_std_max_min_streaming(
+    datasets: Any,
+    min_members: int | None = 1,
+    weights: xr.DataArray | None = None,
+    multifile: bool = False,
+    resample_freq: str | None = None,
+    calendar: str | None = None,
+    cal_kwargs: dict | None = None,
+    n_workers: int | None = 1,
+    **xr_kwargs,
+) -> xr.Dataset:
+    r"""
+    Calculate ensemble statistics by iterating over the members of an ensemble of climate simulations.
+
+    Same as :py:func:`ensemble_mean_std_max_min`, but the members are loaded one at a time instead of being
+    concatenated along the `realization` dimension. The mean and standard deviation are updated with Welford's
+    algorithm (weighted as in West, 1979) and the minimum and maximum are running values, so the memory used is
+    proportional to the size of a single member. Only numerical variables are processed.
+
+    Parameters
+    ----------
+    datasets : list or dict or str
+        The members of the ensemble, as accepted by :py:func:`create_ensemble`.
+        The time coordinates are aligned in the same way.
+    min_members : int, optional
+        The minimum number of valid ensemble members for a statistic to be valid.
+        Passing None is equivalent to setting min_members to the number of members.
+        The default (1) essentially skips this check.
+    weights : xr.DataArray, optional
+        Weights of the members, along the 'realization' dimension, in the same order as `datasets`.
+        This array cannot contain missing values.
+    multifile : bool
+        If True, climate simulations are treated as xarray multifile Datasets.
+        Only applicable when "datasets" is sequence of list of file paths. Default: False.
+    resample_freq : str, optional
+        If set, the time coordinate of each member will be modified to fit this frequency.
+        See :py:func:`create_ensemble`.
+    calendar : str, optional
+        The calendar of the time coordinate of the statistics. See :py:func:`create_ensemble`.
+    cal_kwargs : dict, optional
+        Additional arguments to pass to py:func:`xclim.core.calendar.convert_calendar`.
+    n_workers : int, optional
+        Number of threads used to open the members. See :py:func:`create_ensemble`.
+    **xr_kwargs : dict
+        Any keyword arguments to be given to `xr.open_dataset` when opening the files
+        (or to `xr.open_mfdataset` if `multifile` is True).
+
+    Returns
+    -------
+    xr.Dataset
+        Dataset with data variables of ensemble statistics.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from xclim.ensembles import ensemble_mean_std_max_min_streaming
+
+        # Calculate ensemble statistics, from the files of the members:
+        ens_mean_std = ensemble_mean_std_max_min_streaming(temperature_files)
+    """
+    if isinstance(datasets, dict):
+        datasets = datasets.values()
+    ds_all = _ens_align_datasets(
+        datasets,
+        multifile,
+        resample_freq,
+        calendar=calendar,
+        cal_kwargs=cal_kwargs or {},
+        n_workers=n_workers,
+        **xr_kwargs,
+    )
+    ds_all = xr.align(*ds_all, join="outer")
+    if min_members is None:
+        min_members = len(ds_all)
+
+    ref = ds_all[0]
+    variables = [v for v, da in ref.data_vars.items() if da.dtype.kind in "biuf"]
+    acc: dict[str, dict[str, xr.DataArray]] = {}
+    for i, ds in enumerate(ds_all):
+        w = 1 if weights is None else weights.isel(realization=i, drop=True).variable
+        # Compute a copy of the member, the aligned (lazy) datasets are left untouched.
+        ds = ds.compute()
+        for v in variables:
+            x = ds[v].variable
+            valid = x.notnull()
+            if v not in acc:
+                acc[v] = {
+                    "count": valid.astype(int),
+                    "sumw": valid * w,
+                    "mean": x.where(valid, 0) * 1.0,
+                    "m2": x.where(valid, 0) * 0.0,
+                    "max": x,
+                    "min": x,
+                }
+                continue
+            a = acc[v]
+            a["count"] = a["count"] + valid
+            a["sumw"] = a["sumw"] + valid * w
+            delta = x.where(valid, 0) - a["mean"]
+            # Where the member is invalid or the sum of weights still null, the mean is not updated.
+            ratio = valid * w / a["sumw"].where(a["sumw"] != 0, 1)
+            a["mean"] = a["mean"] + delta * ratio
+            a["m2"] = a["m2"] + valid * w * delta * (x.where(valid, 0) - a["mean"])
+            a["max"] = xr.apply_ufunc(np.fmax, a["max"], x)
+            a["min"] = xr.apply_ufunc(np.fmin, a["min"], x)
+
+    ds_out = xr.Dataset(attrs=ref.attrs)
+    for v, a in acc.items():
+        coords = {k: c for k, c in ref[v].coords.items() if set(c.dims) <= set(a["count"].dims)}
+        has_weight = a["sumw"] > 0
+        stats = {
+            "mean": a["mean"].where(has_weight),
+            "stdev": np.sqrt(a["m2"] / a["sumw"].where(has_weight)),
+            "max": a["max"],
+            "min": a["min"],
+        }
+        for stat, out in stats.items():
+            vv = f"{v}_{stat}"
+            if min_members != 1:
+                out = out.where(a["count"] >= min_members)
+            ds_out[vv] = xr.DataArray(out, coords=coords, attrs=ref[v].attrs)
+            if "description" in ds_out[vv].attrs.keys():
+                ds_out[vv].attrs["description"] = ds_out[vv].attrs["description"] + " : " + stat + " of ensemble"
+
+    ds_out.attrs["history"] = update_history(f"Computation of statistics on {len(ds_all)} ensemble members.", ds_out)
+    return ds_out
+
+
 def ensemble_percentiles(
     ens: xr.Dataset | xr.DataArray,
     values: Sequence[int] | None = None,
@@ -250,8 +387,8 @@ def ensemble_percentiles(
         The default (1) essentially skips this check.
     weights : xr.DataArray, optional
         Weights to apply along the 'realization' dimension. This array cannot contain missing values.
-        When given, the function uses xarray's quantile method which is slower than xclim's NaN-optimized algorithm,
-        and does not support `method` values other than `linear`.
+        The effective number of members used by `method` is Kish's effective sample size. With the "linear" method,
+        the results are the same as xarray's weighted quantiles.
     split : bool
         Whether to split each percentile into a new variable
         or concatenate the output along a new "percentiles" dimension.
@@ -341,17 +478,22 @@ def ensemble_percentiles(
             dask_gufunc_kwargs={"output_sizes": {"percentiles": len(values)}},
         )
     else:
-        if method != "linear":
-            raise ValueError("Only the 'linear' method is supported when using weights.")
-
-        with xr.set_options(keep_attrs=True):
-            # xclim's calc_perc does not support weighted arrays, so xarray's native function is used instead.
-            qt = np.array(values) / 100  # xarray requires values between 0 and 1
-            out = (
-                ens.weighted(weights)
-                .quantile(qt, dim="realization", keep_attrs=True)
-                .rename({"quantile": "percentiles"})
-            )
+        alpha, beta = _quantile_params[method]
+
+        out = xr.apply_ufunc(
+            _weighted_quantile,
+            ens if ens.dtype == np.float32 else ens.astype(float),
+            weights.astype(float),
+            np.array(values, dtype=float) / 100,
+            alpha,
+            beta,
+            input_core_dims=[["realization"], ["realization"], ["percentiles"], [], []],
+            output_core_dims=[["percentiles"]],
+            keep_attrs=True,
+            dask="parallelized",
+            output_dtypes=[ens.dtype if ens.dtype == np.float32 else float],
+            dask_gufunc_kwargs={"output_sizes": {"percentiles": len(values)}},
+        )
 
     if min_members != 1:
         out = out.where(ens.notnull().sum("realization") >= min_members)
@@ -373,12 +515,60 @@ def ensemble_percentiles(
     return out
 
 
+@guvectorize(
+    [
+        (float32[:], float64[:], float64[:], float64, float64, float32[:]),
+        (float64[:], float64[:], float64[:], float64, float64, float64[:]),
+    ],
+    "(n),(n),(m),(),()->(m)",
+    nopython=True,
+    cache=True,
+)
+def _weighted_quantile(arr, weights, q, alpha, beta, out):  # pragma: no cover
+    r"""
+    Compute weighted quantiles of an array, ignoring missing values.
+
+    The values are sorted once for all quantiles. The virtual index of each quantile is computed from Kish's effective
+    sample size :math:`n_w = (\sum w)^2 / \sum w^2` as :math:`h = (n_w + 1 - \alpha - \beta) q + \alpha`,
+    and the quantile is the weighted mean of the sorted values covering the interval :math:`[(h - 1) / n_w, h / n_w]`
+    of the normalized cumulative weights. With `alpha = beta = 1`, this is the same as xarray's weighted quantiles
+    and with equal weights, the same as :py:func:`numpy.quantile` with the corresponding method.
+    """
+    mask = ~np.isnan(arr) & (weights != 0)
+    data = arr[mask]
+    w = weights[mask]
+    n = data.size
+    if n == 0:
+        out[:] = np.nan
+        return
+    sorter = np.argsort(data)
+    data = data[sorter]
+    w = w[sorter]
+    wsum = w.sum()
+    nw = wsum**2 / (w**2).sum()
+    cumw = np.zeros(n + 1)
+    cumw[1:] = np.cumsum(w) / wsum
+    for j in range(q.size):
+        h = min(max((nw + 1 - alpha - beta) * q[j] + alpha, 1.0), nw)
+        low = (h - 1) / nw
+        high = h / nw
+        res = 0.0
+        prev = 0.0
+        for k in range(n):
+            # Position of the upper end of this sample within the interval, relative to its start
+            cur = (min(max(cumw[k + 1], low), high) - low) * nw
+            res += data[k] * (cur - prev)
+            prev = cur
+        out[j] = res
+
+
 def _ens_align_datasets(
     datasets: list[xr.Dataset | Path | str | list[Path | str]] | str,
     multifile: bool = False,
     resample_freq: str | None = None,
     calendar: str = "default",
     cal_kwargs: dict | None = None,
+    n_workers: int | None = 1,
     **xr_kwargs,
 ) -> list[xr.Dataset]:
     r"""
@@ -404,6 +594,9 @@ def _ens_align_datasets(
         'default' is the standard calendar using np.datetime64 objects.
     cal_kwargs : dict, optional
         Any keyword to be given to used when setting calendar options.
+    n_workers : int, optional
+        Number of threads used to open the members and decode their time coordinate.
+        If None, the default of :py:class:`concurrent.futures.ThreadPoolExecutor` is used.
     **xr_kwargs : dict
         Any keyword arguments to be given to xarray when opening the files.
 
@@ -414,45 +607,64 @@ def _ens_align_datasets(
     xr_kwargs.setdefault("chunks", "auto")
     xr_kwargs.setdefault("decode_times", False)
 
-    if isinstance(datasets, str):
-        datasets = glob(datasets)
+    datasets = glob(datasets) if isinstance(datasets, str) else list(datasets)
 
-    ds_all: list[xr.Dataset] = []
-    calendars = []
-    for i, n in enumerate(datasets):
-        ds: xr.Dataset
-        if multifile:
-            ds = xr.open_mfdataset(n, combine="by_coords", **xr_kwargs)
-        else:
-            if isinstance(n, xr.Dataset):
-                ds = n
-            elif isinstance(n, xr.DataArray):
-                ds = n.to_dataset()
-            else:
-                ds = xr.open_dataset(n, **xr_kwargs)
-
-        if "time" in ds.coords:
-            time = xr.decode_cf(ds).time
-
-            if resample_freq is not None:
-                # Cast to bool to avoid bug in flox/numpy_groupies (xarray-contrib/flox#137)
-                counts = time.astype(bool).resample(time=resample_freq).count()
-                if any(counts > 1):
-                    raise ValueError(
-                        f"Alignment of dataset #{i:02d} failed: Time axis cannot be resampled to freq {resample_freq}."
-                    )
-                time = counts.time
-
-            ds["time"] = time
-            calendars.append(get_calendar(time))
+    def _open(i: int, n: Any) -> tuple[xr.Dataset, xr.DataArray | None]:  # numpydoc ignore=GL08
+        ds = _open_member(n, multifile, **xr_kwargs)
+        return ds, _member_time(ds, i, resample_freq)
 
-        ds_all.append(ds)
+    if n_workers == 1:
+        members = list(map(_open, range(len(datasets)), datasets))
+    else:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            members = list(executor.map(_open, range(len(datasets)), datasets))
 
+    calendars = [get_calendar(time) for _, time in members if time is not None]
     if not calendars:
         # no time
-        return ds_all
+        return [ds for ds, _ in members]
 
     if calendar is None:
         calendar = common_calendar(calendars, join="outer")
     cal_kwargs.setdefault("align_on", "date")
-    return [ds.convert_calendar(calendar, **cal_kwargs) for ds in ds_all]
+
+    ds_all = []
+    for ds, time in members:
+        ds = ds.assign_coords(time=time)
+        # Only the members with another calendar (or cftime dates that could be converted to numpy ones) are converted.
+        if get_calendar(time) != calendar or (
+            time.dtype == "O" and calendar in ["default", "standard", "gregorian", "proleptic_gregorian"]
+        ):
+            ds = ds.convert_calendar(calendar, **cal_kwargs)
+        ds_all.append(ds)
+    return ds_all
+
+
+def _open_member(
+    n: xr.Dataset | xr.DataArray | Path | str | list[Path | str], multifile: bool = False, **xr_kwargs
+) -> xr.Dataset:
+    """Open a member of the ensemble, without loading its data."""
+    if multifile:
+        return xr.open_mfdataset(n, combine="by_coords", **xr_kwargs)
+    if isinstance(n, xr.Dataset):
+        return n
+    if isinstance(n, xr.DataArray):
+        return n.to_dataset()
+    return xr.open_dataset(n, **xr_kwargs)
+
+
+def _member_time(ds: xr.Dataset, i: int, resample_freq: str | None = None) -> xr.DataArray | None:
+    """Decode the time coordinate of a member of the ensemble, only the coordinate is decoded."""
+    if "time" not in ds.coords:
+        return None
+    time = xr.decode_cf(ds[["time"]]).time
+
+    if resample_freq is not None:
+        # Cast to bool to avoid bug in flox/numpy_groupies (xarray-contrib/flox#137)
+        counts = time.astype(bool).resample(time=resample_freq).count()
+        if any(counts > 1):
+            raise ValueError(
+                f"Alignment of dataset #{i:02d} failed: Time axis cannot be resampled to freq {resample_freq}."
+            )
+        time = counts.time
+    return time
@@ -9,9 +9,13 @@ from __future__ import annotations
 
 from typing import cast
 
+import cftime
 import numpy as np
 import xarray as xr
 
+from xclim.core.calendar import get_calendar
+from xclim.core.utils import uses_dask
+
 # pylint: disable=pointless-string-statement
 """
 Implemented partitioning algorithms:
@@ -51,6 +55,74 @@ Related bixtex entries:
 """
 # pylint: enable=pointless-string-statement
 
+
+def _polyfit_values(arr: np.ndarray, x: np.ndarray, deg: int) -> np.ndarray:
+    """
+    Fit polynomials along the last axis of `arr` with least squares, skipping NaNs, and return the fitted values.
+
+    All series are stacked, so the fits are solved together instead of one at a time. Series without missing values
+    share their design matrix and are solved in a single call, the others through their normal equations.
+    """
+    shape = arr.shape
+    y = arr.reshape(-1, shape[-1]).astype(np.float64)
+    lhs = np.vander(x, deg + 1)
+    out = np.full(y.shape, np.nan)
+
+    valid = np.isfinite(y)
+    nvalid = valid.sum(axis=1)
+    full = nvalid == y.shape[1]
+    if full.any():
+        coefs = np.linalg.lstsq(lhs, y[full].T, rcond=None)[0]
+        out[full] = (lhs @ coefs).T
+
+    part = ~full & (nvalid > deg)
+    if part.any():
+        w = valid[part].astype(np.float64)
+        gram = np.einsum("pt,ti,tj->pij", w, lhs, lhs)
+        rhs = np.einsum("pt,ti->pi", np.where(valid[part], y[part], 0), lhs)
+        coefs = np.linalg.solve(gram, rhs[..., np.newaxis])[..., 0]
+        out[part] = coefs @ lhs.T
+
+    # Under-determined fits, take the minimum norm solution as `numpy.linalg.lstsq` does
+    for i in np.flatnonzero(~full & ~part & (nvalid > 0)):
+        coefs = np.linalg.lstsq(lhs[valid[i]], y[i, valid[i]], rcond=None)[0]
+        out[i] = lhs @ coefs
+
+    out[~valid] = np.nan
+    return out.reshape(shape)
+
+
+def _polyfit_smooth(da: xr.DataArray, deg: int = 4) -> xr.DataArray:
+    """
+    Smooth time series with a polynomial fitted over time, masked where `da` is null.
+
+    This is equivalent to `da.polyfit` followed by `xr.polyval`, but it is computed blockwise, so gridded ensembles
+    are smoothed chunk by chunk, without loading the whole ensemble. Only the `time` dimension needs to be in a single
+    chunk.
+    """
+    time = da.time.values
+    if np.issubdtype(time.dtype, np.datetime64):
+        x = (time - np.datetime64("1970-01-01")) / np.timedelta64(1, "D")
+    else:
+        x = cftime.date2num(time, "days since 1970-01-01", calendar=get_calendar(da))
+    x = np.asarray(x, dtype=np.float64)
+    # Map the time axis to [-1, 1] to keep the normal equations well-conditioned
+    if x.size > 1:
+        x = 2 * (x - x[0]) / (x[-1] - x[0]) - 1
+
+    if uses_dask(da):
+        da = da.chunk({"time": -1})
+    return xr.apply_ufunc(
+        _polyfit_values,
+        da,
+        input_core_dims=[["time"]],
+        output_core_dims=[["time"]],
+        kwargs={"x": x, "deg": deg},
+        dask="parallelized",
+        output_dtypes=[np.float64],
+    ).transpose(*da.dims)
+
+
 # TODO: Add ref for Brekke and Barsugli (2013)
 
 
@@ -89,6 +161,8 @@ def hawkins_sutton(
     -----
     To prepare input data, make sure `da` has dimensions `time`, `scenario` and `model`,
     e.g. `da.rename({"scen": "scenario"})`.
+    Other dimensions, e.g. `lat` and `lon`, are partitioned independently. With dask-backed inputs, the default
+    smoothing is computed blockwise and only needs `time` in a single chunk.
 
     To reproduce results from :cite:t:`hawkins_2009`, input data should meet the following requirements:
       - annual time series starting in 1950 and ending in 2100;
@@ -118,8 +192,7 @@ def hawkins_sutton(
     if sm is None:
         # Fit 4th order polynomial to smooth natural fluctuations
         # Note that the order of the polynomial has a substantial influence on the results.
-        fit = da.polyfit(dim="time", deg=4, skipna=True)
-        sm = xr.polyval(coord=da.time, coeffs=fit.polyfit_coefficients).where(da.notnull())
+        sm = _polyfit_smooth(da, deg=4)
 
     # Decadal mean residuals
     res = (da - sm).rolling(time=10, center=True).mean()
@@ -219,6 +292,7 @@ def lafferty_sriver(
     -----
     To prepare input data, make sure `da` has dimensions `time`, `scenario`, `downscaling` and `model`,
     e.g. `da.rename({"experiment": "scenario"})`.
+    Other dimensions, e.g. `lat` and `lon`, are partitioned independently, and dask-backed inputs stay lazy.
 
     To get the fraction of the total variance instead of the variance itself, call `fractional_uncertainty` on the
     output.
@@ -235,8 +309,7 @@ def lafferty_sriver(
 
     if sm is None:
         # Fit a 4th order polynomial
-        fit = da.polyfit(dim="time", deg=4, skipna=True)
-        sm = xr.polyval(coord=da.time, coeffs=fit.polyfit_coefficients).where(da.notnull())
+        sm = _polyfit_smooth(da, deg=4)
 
     # "Interannual variability is then estimated as the centered rolling 11-year variance of the difference
     # between the extracted forced response and the raw outputs, averaged over all outputs."
@@ -341,10 +414,9 @@ def general_partition(
         error_msg = f"DataArray dimensions should include {all_types} and time."
         raise ValueError(error_msg)
 
-    if sm == "poly":
+    if isinstance(sm, str) and sm == "poly":
         # Fit a 4th order polynomial
-        fit = da.polyfit(dim="time", deg=4, skipna=True)
-        sm = xr.polyval(coord=da.time, coeffs=fit.polyfit_coefficients).where(da.notnull())
+        sm = _polyfit_smooth(da, deg=4)
     elif isinstance(sm, xr.DataArray):
         pass
     else:
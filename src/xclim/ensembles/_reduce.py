@@ -9,6 +9,7 @@ computation needed while still covering a good portion of the simulated climate
 from __future__ import annotations
 
 import importlib.util as _util
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from warnings import warn
 
@@ -18,6 +19,7 @@ import scipy.stats
 import xarray
 from scipy.spatial import distance
 from sklearn.cluster import KMeans
+from sklearn.decomposition import PCA
 
 # Avoid having to include matplotlib in xclim requirements
 MPL_INSTALLED = bool(_util.find_spec("matplotlib"))
@@ -148,28 +150,34 @@ def kkz_reduce_ensemble(
         data = (data - data.mean("realization")) / data.std("realization")
 
     data = data.transpose("realization", "criteria")
-    data["realization"] = np.arange(data.realization.size)
+    centroid = data.mean("realization").values[np.newaxis]
+    data = data.values
 
-    unselected = list(data.realization.values)
+    unselected = list(range(data.shape[0]))
     selected = []
 
     dist0 = distance.cdist(
-        data.mean("realization").expand_dims("realization"),
+        centroid,
         data,
         metric=dist_method,
         **cdist_kwargs,
     )
     selected.append(unselected.pop(dist0.argmin()))
 
+    # Distance of the unselected members to the nearest selected one. It is updated with the distances
+    # to the last selected member only, instead of recomputing the distances to all selected members.
+    mindist = np.full(len(unselected), np.inf)
     for _ in range(1, num_select):
         dist = distance.cdist(
-            data.isel(realization=selected),
-            data.isel(realization=unselected),
+            data[selected[-1:]],
+            data[unselected],
             metric=dist_method,
             **cdist_kwargs,
         )
-        dist = dist.min(axis=0)
-        selected.append(unselected.pop(dist.argmax()))
+        mindist = np.minimum(mindist, dist[0])
+        i = mindist.argmax()
+        selected.append(unselected.pop(i))
+        mindist = np.delete(mindist, i)
 
     return selected
 
@@ -184,6 +192,8 @@ def kmeans_reduce_ensemble(
     model_weights: np.ndarray | None = None,
     sample_weights: np.ndarray | None = None,
     random_state: int | np.random.RandomState | None = None,
+    n_components: int | None = None,
+    n_workers: int | None = 1,
 ) -> tuple[list, np.ndarray, dict]:
     """
     Return a sample of ensemble members using k-means clustering.
@@ -224,6 +234,16 @@ def kmeans_reduce_ensemble(
         Determines random number generation for centroid initialization.
         Use to make the randomness deterministic.
         See: https://scikit-learn.org/stable/modules/generated/sklearn.cluster.KMeans.html.
+    n_components : int, optional
+        If given, the standardized and weighted criteria are projected on their first `n_components` principal
+        components (computed with a randomized SVD) before the clustering. Useful when the number of criteria (P)
+        is very large, e.g. criteria made from full spatial fields with :py:func:`make_criteria`.
+        As the criteria of N realizations span at most N - 1 dimensions, using ``n_components=N - 1`` preserves
+        the distances between realizations. Default: no reduction.
+    n_workers : int, optional
+        Number of threads used to compute the k-means of the R² profile, one number of clusters per task.
+        If None, the default of :py:class:`concurrent.futures.ThreadPoolExecutor` is used.
+        Default: 1 (the numbers of clusters are processed one after the other).
 
     Returns
     -------
@@ -342,7 +362,9 @@ def kmeans_reduce_ensemble(
     variable_weights = variable_weights / np.sum(variable_weights)
 
     z = z * variable_weights
-    rsq = _calc_rsq(z, method, make_graph, n_sim, random_state, sample_weights)
+    if n_components is not None:
+        z = PCA(n_components=n_components, svd_solver="randomized", random_state=random_state).fit_transform(z)
+    rsq = _calc_rsq(z, method, make_graph, n_sim, random_state, sample_weights, n_workers=n_workers)
 
     n_clusters = _get_nclust(method=method, n_sim=n_sim, rsq=rsq, max_clusters=max_clusters)
 
@@ -391,7 +413,15 @@ def kmeans_reduce_ensemble(
     return out, clusters, fig_data
 
 
-def _calc_rsq(z, method: dict, make_graph: bool, n_sim: np.ndarray | int, random_state, sample_weights):
+def _calc_rsq(
+    z,
+    method: dict,
+    make_graph: bool,
+    n_sim: np.ndarray | int,
+    random_state,
+    sample_weights,
+    n_workers: int | None = 1,
+):
     """
     Sub-function to kmeans_reduce_ensemble.
 
@@ -399,20 +429,31 @@ def _calc_rsq(z, method: dict, make_graph: bool, n_sim: np.ndarray | int, random
     """
     rsq = None
     if list(method.keys())[0] != "n_clusters" or make_graph is True:
-        # generate r2 profile data
-        sum_d = np.zeros(shape=n_sim) + np.nan
-        for n_clust in range(n_sim):
+        if isinstance(random_state, np.random.RandomState):
+            # A shared random state would be consumed in a random order by the threads, draw one seed per number
+            # of clusters instead, whatever the number of workers, so the results do not depend on it.
+            random_states = list(random_state.randint(np.iinfo(np.int32).max, size=n_sim))
+        else:
+            random_states = [random_state] * n_sim
+
+        def _inertia(n_clust):  # numpydoc ignore=GL08
             # This is k-means with only 10 iterations, to limit the computation times
             kmeans = KMeans(
                 n_clusters=n_clust + 1,
                 n_init=15,
                 max_iter=300,
-                random_state=random_state,
+                random_state=random_states[n_clust],
             )
             kmeans = kmeans.fit(z, sample_weight=sample_weights)
-            sum_d[n_clust] = (
-                kmeans.inertia_
-            )  # sum of the squared distance between each simulation and the nearest cluster centroid
+            # sum of the squared distance between each simulation and the nearest cluster centroid
+            return kmeans.inertia_
+
+        # generate r2 profile data
+        if n_workers == 1:
+            sum_d = np.array(list(map(_inertia, range(n_sim))))
+        else:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                sum_d = np.array(list(executor.map(_inertia, range(n_sim))))
 
         # R² of the groups vs. the full ensemble
         rsq = (sum_d[0] - sum_d) / sum_d[0]
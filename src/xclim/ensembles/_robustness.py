@@ -18,6 +18,7 @@ from typing import cast
 import numpy as np
 import scipy.stats as spstats
 import xarray as xr
+from numba import float64, guvectorize, njit
 
 from xclim.core.formatting import gen_call_string, update_xclim_history
 from xclim.core.missing import MissingAny, MissingBase
@@ -409,6 +410,58 @@ def robustness_categories(
     return robustness
 
 
+@njit(cache=True)
+def _diff_cdf_sq_area_int(x1, x2):  # pragma: no cover
+    """
+    Exact integral of the squared area between the non-parametric CDFs of 2 sorted vectors.
+
+    The sorted values are merged on the fly: between two consecutive values, the difference between the CDFs
+    (the proportion of each vector smaller or equal to the left value) is constant.
+    """
+    n1 = x1.size
+    n2 = x2.size
+    i = 0
+    j = 0
+    area = 0.0
+    prev = min(x1[0], x2[0])
+    while i < n1 or j < n2:
+        if j >= n2 or (i < n1 and x1[i] <= x2[j]):
+            v = x1[i]
+        else:
+            v = x2[j]
+        area += (v - prev) * (i / n1 - j / n2) ** 2
+        while i < n1 and x1[i] == v:
+            i += 1
+        while j < n2 and x2[j] == v:
+            j += 1
+        prev = v
+    return area
+
+
+@guvectorize(
+    [(float64[:], float64[:, :], float64[:])],
+    "(n),(m,k)->()",
+    nopython=True,
+    cache=True,
+)
+def _knutti_sedlacek(reference, future, out):  # pragma: no cover
+    """Compute the robustness coefficient of a future ensemble (realization, time) against a reference (time)."""
+    if np.isnan(reference).any() or np.isnan(future).any():
+        out[0] = np.nan
+        return
+    # Get sorted vectors
+    v_fut = np.sort(future.flatten())  # "cumulative" models distribution
+    v_favg = np.empty(future.shape[0])  # Multimodel mean
+    for r in range(future.shape[0]):
+        v_favg[r] = future[r].mean()
+    v_favg = np.sort(v_favg)
+    v_ref = np.sort(reference)  # Historical values
+
+    a1 = _diff_cdf_sq_area_int(v_fut, v_favg)
+    a2 = _diff_cdf_sq_area_int(v_ref, v_favg)
+    out[0] = 1 - a1 / a2
+
+
 @update_xclim_history
 def robustness_coefficient(fut: xr.DataArray | xr.Dataset, ref: xr.DataArray | xr.Dataset) -> xr.DataArray | xr.Dataset:
     """
@@ -442,38 +495,6 @@ def robustness_coefficient(fut: xr.DataArray | xr.Dataset, ref: xr.DataArray | x
     ----------
     :cite:cts:`knutti_robustness_2013`
     """
-
-    def _knutti_sedlacek(reference, future):
-        def diff_cdf_sq_area_int(x1, x2):
-            """Exact integral of the squared area between the non-parametric CDFs of 2 vectors."""
-            # Non-parametric CDF on points x1 and x2
-            # i.e. y1(x) is the proportion of x1 <= x
-            y1 = (np.arange(x1.size) + 1) / x1.size
-            y2 = (np.arange(x2.size) + 1) / x2.size
-
-            x2_in_1 = np.searchsorted(x1, x2, side="right")  # Where to insert x2 in x1
-            x1_in_2 = np.searchsorted(x2, x1, side="right")  # Where to insert x1 in x2
-
-            # Merge to get all "discontinuities" of the CDF difference
-            # y1 with repeated value (to the right) where x2 is inserted
-            # Same for y2. 0s are prepended where needed.
-            x = np.insert(x1, x2_in_1, x2)
-            y1_f = np.insert(y1, x2_in_1, np.r_[0, y1][x2_in_1])
-            y2_f = np.insert(y2, x1_in_2, np.r_[0, y2][x1_in_2])
-
-            # Discrete integral of the squared difference (distance) between the two CDFs.
-            return np.sum(np.diff(x) * (y1_f - y2_f)[:-1] ** 2)
-
-        # Get sorted vectors
-        v_fut = np.sort(future.flatten())  # "cumulative" models distribution
-        v_favg = np.sort(future.mean(axis=-1))  # Multimodel mean
-        v_ref = np.sort(reference)  # Historical values
-
-        A1 = diff_cdf_sq_area_int(v_fut, v_favg)
-        A2 = diff_cdf_sq_area_int(v_ref, v_favg)
-
-        return 1 - A1 / A2
-
     R = cast(
         xr.DataArray,
         xr.apply_ufunc(
@@ -482,7 +503,6 @@ def robustness_coefficient(fut: xr.DataArray | xr.Dataset, ref: xr.DataArray | x
             fut,
             input_core_dims=[["time"], ["realization", "time"]],
             exclude_dims={"time"},
-            vectorize=True,
             dask="parallelized",
             output_dtypes=[float],
         ),
@@ -498,6 +518,87 @@ def robustness_coefficient(fut: xr.DataArray | xr.Dataset, ref: xr.DataArray | x
     return R
 
 
+def _count_mean_var(x: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Number of valid values, mean and unbiased variance along the last axis, ignoring missing values."""
+    valid = ~np.isnan(x)
+    n = valid.sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(valid, x, 0).sum(axis=-1) / n
+        var = (np.where(valid, x - mean[..., np.newaxis], 0) ** 2).sum(axis=-1) / (n - 1)
+    return n, mean, var
+
+
+def _ttest_pvals(f: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """P-values of the single sample T-test of `f` against the population mean `r`, along the last axis."""
+    n, mean, var = _count_mean_var(f)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (mean - r) / np.sqrt(var / n)
+    return 2 * spstats.t.sf(np.abs(t), n - 1)
+
+
+def _welch_ttest_pvals(f: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """P-values of the two-sided Welch's T-test between `f` and `r`, along the last axis."""
+    n1, m1, v1 = _count_mean_var(f)
+    n2, m2, v2 = _count_mean_var(r)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vn1 = v1 / n1
+        vn2 = v2 / n2
+        df = (vn1 + vn2) ** 2 / (vn1**2 / (n1 - 1) + vn2**2 / (n2 - 1))
+        # When the variances are null, the degrees of freedom are undefined but don't matter, as in scipy.
+        df = np.where(np.isnan(df), 1, df)
+        t = (m1 - m2) / np.sqrt(vn1 + vn2)
+    return 2 * spstats.t.sf(np.abs(t), df)
+
+
+def _mannwhitney_utest_pvals(f: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """
+    P-values of the two-sided Mann-Whitney U-test between `f` and `r`, along the last axis.
+
+    The ranks and ties of the combined samples are computed for all points at once and the p-values are taken from the
+    normal approximation, with continuity and tie corrections. Points where scipy would use the exact distribution
+    (a sample of 8 values or less, without ties) are computed with :py:func:`scipy.stats.mannwhitneyu`.
+    """
+    shape = np.broadcast_shapes(f.shape[:-1], r.shape[:-1])
+    f = np.broadcast_to(f, shape + f.shape[-1:])
+    r = np.broadcast_to(r, shape + r.shape[-1:])
+    n1 = (~np.isnan(f)).sum(axis=-1)
+    n2 = (~np.isnan(r)).sum(axis=-1)
+    n = n1 + n2
+
+    fr = np.concatenate([f, r], axis=-1)
+    rmin = spstats.rankdata(fr, method="min", axis=-1, nan_policy="omit")
+    rmax = spstats.rankdata(fr, method="max", axis=-1, nan_policy="omit")
+    u1 = np.nansum((rmin + rmax)[..., : f.shape[-1]] / 2, axis=-1) - n1 * (n1 + 1) / 2
+    u = np.maximum(u1, n1 * n2 - u1)
+    # Each value of a group of t ties contributes t**2 - 1, so the group contributes t**3 - t.
+    tie_term = np.nansum((rmax - rmin + 1) ** 2 - 1, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+        z = (u - n1 * n2 / 2 - 0.5) / s
+    pvals = np.clip(2 * spstats.norm.sf(z), 0, 1)
+    pvals = np.where((n1 == 0) | (n2 == 0), np.nan, pvals)
+
+    exact = (n1 > 0) & (n2 > 0) & ((n1 <= 8) | (n2 <= 8)) & (tie_term == 0)
+    for idx in zip(*np.nonzero(exact), strict=True):
+        pvals[idx] = spstats.mannwhitneyu(f[idx], r[idx], nan_policy="omit")[1]
+    return pvals
+
+
+def _brownforsythe_pvals(f: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """P-values of the Brown-Forsythe test between `f` and `r`, along the last axis. Missing values are propagated."""
+    n1, n2 = f.shape[-1], r.shape[-1]
+    z1 = np.abs(f - np.median(f, axis=-1, keepdims=True))
+    z2 = np.abs(r - np.median(r, axis=-1, keepdims=True))
+    z1m = z1.mean(axis=-1)
+    z2m = z2.mean(axis=-1)
+    zm = (n1 * z1m + n2 * z2m) / (n1 + n2)
+    numer = n1 * (z1m - zm) ** 2 + n2 * (z2m - zm) ** 2
+    denom = ((z1 - z1m[..., np.newaxis]) ** 2).sum(axis=-1) + ((z2 - z2m[..., np.newaxis]) ** 2).sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w = (n1 + n2 - 2) * numer / denom
+    return spstats.f.sf(w, 1, n1 + n2 - 2)
+
+
 @significance_test
 def _ttest(fut, ref, *, p_change=0.05):
     """
@@ -508,22 +609,13 @@ def _ttest(fut, ref, *, p_change=0.05):
     Accepts argument p_change (float, default : 0.05) the p-value threshold for rejecting the hypothesis
     of no significant change.
     """
-
-    def _ttest_func(f, r):
-        # scipy>=1.9: popmean.axis[-1] must equal 1 for both fut and ref
-        if np.isnan(f).all() or np.isnan(r).all():
-            return np.nan
-
-        return spstats.ttest_1samp(f, r[..., np.newaxis], axis=-1, nan_policy="omit")[1]
-
     # Test hypothesis of no significant change
     pvals = xr.apply_ufunc(
-        _ttest_func,
+        _ttest_pvals,
         fut,
         ref.mean("time"),
         input_core_dims=[["time"], []],
         output_core_dims=[[]],
-        vectorize=True,
         dask="parallelized",
         output_dtypes=[float],
     )
@@ -539,22 +631,14 @@ def _welch_ttest(fut, ref, *, p_change=0.05):
 
     Same significance criterion and argument as 'ttest'.
     """
-
     # Test hypothesis of no significant change
-    # equal_var=False -> Welch's T-test
-    def wtt_wrapper(f, r):  # This specific test can't manage an all-NaN slice
-        if np.isnan(f).all() or np.isnan(r).all():
-            return np.nan
-        return spstats.ttest_ind(f, r, axis=-1, equal_var=False, nan_policy="omit")[1]
-
     pvals = xr.apply_ufunc(
-        wtt_wrapper,
+        _welch_ttest_pvals,
         fut,
         ref,
         input_core_dims=[["time"], ["time"]],
         output_core_dims=[[]],
         exclude_dims={"time"},
-        vectorize=True,
         dask="parallelized",
         output_dtypes=[float],
     )
@@ -565,26 +649,19 @@ def _welch_ttest(fut, ref, *, p_change=0.05):
 
 
 @significance_test
-def _mannwhitney_utest(ref, fut, *, p_change=0.05):
+def _mannwhitney_utest(fut, ref, *, p_change=0.05):
     """
     Two-sided Mann-Whiney U-test.
 
     Same significance criterion and argument as 'ttest'.
     """
-
-    def mwu_wrapper(f, r):  # This specific test can't manage an all-NaN slice
-        if np.isnan(f).all() or np.isnan(r).all():
-            return np.nan
-        return spstats.mannwhitneyu(f, r, axis=-1, nan_policy="omit")[1]
-
     pvals = xr.apply_ufunc(
-        mwu_wrapper,
+        _mannwhitney_utest_pvals,
         fut,
         ref,
         input_core_dims=[["time"], ["time"]],
         output_core_dims=[[]],
         exclude_dims={"time"},
-        vectorize=True,
         dask="parallelized",
         output_dtypes=[float],
     )
@@ -601,13 +678,12 @@ def _brownforsythe_test(fut, ref, *, p_change=0.05):
     Same significance criterion and argument as 'ttest'.
     """
     pvals = xr.apply_ufunc(
-        lambda f, r: spstats.levene(f, r, center="median")[1],
+        _brownforsythe_pvals,
         fut,
         ref,
         input_core_dims=[["time"], ["time"]],
         output_core_dims=[[]],
         exclude_dims={"time"},
-        vectorize=True,
         dask="parallelized",
         output_dtypes=[float],
     )
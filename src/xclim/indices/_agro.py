@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import warnings
-from typing import Literal, cast
+from typing import Literal
 
 import numpy as np
 import xarray
+from numba import boolean, float64, guvectorize, int64, njit, vectorize
 from scipy.stats import rv_continuous
 
-import xclim.indices.run_length as rl
 from xclim.core import DateStr, DayOfYearStr, Quantified
 from xclim.core.calendar import parse_offset, select_time
 from xclim.core.units import (
@@ -28,6 +28,8 @@ from xclim.indices._threshold import (
 from xclim.indices.generic import aggregate_between_dates, get_zones
 from xclim.indices.helpers import (
     _gather_lat,
+    _hourly_temperature,
+    _hourly_temperature_parameters,
     gladstones_day_length_latitude_coefficient,
     huglin_day_length_latitude_coefficient,
     jones_day_length_latitude_coefficient,
@@ -45,7 +47,9 @@ from xclim.indices.stats import standardized_index
 __all__ = [
     "biologically_effective_degree_days",
     "chill_portions",
+    "chill_portions_from_daily",
     "chill_units",
+    "chill_units_from_daily",
     "cool_night_index",
     "corn_heat_units",
     "dryness_index",
@@ -787,6 +791,198 @@ def latitude_temperature_index(
     return lti
 
 
+@njit(cache=True)
+def _first_run_in_bounds(run_positions, bounds, first, last):  # pragma: no cover
+    """
+    Position of the first run in the allowed days of a period.
+
+    As in the xarray version of `rain_season`, NaN is returned if all the allowed days have the same value.
+    """
+    first_run = -1
+    has_false = False
+    for i in range(first, last):
+        if bounds[i]:
+            if run_positions[i]:
+                if first_run == -1:
+                    first_run = i
+            else:
+                has_false = True
+    if first_run == -1 or not has_false:
+        return np.nan
+    return first_run
+
+
+@njit(cache=True)
+def _window_sum(pram, i, window, first):  # pragma: no cover
+    """Sum of `pram` over the `window` days ending on day `i`, NaN if incomplete or if any value is missing."""
+    if i - window + 1 < first:
+        return np.nan
+    total = 0.0
+    for j in range(i - window + 1, i + 1):
+        total += pram[j]
+    return total
+
+
+@guvectorize(
+    [
+        (
+            float64[:],
+            int64[:],
+            int64[:],
+            boolean[:],
+            boolean[:],
+            boolean[:],
+            float64[:],
+            float64,
+            int64,
+            int64,
+            float64,
+            int64,
+            boolean,
+            float64,
+            int64,
+            boolean,
+            float64[:],
+            float64[:],
+            float64[:],
+        )
+    ],
+    "(n),(n),(n),(n),(n),(n),(m),(),(),(),(),(),(),(),(),()->(m),(m),(m)",
+    nopython=True,
+    cache=True,
+)
+def _rain_season(
+    pram,
+    doy,
+    group,
+    search_start,
+    bounds_start,
+    bounds_end,
+    out_time,
+    thresh_wet_start,
+    window_wet_start,
+    window_not_dry_start,
+    thresh_dry_start,
+    window_dry_start,
+    total_dry_start,
+    thresh_dry_end,
+    window_dry_end,
+    total_dry_end,
+    start_out,
+    end_out,
+    length_out,
+):  # pragma: no cover
+    """
+    Compute the start, end and length of the rain season for each period, in a single pass over the time series.
+
+    Parameters
+    ----------
+    pram : array_like
+        Daily precipitation amount [mm].
+    doy : array_like
+        Day of year of each day.
+    group : array_like
+        Label of the period of each day, periods must be contiguous and labelled from 0 to m - 1.
+    search_start : array_like
+        Days where the conditions to start the season are evaluated.
+    bounds_start : array_like
+        Days when the season can start.
+    bounds_end : array_like
+        Days when the season can end.
+    out_time : array_like
+        Placeholder of size m, the number of periods.
+    thresh_wet_start, window_wet_start, window_not_dry_start, thresh_dry_start, window_dry_start : float or int
+        Parameters of the start of the season, see :py:func:`rain_season`.
+    total_dry_start : bool
+        Whether the dry sequences of the start of the season are defined by their total precipitation.
+    thresh_dry_end, window_dry_end : float or int
+        Parameters of the end of the season, see :py:func:`rain_season`.
+    total_dry_end : bool
+        Whether the dry sequences of the end of the season are defined by their total precipitation.
+
+    Returns
+    -------
+    start_out, end_out, length_out : array_like
+        Day of year of the start and the end of the rain season and its length, for each period.
+    """
+    n = pram.size
+    window_dry = 1 if total_dry_start else window_dry_start
+    window_run = window_not_dry_start + window_wet_start
+    # Work arrays, reused by all periods
+    masked = np.empty(n)
+    is_start = np.zeros(n, dtype=np.bool_)
+    dry_run = np.zeros(n + 1, dtype=np.int64)
+    events = np.zeros(n + 1, dtype=np.int64)
+    run_positions = np.zeros(n, dtype=np.bool_)
+
+    start_out[:] = np.nan
+    end_out[:] = np.nan
+    length_out[:] = np.nan
+
+    first = 0
+    while first < n:
+        last = first + 1
+        while last < n and group[last] == group[first]:
+            last += 1
+
+        # Start of the season
+        for i in range(first, last):
+            masked[i] = pram[i] if search_start[i] else np.nan
+        dry_run[last] = 0
+        for i in range(last - 1, first - 1, -1):
+            # First condition: enough precipitation, ending on day i
+            is_start[i] = _window_sum(masked, i, window_wet_start, first) >= thresh_wet_start
+            # Second condition: dry days (or dry sequences starting on day i), counted forward
+            if total_dry_start:
+                dry = (
+                    i + window_dry_start - 1 < last
+                    and _window_sum(masked, i + window_dry_start - 1, window_dry_start, first) <= thresh_dry_start
+                )
+            else:
+                dry = masked[i] <= thresh_dry_start
+            dry_run[i] = dry_run[i + 1] + 1 if dry else 0
+        # Runs start with the first condition and stop with a dry sequence
+        state = 0
+        for i in range(first, last):
+            if dry_run[i] >= window_dry:
+                state = 0
+            elif is_start[i]:
+                state = 1
+            events[i] = state
+        # Length of the runs, counted forward
+        events[last] = 0
+        for i in range(last - 1, first - 1, -1):
+            if events[i] == 1:
+                events[i] = events[i + 1] + 1
+        for i in range(first, last):
+            run_positions[i] = events[i] >= window_run and (i == first or events[i - 1] == 0)
+        start = _first_run_in_bounds(run_positions, bounds_start, first, last)
+
+        # End of the season, only searched after its start
+        for i in range(first, last):
+            masked[i] = pram[i] if (not np.isnan(start)) and i > start else np.nan
+        if total_dry_end:
+            for i in range(first, last):
+                run_positions[i] = _window_sum(masked, i, window_dry_end, first) <= thresh_dry_end
+        else:
+            dry_run[last] = 0
+            for i in range(last - 1, first - 1, -1):
+                dry_run[i] = dry_run[i + 1] + 1 if masked[i] <= thresh_dry_end else 0
+            for i in range(first, last):
+                run_positions[i] = dry_run[i] >= window_dry_end and (i == first or dry_run[i - 1] == 0)
+        end = _first_run_in_bounds(run_positions, bounds_end, first, last)
+
+        g = group[first]
+        if not np.isnan(start):
+            start_out[g] = doy[int(start)]
+            if np.isnan(end):
+                length_out[g] = last - start
+            else:
+                end_out[g] = doy[int(end)]
+                length_out[g] = end - start
+        first = last
+
+
 @declare_units(
     pr="[precipitation]",
     thresh_wet_start="[length]",
@@ -888,92 +1084,67 @@ def rain_season(
     ----------
     :cite:cts:`sivakumar_predicting_1998`
     """
+    if method_dry_start not in ["per_day", "total"]:
+        raise ValueError(f"Unknown method_dry_start: {method_dry_start}.")
+    if method_dry_end not in ["per_day", "total"]:
+        raise ValueError(f"Unknown method_dry_end: {method_dry_end}.")
+
     # Unit conversion.
     pram = rate2amount(pr, out_units="mm")
     thresh_wet_start = convert_units_to(thresh_wet_start, pram)
     thresh_dry_start = convert_units_to(thresh_dry_start, pram)
     thresh_dry_end = convert_units_to(thresh_dry_end, pram)
 
-    # should we flag date_min_end  < date_max_start?
-    def _get_first_run(run_positions, start_date, end_date):
-        run_positions = select_time(run_positions, date_bounds=(start_date, end_date))
-        first_start = run_positions.argmax("time")
-        return xarray.where(first_start != run_positions.argmin("time"), first_start, np.nan)
-
-    # Find the start of the rain season
-    def _get_first_run_start(_pram):
-        last_doy = _pram.indexes["time"][-1].strftime("%m-%d")
-        _pram = select_time(_pram, date_bounds=(date_min_start, last_doy))
-
-        # First condition: Start with enough precipitation
-        da_start = _pram.rolling({"time": window_wet_start}).sum() >= thresh_wet_start
-
-        # Second condition: No dry period after
-        if method_dry_start == "per_day":
-            da_stop = _pram <= thresh_dry_start
-            window_dry = window_dry_start
-        elif method_dry_start == "total":
-            da_stop = _pram.rolling({"time": window_dry_start}).sum() <= thresh_dry_start
-            # equivalent to rolling forward in time instead, i.e. end date will be at beginning of dry run
-            da_stop = da_stop.shift({"time": -(window_dry_start - 1)}, fill_value=False)
-            window_dry = 1
-        else:
-            raise ValueError(f"Unknown method_dry_start: {method_dry_start}.")
-
-        # First and second condition combined in a run length
-        events = rl.runs_with_holes(da_start, 1, da_stop, window_dry)
-        run_positions = rl.rle(events) >= (window_not_dry_start + window_wet_start)
-
-        return _get_first_run(run_positions, date_min_start, date_max_start)
-
-    # Find the end of the rain season
-    # FIXME: This function mixes local and parent-level variables. It should be refactored.
-    def _get_first_run_end(_pram):
-        if method_dry_end == "per_day":
-            da_stop = _pram <= thresh_dry_end
-            run_positions = rl.rle(da_stop) >= window_dry_end
-        elif method_dry_end == "total":
-            run_positions = _pram.rolling({"time": window_dry_end}).sum() <= thresh_dry_end
-        else:
-            raise ValueError(f"Unknown method_dry_end: {method_dry_end}.")
-        return _get_first_run(run_positions, date_min_end, date_max_end)
-
-    # Get start, end and length of rain season. Written as a function so it can be resampled
-    # FIXME: This function mixes local and parent-level variables. It should be refactored.
-    def _get_rain_season(_pram):
-        start = _get_first_run_start(_pram)
-
-        # masking value before  start of the season (end of season should be after)
-        # Get valid integer indexer of the day after the first run starts.
-        # `start != NaN` only possible if a condition on next few time steps is respected.
-        # Thus, `start+1` exists if `start != NaN`
-        start_ind = (start + 1).fillna(-1).astype(int)
-        mask = _pram * np.nan
-        # Put "True" on the day of run start
-        mask[{"time": start_ind}] = 1
-        # Mask back points without runs, propagate the True
-        mask = mask.where(start.notnull()).ffill("time")
-        mask = mask.notnull()
-        end = _get_first_run_end(_pram.where(mask))
-
-        length = xarray.where(end.notnull(), end - start, _pram["time"].size - start)
-
-        # converting to doy
-        crd = _pram.time.dt.dayofyear
-        start = rl.lazy_indexing(crd, start)
-        end = rl.lazy_indexing(crd, end)
-
-        _out = xarray.Dataset(
-            {
-                "rain_season_start": start,
-                "rain_season_end": end,
-                "rain_season_length": length,
-            }
-        )
-        return _out
-
-    # Compute rain season, attribute units
-    out = cast(xarray.Dataset, pram.resample(time=freq).map(_get_rain_season))
+    # Masks of the allowed days and labels of the resampling groups, only computed on the time coordinate.
+    # The search for the start of the season begins on `date_min_start` and goes up to the end of the period.
+    ones = xarray.ones_like(pram.time, dtype=float)
+    bounds_start = select_time(ones, date_bounds=(date_min_start, date_max_start)).notnull()
+    bounds_end = select_time(ones, date_bounds=(date_min_end, date_max_end)).notnull()
+    search_start = xarray.zeros_like(pram.time, dtype=bool)
+    group = xarray.full_like(pram.time, -1, dtype=np.int64)
+    groups = pram.time.resample(time=freq).groups
+    search_bounds = {}
+    for lbl, group_slice in enumerate(groups.values()):
+        group[group_slice] = lbl
+        last_doy = pram.indexes["time"][group_slice][-1].strftime("%m-%d")
+        if last_doy not in search_bounds:
+            search_bounds[last_doy] = select_time(ones, date_bounds=(date_min_start, last_doy)).notnull()
+        search_start[group_slice] = search_bounds[last_doy][group_slice]
+
+    if uses_dask(pram):
+        pram = pram.chunk(time=-1)
+    # Placeholder giving the number of periods to the kernel
+    out_time = xarray.DataArray(np.zeros(len(groups)), dims=("time_out",))
+    out = xarray.apply_ufunc(
+        _rain_season,
+        pram,
+        pram.time.dt.dayofyear,
+        group,
+        search_start,
+        bounds_start,
+        bounds_end,
+        out_time,
+        thresh_wet_start,
+        window_wet_start,
+        window_not_dry_start,
+        thresh_dry_start,
+        window_dry_start,
+        method_dry_start == "total",
+        thresh_dry_end,
+        window_dry_end,
+        method_dry_end == "total",
+        input_core_dims=[["time"]] * 6 + [["time_out"]] + [[]] * 9,
+        output_core_dims=[["time_out"]] * 3,
+        output_dtypes=[float] * 3,
+        dask="parallelized",
+    )
+    out = xarray.Dataset(
+        {
+            name: da.rename(time_out="time").assign_coords(time=list(groups.keys())).transpose("time", ...)
+            for name, da in zip(["rain_season_start", "rain_season_end", "rain_season_length"], out, strict=True)
+        }
+    )
+    out.time.attrs.update(pram.time.attrs)
     rain_season_start = out.rain_season_start.assign_attrs(units="", is_dayofyear=np.int32(1))
     rain_season_end = out.rain_season_end.assign_attrs(units="", is_dayofyear=np.int32(1))
     rain_season_length = out.rain_season_length.assign_attrs(units="days")
@@ -1439,23 +1610,29 @@ def _accumulate_intermediate(prev_E, prev_xi, curr_xs, curr_ak1):
     return curr_xs - (curr_xs - curr_S) * np.exp(-curr_ak1)
 
 
-def _chill_portion_one_season(tas_K):
-    """Computes the chill portion for a single season based on the dynamic model on a numpy array."""
-    # Constants as described in Luedeling et al. (2009)
-    E0 = 4153.5
-    E1 = 12888.8
-    A0 = 139500
-    A1 = 2.567e18
-    SLP = 1.6
-    TETMLT = 277
-    AA = A0 / A1
-    EE = E1 - E0
-
-    ftmprt = SLP * TETMLT * (tas_K - TETMLT) / tas_K
+# Constants of the dynamic model as described in Luedeling et al. (2009)
+_DYNAMIC_E0 = 4153.5
+_DYNAMIC_E1 = 12888.8
+_DYNAMIC_A0 = 139500
+_DYNAMIC_A1 = 2.567e18
+_DYNAMIC_SLP = 1.6
+_DYNAMIC_TETMLT = 277
+
+
+@njit(cache=True)
+def _dynamic_model_rates(tas_K):  # pragma: no cover
+    """Compute the transformation fraction and the rates of the dynamic model for temperatures in Kelvin."""
+    ftmprt = _DYNAMIC_SLP * _DYNAMIC_TETMLT * (tas_K - _DYNAMIC_TETMLT) / tas_K
     sr = np.exp(ftmprt)
     xi = sr / (1 + sr)
-    xs = AA * np.exp(EE / tas_K)
-    ak1 = A1 * np.exp(-E1 / tas_K)
+    xs = (_DYNAMIC_A0 / _DYNAMIC_A1) * np.exp((_DYNAMIC_E1 - _DYNAMIC_E0) / tas_K)
+    ak1 = _DYNAMIC_A1 * np.exp(-_DYNAMIC_E1 / tas_K)
+    return xi, xs, ak1
+
+
+def _chill_portion_one_season(tas_K):
+    """Computes the chill portion for a single season based on the dynamic model on a numpy array."""
+    xi, xs, ak1 = _dynamic_model_rates(tas_K)
 
     inter_E = np.zeros_like(tas_K)
     for i in range(1, tas_K.shape[-1]):
@@ -1534,6 +1711,125 @@ def chill_portions(tas: xarray.DataArray, freq: str = "YS", **indexer) -> xarray
     return resample_map(tas_K, "time", freq, _apply_chill_portion_one_season).assign_attrs(units="")
 
 
+@guvectorize(
+    [(float64[:], float64[:], float64[:], float64[:], int64[:], float64[:])],
+    "(n),(n),(n),(n),(n)->(n)",
+    nopython=True,
+    cache=True,
+)
+def _chill_portions_from_daily(tasmin, tasmax, next_tasmin, daylength, group, out):  # pragma: no cover
+    """
+    Compute the daily sums of chill portions, generating the hourly temperatures on the fly.
+
+    Parameters
+    ----------
+    tasmin : array_like
+        Daily minimum temperature [K].
+    tasmax : array_like
+        Daily maximum temperature [K].
+    next_tasmin : array_like
+        Minimum temperature of the following day [K].
+    daylength : array_like
+        Length of the day [h].
+    group : array_like
+        Label of the season of each day. The intermediate product is reset at the start of each season.
+
+    Returns
+    -------
+    array_like
+        Sum of the chill portions accumulated during each day.
+    """
+    inter_E = 0.0
+    prev_xi = 0.0
+    for d in range(tasmin.size):
+        new_season = d == 0 or group[d] != group[d - 1]
+        total = 0.0
+        for hour in range(24):
+            tas_K = _hourly_temperature(hour, tasmin[d], tasmax[d], next_tasmin[d], daylength[d])
+            xi, xs, ak1 = _dynamic_model_rates(tas_K)
+            if new_season:
+                inter_E = 0.0
+                new_season = False
+            else:
+                curr_S = inter_E if inter_E < 1 else inter_E - inter_E * prev_xi
+                inter_E = xs - (xs - curr_S) * np.exp(-ak1)
+            if inter_E >= 1:
+                total += inter_E * xi
+            prev_xi = xi
+        out[d] = total
+
+
+@declare_units(tasmin="[temperature]", tasmax="[temperature]")
+def chill_portions_from_daily(
+    tasmin: xarray.DataArray, tasmax: xarray.DataArray, freq: str = "YS", **indexer
+) -> xarray.DataArray:
+    r"""
+    Chill portion based on the dynamic model, computed from daily temperature extremes.
+
+    Equivalent to :py:func:`chill_portions` applied on the output of
+    :py:func:`xclim.indices.helpers.make_hourly_temperature`, but the hourly temperatures are generated on the fly,
+    without ever allocating the hourly array.
+
+    Parameters
+    ----------
+    tasmin : xr.DataArray
+        Daily minimum temperature.
+    tasmax : xr.DataArray
+        Daily maximum temperature.
+    freq : str
+        Resampling frequency.
+    **indexer : {dim: indexer}, optional
+        Indexing parameters to compute the indicator on a temporal subset of the data.
+        It accepts the same arguments as :py:func:`xclim.indices.generic.select_time`.
+
+    Returns
+    -------
+    xr.DataArray, [unitless]
+        Chill portions after the Dynamic Model.
+
+    Notes
+    -----
+    The latitude of the data is needed to compute the day lengths of the hourly temperature profile.
+    Days are selected with the `indexer` after the hourly profile parameters are computed, so that the last day of the
+    selection uses the minimum temperature of the following day, as with the hourly temperature.
+
+    References
+    ----------
+    :cite:cts:`fishman_chill_1987,luedeling_chill_2009`
+
+    Examples
+    --------
+    >>> from xclim.indices import chill_portions_from_daily
+    >>> tasmin = xr.open_dataset(path_to_tasmin_file).tasmin
+    >>> tasmax = xr.open_dataset(path_to_tasmax_file).tasmax
+    >>> cp = chill_portions_from_daily(tasmin, tasmax, date_bounds=("09-01", "03-30"), freq="YS-JUL")
+    """
+    tasmin = convert_units_to(tasmin, "K")
+    tasmax = convert_units_to(tasmax, tasmin)
+    params = select_time(_hourly_temperature_parameters(tasmin, tasmax), drop=True, **indexer)
+
+    # A unique integer for each resampling group, the accumulation restarts with each one
+    group = xarray.full_like(params.time, -1, dtype=np.int64)
+    for lbl, group_slice in enumerate(params.time.resample(time=freq).groups.values()):
+        group[group_slice] = lbl
+
+    if uses_dask(params):
+        params = params.chunk(time=-1)
+    daily = xarray.apply_ufunc(
+        _chill_portions_from_daily,
+        params.tasmin,
+        params.tasmax,
+        params.next_tasmin,
+        params.daylength,
+        group,
+        input_core_dims=[["time"]] * 5,
+        output_core_dims=[["time"]],
+        output_dtypes=[float],
+        dask="parallelized",
+    ).transpose(*params.tasmin.dims)
+    return daily.resample(time=freq).sum().assign_attrs(units="")
+
+
 @declare_units(tas="[temperature]")
 def chill_units(tas: xarray.DataArray, positive_only: bool = False, freq: str = "YS") -> xarray.DataArray:
     """
@@ -1570,17 +1866,18 @@ def chill_units(tas: xarray.DataArray, positive_only: bool = False, freq: str =
     >>> tas_hourly = make_hourly_temperature(tasmin, tasmax)
     >>> cu = chill_units(tasmin)
     """
-    tas = convert_units_to(tas, "degC")
+    # Convert the bounds of the model to the units of the hourly temperature, rather than the converse
+    t1, t2, t3, t4, t5, t6 = (convert_units_to(f"{t} degC", tas) for t in [1.4, 2.4, 9.1, 12.4, 15.9, 17.9])
     cu = xarray.where(
-        (tas <= 1.4) | ((tas > 12.4) & (tas <= 15.9)),
+        (tas <= t1) | ((tas > t4) & (tas <= t5)),
         0,
         xarray.where(
-            ((tas > 1.4) & (tas <= 2.4)) | ((tas > 9.1) & (tas <= 12.4)),
+            ((tas > t1) & (tas <= t2)) | ((tas > t3) & (tas <= t4)),
             0.5,
             xarray.where(
-                (tas > 2.4) & (tas <= 9.1),
+                (tas > t2) & (tas <= t3),
                 1,
-                xarray.where((tas > 15.9) & (tas <= 17.9), -0.5, -1),
+                xarray.where((tas > t5) & (tas <= t6), -0.5, -1),
             ),
         ),
     )
@@ -1590,3 +1887,95 @@ def chill_units(tas: xarray.DataArray, positive_only: bool = False, freq: str =
         daily = cu.resample(time="1D").sum()
         cu = daily.where(daily > 0)
     return cu.resample(time=freq).sum().assign_attrs(units="")
+
+
+@njit(cache=True)
+def _utah_chill_unit(tas):  # pragma: no cover
+    """Chill unit weight of the Utah model for a temperature in Celsius."""
+    if tas <= 1.4:
+        return 0.0
+    if tas <= 2.4:
+        return 0.5
+    if tas <= 9.1:
+        return 1.0
+    if tas <= 12.4:
+        return 0.5
+    if tas <= 15.9:
+        return 0.0
+    if tas <= 17.9:
+        return -0.5
+    return -1.0
+
+
+@vectorize(nopython=True)
+def _daily_chill_units(tasmin, tasmax, next_tasmin, daylength):  # pragma: no cover
+    """Sum of the hourly chill units of a day, generating the hourly temperatures [°C] on the fly."""
+    total = 0.0
+    for hour in range(24):
+        tas = _hourly_temperature(hour, tasmin, tasmax, next_tasmin, daylength)
+        if not np.isnan(tas):
+            total += _utah_chill_unit(tas)
+    return total
+
+
+@declare_units(tasmin="[temperature]", tasmax="[temperature]")
+def chill_units_from_daily(
+    tasmin: xarray.DataArray,
+    tasmax: xarray.DataArray,
+    positive_only: bool = False,
+    freq: str = "YS",
+) -> xarray.DataArray:
+    """
+    Chill units using the Utah model, computed from daily temperature extremes.
+
+    Equivalent to :py:func:`chill_units` applied on the output of
+    :py:func:`xclim.indices.helpers.make_hourly_temperature`, but the hourly temperatures are generated on the fly,
+    without ever allocating the hourly array.
+
+    Parameters
+    ----------
+    tasmin : xr.DataArray
+        Daily minimum temperature.
+    tasmax : xr.DataArray
+        Daily maximum temperature.
+    positive_only : bool
+        If `True`, only positive daily chill units are aggregated.
+    freq : str
+        Resampling frequency.
+
+    Returns
+    -------
+    xr.DataArray, [unitless]
+        Chill units using the Utah model.
+
+    Notes
+    -----
+    The latitude of the data is needed to compute the day lengths of the hourly temperature profile.
+
+    References
+    ----------
+    :cite:cts:`richardson_chill_1974`
+
+    Examples
+    --------
+    >>> from xclim.indices import chill_units_from_daily
+    >>> tasmin = xr.open_dataset(path_to_tasmin_file).tasmin
+    >>> tasmax = xr.open_dataset(path_to_tasmax_file).tasmax
+    >>> cu = chill_units_from_daily(tasmin, tasmax)
+    """
+    tasmin = convert_units_to(tasmin, "degC")
+    tasmax = convert_units_to(tasmax, tasmin)
+    params = _hourly_temperature_parameters(tasmin, tasmax)
+
+    cu = xarray.apply_ufunc(
+        _daily_chill_units,
+        params.tasmin,
+        params.tasmax,
+        params.next_tasmin,
+        params.daylength,
+        dask="parallelized",
+        output_dtypes=[float],
+    )
+    if positive_only:
+        cu = cu.where(cu > 0)
+    return cu.resample(time=freq).sum().assign_attrs(units="")
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import math
 from functools import partial
 
 import numpy as np
-import pandas as pd
 import xarray
+from numba import float64, guvectorize, int64, njit
 from scipy.stats import circmean, rv_continuous
 from xarray import DataArray
 
@@ -14,16 +15,12 @@ from xclim.core._types import DateStr, Quantified
 from xclim.core.calendar import get_calendar
 from xclim.core.missing import at_least_n_valid
 from xclim.core.units import convert_units_to, declare_units, rate2amount, to_agg_units
+from xclim.core.utils import cast_to_preserved_dtype, uses_dask
 from xclim.indices.generic import threshold_count
 from xclim.indices.stats import standardized_index
 
 from . import generic
 
-try:
-    import pymannkendall as mk
-except ImportError:
-    mk = None
-
 __all__ = [
     "antecedent_precipitation_index",
     "aridity_index",
@@ -670,8 +667,75 @@ def low_flow_frequency(q: xarray.DataArray, threshold_factor: float = 0.2, freq:
     return to_agg_units(out, q, "count", deffreq="D")
 
 
-@declare_units(pr="[precipitation]")
-def antecedent_precipitation_index(pr: xarray.DataArray, window: int = 7, p_exp: float = 0.935) -> xarray.DataArray:
+@guvectorize(
+    [(float64[:], int64, float64, float64[:])],
+    "(n),(),()->(n)",
+    nopython=True,
+    cache=True,
+)
+def _antecedent_precipitation(pr, window, p_exp, out):  # pragma: no cover
+    """
+    Compute the weighted moving sum of precipitation in a single pass.
+
+    The sum is carried from one day to the next when `p_exp` is lower or equal to 1 and computed for each window
+    otherwise.
+
+    Parameters
+    ----------
+    pr : array_like
+        Daily precipitation amounts.
+    window : int
+        Number of days in the moving window.
+    p_exp : float
+        Weighting exponent, the weight of the amount `k` days before the current day is `p_exp ** k`.
+
+    Returns
+    -------
+    out : array_like
+        Antecedent precipitation index, NaN for the first `window - 1` days and where the window has missing values.
+    """
+    if p_exp > 1:
+        # Carrying the sum would multiply its rounding errors by `p_exp` every day, each window is summed instead.
+        weights = p_exp ** np.arange(window).astype(np.float64)
+        for t in range(pr.size):
+            if t < window - 1:
+                out[t] = np.nan
+            else:
+                out[t] = 0.0
+                for k in range(window):
+                    out[t] += weights[k] * pr[t - k]
+        return
+
+    # The weighted sum of the window is carried from one day to the next: the previous sum is discounted by `p_exp`,
+    # the amount of the day is added and the amount leaving the window is removed with its weight `p_exp ** window`.
+    # Missing amounts are not summed, but counted, the index is missing while they are in the window.
+    p_window = p_exp ** float(window)
+    total = 0.0
+    nmissing = 0
+    for t in range(pr.size):
+        total *= p_exp
+        if np.isnan(pr[t]):
+            nmissing += 1
+        else:
+            total += pr[t]
+        if t >= window:
+            if np.isnan(pr[t - window]):
+                nmissing -= 1
+            else:
+                total -= p_window * pr[t - window]
+        if t < window - 1 or nmissing > 0:
+            out[t] = np.nan
+        else:
+            out[t] = total
+
+
+@declare_units(pr="[precipitation]", pr0="[precipitation]")
+def antecedent_precipitation_index(
+    pr: xarray.DataArray,
+    window: int = 7,
+    p_exp: float = 0.935,
+    pr0: xarray.DataArray | None = None,
+) -> xarray.DataArray:
     """
     Antecedent Precipitation Index.
 
@@ -686,23 +750,49 @@ def antecedent_precipitation_index(pr: xarray.DataArray, window: int = 7, p_exp:
         Window for the days of precipitation data to be weighted and summed, default is 7.
     p_exp : float
         Weighting exponent, default is 0.935.
+    pr0 : xarray.DataArray, optional
+        Daily precipitation data of the days directly preceding `pr`. Only the last `window - 1` days are used,
+        to fill the window of the first days of `pr`. This allows to update the index as new data becomes
+        available, without recomputing it over the whole record. If None (default), the index is NaN for the
+        first `window - 1` days.
 
     Returns
     -------
     xarray.DataArray
         Antecedent Precipitation Index.
 
+    Notes
+    -----
+    The weighted sum is computed in a single pass over the time series with a compiled kernel. As such, the time
+    dimension must not be chunked when dask arrays are used. For usual values of `p_exp`, lower or equal to 1, the sum
+    is carried from one day to the next. Larger values would amplify the rounding errors of the carried sum, the sum of
+    each window is then computed directly.
+
     References
     ----------
         :cite:cts:`schroter2015,li2021`
     """
+    nprev = 0
+    if pr0 is not None and window > 1:
+        pr0 = convert_units_to(pr0, pr, context="hydro").isel(time=slice(-(window - 1), None))
+        nprev = pr0.time.size
+        pr = xarray.concat([pr0, pr], dim="time")
     pr = rate2amount(pr)
     pr = convert_units_to(pr, "mm", context="hydro")
-    weights = xarray.DataArray(
-        list(reversed([p_exp ** (idx - 1) for idx in range(1, window + 1)])),
-        dims="window_dim",
-    )
-    out = pr.rolling(time=window).construct("window_dim").dot(weights)
+    if uses_dask(pr):
+        pr = pr.chunk(time=-1)
+
+    out = xarray.apply_ufunc(
+        _antecedent_precipitation,
+        pr,
+        window,
+        p_exp,
+        input_core_dims=[["time"], [], []],
+        output_core_dims=[["time"]],
+        dask="parallelized",
+        output_dtypes=[float],
+    ).transpose(*pr.dims)
+    out = cast_to_preserved_dtype(out, pr).isel(time=slice(nprev, None))
     out.attrs["units"] = "mm"
     return out
 
@@ -932,6 +1022,114 @@ def lag_snowpack_flow_peaks(
     return lag
 
 
+@njit(cache=True)
+def _sort_count_inversions(x):  # pragma: no cover
+    """Sort `x` in place with a bottom-up merge sort and return the number of pairs i < j with x[i] > x[j]."""
+    n = x.size
+    buffer = np.empty_like(x)
+    inversions = 0
+    width = 1
+    while width < n:
+        for lo in range(0, n - width, 2 * width):
+            mid = lo + width
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                # Ties are taken from the left, so that they are not counted as inversions
+                if x[i] <= x[j]:
+                    buffer[k] = x[i]
+                    i += 1
+                else:
+                    buffer[k] = x[j]
+                    j += 1
+                    inversions += mid - i
+                k += 1
+            buffer[k : k + mid - i] = x[i:mid]
+            k += mid - i
+            buffer[k : k + hi - j] = x[j:hi]
+            x[lo:hi] = buffer[lo:hi]
+        width *= 2
+    return inversions
+
+
+@guvectorize(
+    [(float64[:], float64[:], float64[:])],
+    "(n)->(),()",
+    nopython=True,
+    cache=True,
+)
+def _mann_kendall_sen(x, slope, p_value):  # pragma: no cover
+    """
+    Compute the Mann-Kendall test and the Theil-Sen slope estimator of a time series.
+
+    Missing values are skipped in the test, while the slopes are computed with the original time steps,
+    as in :py:func:`pymannkendall.original_test`.
+
+    Parameters
+    ----------
+    x : array_like
+        Time series.
+
+    Returns
+    -------
+    slope : float
+        Median of the slopes between all pairs of valid values.
+    p_value : float
+        Two-sided p-value of the Mann-Kendall test, with the variance corrected for ties.
+    """
+    valid = x[~np.isnan(x)].copy()
+    n = valid.size
+
+    # Kendall's S is the number of concordant pairs minus the number of discordant pairs.
+    # Pairs are sorted by time, so the discordant pairs are the inversions of the series.
+    discordant = _sort_count_inversions(valid)
+    tied_pairs = 0
+    ties_correction = 0.0
+    i = 0
+    while i < n:
+        t = 1
+        while i + t < n and valid[i + t] == valid[i]:
+            t += 1
+        tied_pairs += t * (t - 1) // 2
+        ties_correction += t * (t - 1) * (2 * t + 5)
+        i += t
+    s = n * (n - 1) // 2 - tied_pairs - 2 * discordant
+    var_s = (n * (n - 1) * (2 * n + 5) - ties_correction) / 18
+
+    if s > 0:
+        z = (s - 1) / np.sqrt(var_s)
+    elif s < 0:
+        z = (s + 1) / np.sqrt(var_s)
+    else:
+        z = 0.0
+    p_value[0] = math.erfc(abs(z) / np.sqrt(2))
+
+    slopes = np.empty(n * (n - 1) // 2)
+    k = 0
+    for i in range(x.size - 1):
+        if np.isnan(x[i]):
+            continue
+        for j in range(i + 1, x.size):
+            if not np.isnan(x[j]):
+                slopes[k] = (x[j] - x[i]) / (j - i)
+                k += 1
+    slope[0] = np.median(slopes) if k > 0 else np.nan
+
+
+def _mann_kendall_sen_test(x: xarray.DataArray, dim: str) -> tuple[xarray.DataArray, xarray.DataArray]:
+    """Apply the Mann-Kendall test and compute the Theil-Sen slope along `dim`, see :py:func:`_mann_kendall_sen`."""
+    if uses_dask(x):
+        x = x.chunk({dim: -1})
+    return xarray.apply_ufunc(
+        _mann_kendall_sen,
+        x,
+        input_core_dims=[[dim]],
+        output_core_dims=[[], []],
+        output_dtypes=[float, float],
+        dask="parallelized",
+    )
+
+
 @declare_units(q="[discharge]")
 def sen_slope(
     q: xarray.DataArray,
@@ -946,9 +1144,9 @@ def sen_slope(
     Parameters
     ----------
     q : xarray.DataArray
-        Observed streamflow vector.
+        Observed streamflow.
     qsim : xarray.DataArray
-        Simulated streamflow vector.
+        Simulated streamflow.
 
     Returns
     -------
@@ -966,6 +1164,9 @@ def sen_slope(
     - The ratio of observed Sen_slope over simulated Sen_slope is considered
       acceptable within the range 0.5–2 and is optimal when equal to 1
       (Sauquet et al., 2025).
+    - The statistics are computed independently for each point of multidimensional inputs. They follow
+      :py:func:`pymannkendall.original_test`: missing values are skipped and the variance of the Mann-Kendall
+      statistic is corrected for ties.
 
     References
     ----------
@@ -973,7 +1174,7 @@ def sen_slope(
     """
     seasons = ["DJF", "MAM", "JJA", "SON", "Year"]
 
-    def compute_seasonal_stats(x: xarray.DataArray) -> tuple[list, list]:
+    def compute_seasonal_stats(x: xarray.DataArray) -> tuple[xarray.DataArray, xarray.DataArray]:
         """
         Seasonal statistics.
 
@@ -984,67 +1185,50 @@ def sen_slope(
 
         Returns
         -------
-        tuple of list
-            Lists containing the following variables:
+        tuple of xarray.DataArray
+            Arrays along the "season" dimension containing the following variables:
 
             - ``Sen_slope`` : Sen's slope estimates for seasonal and yearly averages.
             - ``p_value`` : Mann–Kendall metric indicating slope tendency.
         """
-        if mk is None:
-            msg = f"{sen_slope.__name__} requires access to the `pymannkendall` library."
-            raise ModuleNotFoundError(msg)
-
-        # Convert to pandas Series with DatetimeIndex
         x_year = x.resample(time="YS-DEC").mean()
         x_season = x.resample(time="QS-DEC").mean()
 
-        x_series = x_season.to_series()
-
-        # Create a MultiIndex: year + season (0–3)
-        season_index = (
-            x_series.index.month % 12 // 3  # 0 for DJF, 1 for MAM, etc.
+        # Reshape to (..., year, season), with seasons 0 for DJF, 1 for MAM, etc.
+        x_season = (
+            x_season.assign_coords(year=x_season.time.dt.year, season=x_season.time.dt.month % 12 // 3)
+            .set_index(time=["year", "season"])
+            .unstack("time")
+            .reindex(season=range(4))
         )
-        x_df = pd.DataFrame({"value": x_series.values, "season": season_index, "year": x_series.index.year})
-        #  Pivot to shape (n_years, 4 seasons)
-        df_seasons = x_df.pivot(index="season", columns="year", values="value")
 
-        # rename columns
-        df_seasons.index = ["DJF", "MAM", "JJA", "SON"]
+        slopes_season, p_vals_season = _mann_kendall_sen_test(x_season, "year")
+        slopes_year, p_vals_year = _mann_kendall_sen_test(x_year, "time")
 
-        ss_DJF = mk.original_test(df_seasons.iloc[0])
-        ss_MAM = mk.original_test(df_seasons.iloc[1])
-        ss_JJA = mk.original_test(df_seasons.iloc[2])
-        ss_SON = mk.original_test(df_seasons.iloc[3])
-        ss_an = mk.original_test(x_year)
-
-        _slopes = [ss_DJF.slope, ss_MAM.slope, ss_JJA.slope, ss_SON.slope, ss_an.slope]
-        _p_vals = [ss_DJF.p, ss_MAM.p, ss_JJA.p, ss_SON.p, ss_an.p]
-
-        return _slopes, _p_vals
+        _slopes = xarray.concat([slopes_season, slopes_year.expand_dims(season=[4])], "season")
+        _p_vals = xarray.concat([p_vals_season, p_vals_year.expand_dims(season=[4])], "season")
+        return (
+            _slopes.assign_coords(season=seasons).transpose("season", ...),
+            _p_vals.assign_coords(season=seasons).transpose("season", ...),
+        )
 
     if qsim is not None:
         slopes, p_vals = compute_seasonal_stats(q)
         slopes_sim, p_vals_sim = compute_seasonal_stats(qsim)
-        slopes_np = np.array(slopes)
-        slopes_sim_np = np.array(slopes_sim)
-        ratio = slopes_np / slopes_sim_np
         ds = xarray.Dataset(
             data_vars={
-                "Sen_slope_obs": ("season", slopes),
-                "p_value_obs": ("season", p_vals),
-                "Sen_slope_sim": ("season", slopes_sim),
-                "p_value_sim": ("season", p_vals_sim),
-                "ratio": ("season", ratio),
+                "Sen_slope_obs": slopes,
+                "p_value_obs": p_vals,
+                "Sen_slope_sim": slopes_sim,
+                "p_value_sim": p_vals_sim,
+                "ratio": slopes / slopes_sim,
             },
-            coords={"season": seasons},
         )
 
     else:
         slopes, p_vals = compute_seasonal_stats(q)
         # Create labeled xarray
-        ds = xarray.Dataset(
-            data_vars={"Sen_slope": ("season", slopes), "p_value": ("season", p_vals)}, coords={"season": seasons}
-        )
+        ds = xarray.Dataset(data_vars={"Sen_slope": slopes, "p_value": p_vals})
 
     # Assign empty units to all variables
     for var in ds.data_vars:
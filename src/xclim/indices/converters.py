@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import warnings
 from collections import namedtuple
+from collections.abc import Callable, Sequence
 from typing import cast
 
 import numpy as np
 import xarray as xr
-from numba import vectorize
+from numba import boolean, float32, float64, int64, njit, vectorize
 
 from xclim.core import Quantified
 from xclim.core.units import (
@@ -24,6 +25,7 @@ from xclim.core.units import (
     rate2flux,
     units2pint,
 )
+from xclim.core.utils import cast_to_preserved_dtype
 from xclim.indices.helpers import (
     _gather_lat,
     _gather_lon,
@@ -46,6 +48,7 @@ __all__ = [
     "longwave_upwelling_radiation_from_net_downwelling",
     "mean_radiant_temperature",
     "potential_evapotranspiration",
+    "potential_evapotranspiration_methods",
     "prsn_to_prsnd",
     "prsnd_to_prsn",
     "rain_approximation",
@@ -72,6 +75,31 @@ __all__ = [
 ]
 
 
+@vectorize(
+    [float32(float32, float32, float64), float64(float64, float64, float64)],
+    nopython=True,
+    cache=True,
+)
+def _humidex_from_dewpoint(tas, tdps, scale):  # pragma: no cover
+    """Humidex from the temperature, the dewpoint in K and the scale of a °C difference in the units of `tas`."""
+    # Vapour pressure in hPa
+    e = 6.112 * np.exp(5417.7530 * (1 / 273.16 - 1.0 / np.float64(tdps)))
+    return tas + scale * (5 / 9 * (e - 10))
+
+
+@vectorize(
+    [float32(float32, float32, float32, float64), float64(float64, float64, float64, float64)],
+    nopython=True,
+    cache=True,
+)
+def _humidex_from_relative_humidity(tas, tas_C, hurs, scale):  # pragma: no cover
+    """Humidex from the temperature, the temperature in °C, the relative humidity in % and the scale of `tas`."""
+    t = np.float64(tas_C)
+    # Vapour pressure in hPa
+    e = hurs / 100 * 6.112 * 10 ** (7.5 * t / (t + 237.7))
+    return tas + scale * (5 / 9 * (e - 10))
+
+
 @declare_units(tas="[temperature]", tdps="[temperature]", hurs="[]")
 def humidex(
     tas: xr.DataArray,
@@ -143,35 +171,48 @@ def humidex(
     if (tdps is None) and (hurs is None):
         raise ValueError("At least one of `tdps` or `hurs` must be given.")
 
-    # Vapour pressure in hPa
+    # The temperature delta due to humidity is computed in delta_degC, get its scale in the delta units of `tas`
+    du = cast(xr.DataArray, (1 * units2pint(tas) - 0 * units2pint(tas))).units
+    scale = float(convert_units_to(xr.DataArray(1.0, attrs={"units": "delta_degree_Celsius"}), du))
+
     if tdps is not None:
         # Convert dewpoint temperature to Kelvins
         tdps_K = convert_units_to(tdps, "kelvin")
-        e = 6.112 * np.exp(5417.7530 * (1 / 273.16 - 1.0 / tdps_K))
-
-    elif hurs is not None:
+        out = _apply_converter_kernel(_humidex_from_dewpoint, tas, tdps_K, scale)
+    else:
         # Convert dry bulb temperature to Celsius
         tas_C = convert_units_to(tas, "celsius")
         hurs_pct = convert_units_to(hurs, "%")
-        e = hurs_pct / 100 * 6.112 * 10 ** (7.5 * tas_C / (tas_C + 237.7))
-
-    else:
-        raise ValueError("Either `tdps` or `hurs` must be provided.")
-
-    # Temperature delta due to humidity in delta_degC
-    h: xr.DataArray = 5 / 9 * (e - 10)
-    h = h.assign_attrs(units="delta_degree_Celsius")
-
-    # Get delta_units for output
-    du = cast(xr.DataArray, (1 * units2pint(tas) - 0 * units2pint(tas))).units
-    h = convert_units_to(h, du)
+        out = _apply_converter_kernel(_humidex_from_relative_humidity, tas, tas_C, hurs_pct, scale)
 
-    # Add the delta to the input temperature
-    out = h + tas
     out = out.assign_attrs(units=tas.units)
     return out
 
 
+@vectorize(
+    [float32(float32, float32), float64(float64, float64)],
+    nopython=True,
+    cache=True,
+)
+def _heat_index(tas, hurs):  # pragma: no cover
+    """Heat index in °C from the temperature in °C and relative humidity in %. See :py:func:`heat_index`."""
+    t = np.float64(tas)
+    r = np.float64(hurs)
+    if np.isnan(t) or t <= 20:
+        return np.nan
+    return (
+        -8.78469475556
+        + 1.61139411 * t
+        + 2.33854883889 * r
+        - 0.14611605 * t * r
+        - 0.012308094 * t * t
+        - 0.0164248277778 * r * r
+        + 0.002211732 * t * t * r
+        + 0.00072546 * t * r * r
+        - 0.000003582 * t * t * r * r
+    )
+
+
 @declare_units(tas="[temperature]", hurs="[]")
 def heat_index(tas: xr.DataArray, hurs: xr.DataArray) -> xr.DataArray:
     r"""
@@ -203,22 +244,10 @@ def heat_index(tas: xr.DataArray, hurs: xr.DataArray) -> xr.DataArray:
     ----------
     :cite:cts:`blazejczyk_comparison_2012`
     """
-    thresh = 20  # degC
     t = convert_units_to(tas, "degC")
-    t = t.where(t > thresh)
     r = convert_units_to(hurs, "%")
 
-    out = (
-        -8.78469475556
-        + 1.61139411 * t
-        + 2.33854883889 * r
-        - 0.14611605 * t * r
-        - 0.012308094 * t * t
-        - 0.0164248277778 * r * r
-        + 0.002211732 * t * t * r
-        + 0.00072546 * t * r * r
-        - 0.000003582 * t * t * r * r
-    )
+    out = _apply_converter_kernel(_heat_index, t, r)
     out = out.assign_attrs(units="degC")
     return convert_units_to(out, tas.units)
 
@@ -407,30 +436,69 @@ Where :math:`T` is the air temperature in K and :math:`T_0` is the freezing temp
 """
 
 
-def _saturation_vapor_pressure_over_water(tas: xr.DataArray, method: str) -> xr.DataArray:
-    """Saturation vapor pressure with reference to water."""
-    e_sat: xr.DataArray
+# Saturation vapour pressure formulas, as identified in the kernels below.
+# The August-Roche-Magnus ones follow the others in the order of ESAT_FORMULAS_COEFFICIENTS.
+_ESAT_METHODS = ["sonntag90", "goffgratch46", "its90", *ESAT_FORMULAS_COEFFICIENTS]
+_ESAT_ARM_COEFFICIENTS = np.array([[coeffs["water"], coeffs["ice"]] for coeffs in ESAT_FORMULAS_COEFFICIENTS.values()])
+# Identifiers of the treatments of invalid values in the kernels below.
+_INVALID_VALUES = {None: 0, "clip": 1, "mask": 2}
+
+
+def _saturation_vapor_pressure_parameters(
+    method: str,
+    ice_thresh: Quantified | None,
+    interp_power: float | None,
+    water_thresh: Quantified,
+) -> tuple[int, int, float, float, float]:
+    """
+    Parameters of the saturation vapour pressure kernels.
+
+    Returns the identifiers of the formulas with reference to water and ice, the ice and water thresholds in K
+    and the interpolation power. A NaN threshold or power means it is not used, see :py:func:`_e_sat`.
+    """
+    # Dropped explicit support of 4 letter codes, but don't want a breaking change
+    method = {"TE30": "tetens30", "GG46": "goffgratch46", "SO90": "sonntag90"}.get(method, method)
+    method = method.casefold()
     if method == "ecmwf":
-        method = "buck81"
-    if method == "sonntag90":
-        e_sat = 100 * np.exp(
-            -6096.9385 / tas  # type: ignore
+        water, ice = _ESAT_METHODS.index("buck81"), _ESAT_METHODS.index("aerk96")
+    elif method in _ESAT_METHODS:
+        water = ice = _ESAT_METHODS.index(method)
+    else:
+        valid = ["sonntag90", "goffgratch46", "its90", "ecmwf"] + list(ESAT_FORMULAS_COEFFICIENTS.keys())
+        raise ValueError(f"Method {method} is not in {valid}")
+
+    if ice_thresh is None:
+        if interp_power is not None:
+            raise ValueError("`ice_thresh` must be given when `interp_power` is.")
+        return water, ice, np.nan, np.nan, np.nan
+    ice_thresh = convert_units_to(ice_thresh, "K")
+    if interp_power is None:
+        return water, ice, ice_thresh, np.nan, np.nan
+    return water, ice, ice_thresh, convert_units_to(water_thresh, "K"), interp_power
+
+
+@njit(cache=True)
+def _saturation_vapor_pressure_over_water(tas, method):  # pragma: no cover
+    """Saturation vapor pressure with reference to water, `method` is an index of `_ESAT_METHODS`."""
+    if method == 0:  # sonntag90
+        return 100 * np.exp(
+            -6096.9385 / tas
             + 16.635794
-            + -2.711193e-2 * tas  # type: ignore
+            + -2.711193e-2 * tas
             + 1.673952e-5 * tas**2
             + 2.433502 * np.log(tas)  # numpy's log is ln
         )
-    elif method == "goffgratch46":
+    if method == 1:  # goffgratch46
         Tb = 373.16  # Water boiling temp [K]
         eb = 101325  # e_sat at Tb [Pa]
-        e_sat = eb * 10 ** (  # type: ignore
-            -7.90298 * ((Tb / tas) - 1)  # type: ignore
-            + 5.02808 * np.log10(Tb / tas)  # type: ignore
+        return eb * 10 ** (
+            -7.90298 * ((Tb / tas) - 1)
+            + 5.02808 * np.log10(Tb / tas)
             + -1.3817e-7 * (10 ** (11.344 * (1 - tas / Tb)) - 1)
-            + 8.1328e-3 * (10 ** (-3.49149 * ((Tb / tas) - 1)) - 1)  # type: ignore
-        )  # type: ignore
-    elif method == "its90":
-        e_sat = np.exp(
+            + 8.1328e-3 * (10 ** (-3.49149 * ((Tb / tas) - 1)) - 1)
+        )
+    if method == 2:  # its90
+        return np.exp(
             -2836.5744 / tas**2
             + -6028.076559 / tas
             + 19.54263612
@@ -440,38 +508,23 @@ def _saturation_vapor_pressure_over_water(tas: xr.DataArray, method: str) -> xr.
             + -1.8680009e-13 * tas**4
             + 2.7150305 * np.log(tas)
         )
-    elif method in ESAT_FORMULAS_COEFFICIENTS:
-        A, B, C = ESAT_FORMULAS_COEFFICIENTS[method]["water"]
-        e_sat = A * np.exp(B * (tas - 273.16) / (tas + C))
-    else:
-        valid = ["sonntag90", "goffgratch46", "its90", "ecmwf"] + list(ESAT_FORMULAS_COEFFICIENTS.keys())
-        raise ValueError(f"Method {method} is not in {valid}")
-    return e_sat
+    A, B, C = _ESAT_ARM_COEFFICIENTS[method - 3, 0]
+    return A * np.exp(B * (tas - 273.16) / (tas + C))
 
 
-def _saturation_vapor_pressure_over_ice(tas: xr.DataArray, method: str) -> xr.DataArray:
-    """Saturation vapor pressure with reference to ice."""
-    e_sat: xr.DataArray
-    if method == "ecmwf":
-        method = "aerk96"
-    if method in "sonntag90":
-        e_sat = 100 * np.exp(
-            -6024.5282 / tas  # type: ignore
-            + 24.7219
-            + 1.0613868e-2 * tas  # type: ignore
-            + -1.3198825e-5 * tas**2
-            + -0.49382577 * np.log(tas)
+@njit(cache=True)
+def _saturation_vapor_pressure_over_ice(tas, method):  # pragma: no cover
+    """Saturation vapor pressure with reference to ice, `method` is an index of `_ESAT_METHODS`."""
+    if method == 0:  # sonntag90
+        return 100 * np.exp(
+            -6024.5282 / tas + 24.7219 + 1.0613868e-2 * tas + -1.3198825e-5 * tas**2 + -0.49382577 * np.log(tas)
         )
-    elif method in "goffgratch46":
+    if method == 1:  # goffgratch46
         Tp = 273.16  # Triple-point temperature [K]
         ep = 611.73  # e_sat at Tp [Pa]
-        e_sat = ep * 10 ** (  # type: ignore
-            -9.09718 * ((Tp / tas) - 1)  # type: ignore
-            + -3.56654 * np.log10(Tp / tas)  # type: ignore
-            + 0.876793 * (1 - tas / Tp)  # type: ignore
-        )  # type: ignore
-    elif method in "its90":
-        e_sat = np.exp(
+        return ep * 10 ** (-9.09718 * ((Tp / tas) - 1) + -3.56654 * np.log10(Tp / tas) + 0.876793 * (1 - tas / Tp))
+    if method == 2:  # its90
+        return np.exp(
             -5866.6426 / tas
             + 22.32870244
             + 1.39387003e-2 * tas
@@ -479,13 +532,66 @@ def _saturation_vapor_pressure_over_ice(tas: xr.DataArray, method: str) -> xr.Da
             + 2.7040955e-8 * tas**3
             + 6.7063522e-1 * np.log(tas)
         )
-    elif method in ESAT_FORMULAS_COEFFICIENTS:
-        A, B, C = ESAT_FORMULAS_COEFFICIENTS[method]["ice"]
-        e_sat = A * np.exp(B * (tas - 273.16) / (tas + C))
-    else:
-        valid = ["sonntag90", "goffgratch46", "its90", "ecmwf"] + list(ESAT_FORMULAS_COEFFICIENTS.keys())
-        raise ValueError(f"Method {method} is not in {valid}")
-    return e_sat
+    A, B, C = _ESAT_ARM_COEFFICIENTS[method - 3, 1]
+    return A * np.exp(B * (tas - 273.16) / (tas + C))
+
+
+@njit(cache=True)
+def _e_sat(tas, water, ice, ice_thresh, water_thresh, interp_power):  # pragma: no cover
+    """
+    Saturation vapor pressure in Pa of a temperature in K, see :py:func:`saturation_vapor_pressure`.
+
+    All values are computed with reference to water if `ice_thresh` is NaN. Otherwise, there is a binary transition
+    between both references if `interp_power` is NaN and an interpolation between `ice_thresh` and `water_thresh`
+    if it is not.
+    """
+    if np.isnan(ice_thresh):
+        return _saturation_vapor_pressure_over_water(tas, water)
+    if np.isnan(interp_power):
+        if tas > ice_thresh:
+            return _saturation_vapor_pressure_over_water(tas, water)
+        return _saturation_vapor_pressure_over_ice(tas, ice)
+    if tas < ice_thresh:
+        return _saturation_vapor_pressure_over_ice(tas, ice)
+    if tas > water_thresh:
+        return _saturation_vapor_pressure_over_water(tas, water)
+    alpha = ((tas - ice_thresh) / (water_thresh - ice_thresh)) ** interp_power
+    e_sat_w = _saturation_vapor_pressure_over_water(tas, water)
+    e_sat_i = _saturation_vapor_pressure_over_ice(tas, ice)
+    return alpha * e_sat_w + (1 - alpha) * e_sat_i
+
+
+@njit(cache=True)
+def _treat_invalid(value, lower, upper, invalid):  # pragma: no cover
+    """Clip (`invalid` = 1) or mask (`invalid` = 2) a value outside the [`lower`, `upper`] range."""
+    if invalid == 1:
+        if value < lower:
+            return lower
+        if value > upper:
+            return upper
+    elif invalid == 2 and not (lower <= value <= upper):
+        return np.nan
+    return value
+
+
+def _apply_converter_kernel(kernel: Callable, *args) -> xr.DataArray:
+    """Apply an element-wise kernel on DataArrays and scalar parameters, the output has the data type of the arrays."""
+    dtype = np.result_type(*[arg for arg in args if isinstance(arg, xr.DataArray)])
+    # Inner join, as in xarray's arithmetic
+    return xr.apply_ufunc(kernel, *args, join="inner", dask="parallelized", output_dtypes=[dtype])
+
+
+@vectorize(
+    [
+        float32(float32, int64, int64, float64, float64, float64),
+        float64(float64, int64, int64, float64, float64, float64),
+    ],
+    nopython=True,
+    cache=True,
+)
+def _saturation_vapor_pressure(tas, water, ice, ice_thresh, water_thresh, interp_power):  # pragma: no cover
+    """Saturation vapor pressure in Pa of a temperature in K. See :py:func:`saturation_vapor_pressure`."""
+    return _e_sat(np.float64(tas), water, ice, ice_thresh, water_thresh, interp_power)
 
 
 @declare_units(tas="[temperature]", ice_thresh="[temperature]", water_thresh="[temperature]")
@@ -577,28 +683,9 @@ def saturation_vapor_pressure(
     >>> from xclim.indices import saturation_vapor_pressure
     >>> rh = saturation_vapor_pressure(tas=tas_dataset, ice_thresh="0 degC", method="wmo08")
     """
-    # Dropped explicit support of 4 letter codes, but don't want a breaking change
-    method = {"TE30": "tetens30", "GG46": "goffgratch46", "SO90": "sonntag90"}.get(method, method)
-    method = method.casefold()
-
+    params = _saturation_vapor_pressure_parameters(method, ice_thresh, interp_power, water_thresh)
     tas = convert_units_to(tas, "K")
-    if ice_thresh is None and interp_power is None:
-        # all water
-        e_sat = _saturation_vapor_pressure_over_water(tas, method)
-    elif ice_thresh is not None and interp_power is None:
-        # binary case
-        thresh = convert_units_to(ice_thresh, "K")
-        e_sat_w = _saturation_vapor_pressure_over_water(tas, method)
-        e_sat_i = _saturation_vapor_pressure_over_ice(tas, method)
-        e_sat = xr.where(tas > thresh, e_sat_w, e_sat_i)
-    else:  # ice_thresh is not None and interp_power is not None
-        T_w = convert_units_to(water_thresh, "K")
-        T_i = convert_units_to(ice_thresh, "K")
-        e_sat_w = _saturation_vapor_pressure_over_water(tas, method)
-        e_sat_i = _saturation_vapor_pressure_over_ice(tas, method)
-        alpha = ((tas - T_i) / (T_w - T_i)) ** interp_power
-        e_sat = xr.where(tas < T_i, e_sat_i, xr.where(tas > T_w, e_sat_w, alpha * e_sat_w + (1 - alpha) * e_sat_i))
-
+    e_sat = _apply_converter_kernel(_saturation_vapor_pressure, tas, *params)
     e_sat = e_sat.assign_attrs(units="Pa")
     return e_sat
 
@@ -691,6 +778,45 @@ def vapor_pressure_deficit(
     return vpd
 
 
+_ESAT_KERNEL_SIGNATURES = "int64, int64, float64, float64, float64, int64"
+
+
+@vectorize(
+    [
+        f"float32(float32, float32, {_ESAT_KERNEL_SIGNATURES})",
+        f"float64(float64, float64, {_ESAT_KERNEL_SIGNATURES})",
+    ],
+    nopython=True,
+    cache=True,
+)
+def _relative_humidity_from_dewpoint(
+    tas, tdps, water, ice, ice_thresh, water_thresh, interp_power, invalid
+):  # pragma: no cover
+    """Relative humidity in % from the temperature and dewpoint in K. See :py:func:`relative_humidity`."""
+    e_sat_dt = _e_sat(np.float64(tdps), water, ice, ice_thresh, water_thresh, interp_power)
+    e_sat_t = _e_sat(np.float64(tas), water, ice, ice_thresh, water_thresh, interp_power)
+    return _treat_invalid(100 * e_sat_dt / e_sat_t, 0.0, 100.0, invalid)
+
+
+@vectorize(
+    [
+        f"float32(float32, float32, float32, {_ESAT_KERNEL_SIGNATURES})",
+        f"float64(float64, float64, float64, {_ESAT_KERNEL_SIGNATURES})",
+    ],
+    nopython=True,
+    cache=True,
+)
+def _relative_humidity_from_specific_humidity(
+    tas, huss, ps, water, ice, ice_thresh, water_thresh, interp_power, invalid
+):  # pragma: no cover
+    """Relative humidity in % from the temperature in K, specific humidity and pressure in Pa."""
+    eps = 0.62198
+    q = np.float64(huss)
+    P_w = ps * q / (eps + (1 - eps) * q)
+    P_wsat = _e_sat(np.float64(tas), water, ice, ice_thresh, water_thresh, interp_power)
+    return _treat_invalid(100 * P_w / P_wsat, 0.0, 100.0, invalid)
+
+
 @declare_units(
     tas="[temperature]",
     tdps="[temperature]",
@@ -810,37 +936,50 @@ def relative_humidity(
         tdps = convert_units_to(tdps, "K")
         tas = convert_units_to(tas, "K")
         L = 2.501e6
-        Rw = (461.5,)
+        Rw = 461.5
         hurs = 100 * np.exp(-L * (tas - tdps) / (Rw * tas * tdps))  # type: ignore
-    elif tdps is not None:
-        e_sat_dt = saturation_vapor_pressure(
-            tas=tdps, ice_thresh=ice_thresh, method=method, interp_power=interp_power, water_thresh=water_thresh
-        )
-        e_sat_t = saturation_vapor_pressure(
-            tas=tas, ice_thresh=ice_thresh, method=method, interp_power=interp_power, water_thresh=water_thresh
-        )
-        hurs = 100 * e_sat_dt / e_sat_t  # type: ignore
+        if invalid_values == "clip":
+            hurs = hurs.clip(0, 100)
+        elif invalid_values == "mask":
+            hurs = hurs.where((hurs <= 100) & (hurs >= 0))
+        return hurs.assign_attrs(units="%")
+
+    params = _saturation_vapor_pressure_parameters(method, ice_thresh, interp_power, water_thresh)
+    invalid = _INVALID_VALUES.get(invalid_values, 0)
+    tas = convert_units_to(tas, "K")
+    if tdps is not None:
+        tdps = convert_units_to(tdps, "K")
+        hurs = _apply_converter_kernel(_relative_humidity_from_dewpoint, tas, tdps, *params, invalid)
     elif huss is not None and ps is not None:
         ps = convert_units_to(ps, "Pa")
         huss = convert_units_to(huss, "")
-
-        P_w = vapor_pressure(huss=huss, ps=ps)
-        P_wsat = saturation_vapor_pressure(
-            tas=tas, ice_thresh=ice_thresh, method=method, interp_power=interp_power, water_thresh=water_thresh
-        )
-
-        hurs = 100 * P_w / P_wsat
+        hurs = _apply_converter_kernel(_relative_humidity_from_specific_humidity, tas, huss, ps, *params, invalid)
     else:
         raise ValueError("`huss` and `ps` must be provided if `tdps` is not given.")
 
-    if invalid_values == "clip":
-        hurs = hurs.clip(0, 100)
-    elif invalid_values == "mask":
-        hurs = hurs.where((hurs <= 100) & (hurs >= 0))
     hurs = hurs.assign_attrs(units="%")
     return hurs
 
 
+@vectorize(
+    [
+        f"float32(float32, float32, float32, {_ESAT_KERNEL_SIGNATURES})",
+        f"float64(float64, float64, float64, {_ESAT_KERNEL_SIGNATURES})",
+    ],
+    nopython=True,
+    cache=True,
+)
+def _specific_humidity(tas, hurs, ps, water, ice, ice_thresh, water_thresh, interp_power, invalid):  # pragma: no cover
+    """Specific humidity from the temperature in K, relative humidity as a fraction and pressure in Pa."""
+    e_sat = _e_sat(np.float64(tas), water, ice, ice_thresh, water_thresh, interp_power)
+    w_sat = 0.62198 * e_sat / (ps - e_sat)
+    w = w_sat * hurs
+    q = w / (1 + w)
+    if invalid == 0:
+        return q
+    return _treat_invalid(q, 0.0, w_sat / (1 + w_sat), invalid)
+
+
 @declare_units(
     tas="[temperature]", hurs="[]", ps="[pressure]", ice_thresh="[temperature]", water_thresh="[temperature]"
 )
@@ -926,24 +1065,13 @@ def specific_humidity(
     ...     invalid_values="mask",
     ... )
     """
+    params = _saturation_vapor_pressure_parameters(method, ice_thresh, interp_power, water_thresh)
+    invalid = _INVALID_VALUES.get(invalid_values, 0)
     ps = convert_units_to(ps, "Pa")
     hurs = convert_units_to(hurs, "")
     tas = convert_units_to(tas, "K")
 
-    e_sat = saturation_vapor_pressure(
-        tas=tas, ice_thresh=ice_thresh, method=method, interp_power=interp_power, water_thresh=water_thresh
-    )
-
-    w_sat = 0.62198 * e_sat / (ps - e_sat)  # type: ignore
-    w = w_sat * hurs
-    q: xr.DataArray = w / (1 + w)
-
-    if invalid_values is not None:
-        q_sat = w_sat / (1 + w_sat)
-        if invalid_values == "clip":
-            q = q.clip(0, q_sat)
-        elif invalid_values == "mask":
-            q = q.where((q <= q_sat) & (q >= 0))
+    q = _apply_converter_kernel(_specific_humidity, tas, hurs, ps, *params, invalid)
     q = q.assign_attrs(units="")
     return q
 
@@ -1021,6 +1149,26 @@ def specific_humidity_from_dewpoint(
     return q
 
 
+@vectorize(
+    [
+        float32(float32, float32, float64, float64, float64),
+        float64(float64, float64, float64, float64, float64),
+    ],
+    nopython=True,
+    cache=True,
+)
+def _dewpoint_from_specific_humidity(huss, ps, A, B, C):  # pragma: no cover
+    """Dewpoint in K from the specific humidity and pressure in Pa. See :py:func:`dewpoint_from_specific_humidity`."""
+    # To avoid 0 in log below, we mask points with no water vapour at all
+    if not huss > 0:
+        return np.nan
+    eps = 0.62198
+    q = np.float64(huss)
+    e = ps * q / (eps + (1 - eps) * q)
+    f = np.log(e / A) / B
+    return (-273.16 - C * f) / (f - 1)
+
+
 @declare_units(huss="[]", ps="[pressure]")
 def dewpoint_from_specific_humidity(
     huss: xr.DataArray, ps: xr.DataArray, method: str = "buck81", variant: str = "water"
@@ -1072,15 +1220,12 @@ def dewpoint_from_specific_humidity(
     To imitate the calculations of ECMWF's IFS (ERA5, ERA5-Land), use ``method='buck81'``
     and ``reference='water'`` (the defaults).
     """
-    # To avoid 0 in log below, we mask points with no water vapour at all
-    huss = huss.where(huss > 0)
-    e = vapor_pressure(huss, ps)
-
     method = method.casefold()
     A, B, C = ESAT_FORMULAS_COEFFICIENTS[method][variant]
+    huss = convert_units_to(huss, "")
+    ps = convert_units_to(ps, "Pa")
 
-    f = np.log(e / A) / B
-    tdps = (-273.16 - C * f) / (f - 1)
+    tdps = _apply_converter_kernel(_dewpoint_from_specific_humidity, huss, ps, A, B, C)
     return tdps.assign_attrs(units="K", units_metadata="temperature: on_scale")
 
 
@@ -1172,7 +1317,7 @@ def snowfall_approximation(
         fraction = xr.DataArray([1.0, 1.0, 0.0, 0.0], dims=("tas",), coords={"tas": t})
 
         # Multiply precip by snowfall fraction
-        prsn = pr * fraction.interp(tas=tas, method="linear")
+        prsn = pr * cast_to_preserved_dtype(fraction.interp(tas=tas, method="linear"), pr, tas)
 
     elif method == "auer":
         dtas = convert_units_to(tas, "K") - convert_units_to(thresh, "K")
@@ -1193,7 +1338,7 @@ def snowfall_approximation(
         fraction[-2:] = 0
 
         # Convert snowfall fraction coordinates to native tas units
-        prsn = pr * fraction.interp(tas=dtas, method="linear")
+        prsn = pr * cast_to_preserved_dtype(fraction.interp(tas=dtas, method="linear"), pr, tas)
     elif method.startswith("dai"):
         tas = convert_units_to(tas, "°C")
         if isinstance(landmask, bool):
@@ -1616,7 +1761,7 @@ def clearness_index(rsds: xr.DataArray) -> xr.DataArray:
     :cite:cts:`lauret_solar_2022`
     """
     rtop = extraterrestrial_solar_radiation(rsds.time, rsds.lat)
-    rtop = convert_units_to(rtop, rsds)
+    rtop = cast_to_preserved_dtype(convert_units_to(rtop, rsds), rsds)
     with xr.set_options(keep_attrs=True):
         ci = xr.where(rsds != 0, rsds / rtop, 0)
     ci = ci.assign_attrs(units="")
@@ -1650,12 +1795,29 @@ def shortwave_downwelling_radiation_from_clearness_index(ci: xr.DataArray) -> xr
 
        rsds = ci * \text{extraterrestrial_solar_radiation}
     """
-    rtop = extraterrestrial_solar_radiation(ci.time, ci.lat)
+    rtop = cast_to_preserved_dtype(extraterrestrial_solar_radiation(ci.time, ci.lat), ci)
     with xr.set_options(keep_attrs=True):
         rsds = (rtop * ci).assign_attrs(units=rtop.units)
     return rsds
 
 
+@vectorize(
+    [float32(float32, float32, boolean, boolean), float64(float64, float64, boolean, boolean)],
+    nopython=True,
+    cache=True,
+)
+def _wind_chill_index(tas, sfcWind, canadian, mask_invalid):  # pragma: no cover
+    """Wind chill index from the temperature in °C and wind speed in km/h. See :py:func:`wind_chill_index`."""
+    t = np.float64(tas)
+    v = np.float64(sfcWind)
+    if mask_invalid and not ((t <= 0) if canadian else (v > 4.828032 and t <= 10)):
+        return np.nan
+    if canadian and v < 5:
+        return t + v * (-1.59 + 0.1345 * t) / 5
+    V = v**0.16
+    return 13.12 + 0.6215 * t - 11.37 * V + 0.3965 * t * V
+
+
 @declare_units(
     tas="[temperature]",
     sfcWind="[speed]",
@@ -1725,21 +1887,12 @@ def wind_chill_index(
     ----------
     :cite:cts:`mekis_observed_2015,us_department_of_commerce_wind_nodate`
     """
+    if method.upper() not in ["CAN", "US"]:
+        raise ValueError(f"`method` must be one of 'US' and 'CAN'. Got '{method}'.")
     tas = convert_units_to(tas, "degC")
     sfcWind = convert_units_to(sfcWind, "km/h")
 
-    V = sfcWind**0.16
-    W: xr.DataArray = 13.12 + 0.6215 * tas - 11.37 * V + 0.3965 * tas * V
-
-    if method.upper() == "CAN":
-        W = xr.where(sfcWind < 5, tas + sfcWind * (-1.59 + 0.1345 * tas) / 5, W)
-    elif method.upper() != "US":
-        raise ValueError(f"`method` must be one of 'US' and 'CAN'. Got '{method}'.")
-
-    if mask_invalid:
-        mask = {"CAN": tas <= 0, "US": (sfcWind > 4.828032) & (tas <= 10)}
-        W = W.where(mask[method.upper()])
-
+    W = _apply_converter_kernel(_wind_chill_index, tas, sfcWind, method.upper() == "CAN", mask_invalid)
     W = W.assign_attrs(units="degC")
     return W
 
@@ -1874,6 +2027,195 @@ def fao_allen98(net_radiation, tas, wind, es, ea, delta_svp, gamma, G="0 MJ m-2
     return ((a1 + a2) / a3).assign_attrs(units="mm day-1")
 
 
+class _PETInputs:
+    """
+    Inputs of the potential evapotranspiration methods.
+
+    Unit conversions and the extraterrestrial solar radiation are computed on first use and shared between methods.
+    """
+
+    def __init__(self, lat: xr.DataArray | None = None, **variables: xr.DataArray | None):
+        self.variables = variables
+        if lat is None:
+            lat = _gather_lat(variables["tasmin"] if variables["tas"] is None else variables["tas"])
+        self.lat = lat
+        self._cache: dict[tuple, xr.DataArray] = {}
+
+    def _cached(self, key: tuple, func: Callable, *args, **kwargs) -> xr.DataArray:
+        if key not in self._cache:
+            self._cache[key] = func(*args, **kwargs)
+        return self._cache[key]
+
+    def convert(self, name: str, units: str) -> xr.DataArray:
+        """Return input variable `name` converted to `units`."""
+        return self._cached((name, units), convert_units_to, self.variables[name], units, context="hydro")
+
+    def tas(self) -> xr.DataArray:
+        """Return the mean temperature in °C, approximated from `tasmin` and `tasmax` if `tas` is not given."""
+        if self.variables["tas"] is not None:
+            return self.convert("tas", "degC")
+        return self._cached(
+            ("tas_from_tasmin_tasmax",),
+            lambda: ((self.convert("tasmin", "degC") + self.convert("tasmax", "degC")) / 2).assign_attrs(units="degC"),
+        )
+
+    def extraterrestrial_solar_radiation(self, solar_constant: str = "1361 W m-2") -> xr.DataArray:
+        """Return the daily extraterrestrial solar radiation on the time coordinate of the temperature inputs."""
+        ref = self.variables["tasmin"] if self.variables["tasmin"] is not None else self.variables["tas"]
+        return self._cached(
+            ("extraterrestrial_solar_radiation", solar_constant),
+            lambda: cast_to_preserved_dtype(
+                extraterrestrial_solar_radiation(
+                    ref.time, self.lat, solar_constant=solar_constant, chunks=ref.chunksizes
+                ),
+                ref,
+            ),
+        )
+
+
+def _potential_evapotranspiration(inputs: _PETInputs, method: str, peta: float, petb: float) -> xr.DataArray:
+    """Potential evapotranspiration with a given method. See :py:func:`potential_evapotranspiration`."""
+    _lat = inputs.lat
+    pet: xr.DataArray
+    if method in ["baierrobertson65", "BR65"]:
+        _tasmin = inputs.convert("tasmin", "degF")
+        _tasmax = inputs.convert("tasmax", "degF")
+
+        re = inputs.extraterrestrial_solar_radiation()
+        re = convert_units_to(re, "cal cm-2 day-1")
+
+        # Baier et Robertson(1965) formula
+        pet = 0.094 * (-87.03 + 0.928 * _tasmax + 0.933 * (_tasmax - _tasmin) + 0.0486 * re)
+        pet = pet.clip(0)
+
+    elif method in ["hargreaves85", "HG85"]:
+        _tasmin = inputs.convert("tasmin", "degC")
+        _tasmax = inputs.convert("tasmax", "degC")
+        _tas = inputs.tas()
+
+        ra = inputs.extraterrestrial_solar_radiation()
+        ra = convert_units_to(ra, "MJ m-2 d-1")
+
+        # Is used to convert the radiation to evaporation equivalents in mm (kg/MJ)
+        ra = ra * 0.408
+
+        # Hargreaves and Samani (1985) formula
+        pet = 0.0023 * ra * (_tas + 17.8) * (_tasmax - _tasmin) ** 0.5
+        pet = pet.clip(0)
+
+    elif method in ["droogersallen02", "DA02"]:
+        _tasmin = inputs.convert("tasmin", "degC")
+        _tasmax = inputs.convert("tasmax", "degC")
+        _pr = inputs.convert("pr", "mm/month")
+        _tas = inputs.tas()
+
+        _tasmin = _tasmin.resample(time="MS").mean()
+        _tasmax = _tasmax.resample(time="MS").mean()
+        _tas = _tas.resample(time="MS").mean()
+        _pr = _pr.resample(time="MS").mean()
+
+        # Monthly accumulated radiation
+        time_d = _get_D_from_M(_tasmin.time)
+        ra = extraterrestrial_solar_radiation(time_d, _lat)
+        ra = cast_to_preserved_dtype(convert_units_to(ra, "MJ m-2 d-1"), _tas)
+        ra = ra.resample(time="MS").sum()
+        # Is used to convert the radiation to evaporation equivalents in mm (kg/MJ)
+        ra = ra * 0.408
+
+        tr = _tasmax - _tasmin
+        tr = tr.where(tr > 0, 0)
+
+        # Droogers and Allen (2002) formula
+        ab = tr - 0.0123 * _pr
+        pet = 0.0013 * ra * (_tas + 17.0) * ab**0.76
+        pet = xr.where(np.isnan(ab**0.76), 0, pet)
+        pet = pet.clip(0)  # mm/month
+
+    elif method in ["mcguinnessbordne05", "MB05"]:
+        _tas = inputs.tas()
+        tasK = convert_units_to(_tas, "K")
+
+        ext_rad = inputs.extraterrestrial_solar_radiation(solar_constant="1367 W m-2")
+        latentH = 4185.5 * (751.78 - 0.5655 * tasK)
+        radDIVlat = ext_rad / latentH
+
+        # parameters from calibration provided by Dr Maliko Tanguy @ CEH
+        # (calibrated for PET over the UK)
+        a = peta
+        b = petb
+
+        pet = radDIVlat * a * _tas + radDIVlat * b
+
+    elif method in ["thornthwaite48", "TW48"]:
+        _tas = inputs.tas()
+        _tas = _tas.clip(0)
+        _tas = _tas.resample(time="MS").mean(dim="time")
+
+        # Thornthwaite measures half-days
+        time_d = _get_D_from_M(_tas.time)
+        dl = cast_to_preserved_dtype(cast(xr.DataArray, day_lengths(time_d, _lat) / 12), _tas)
+        dl_m = dl.resample(time="MS").mean(dim="time")
+
+        # annual heat index
+        id_m = (_tas / 5) ** 1.514
+        id_y = id_m.resample(time="YS").sum(dim="time")
+
+        tas_idy_a = []
+        for base_time, indexes in _tas.resample(time="YS").groups.items():
+            tas_y = _tas.isel(time=indexes)
+            id_v = id_y.sel(time=base_time)
+            a = 6.75e-7 * id_v**3 - 7.71e-5 * id_v**2 + 0.01791 * id_v + 0.49239
+
+            frac = (10 * tas_y / id_v) ** a
+            tas_idy_a.append(frac)
+
+        tas_idy_a = xr.concat(tas_idy_a, dim="time")
+
+        # Thornthwaite(1948) formula
+        pet = 1.6 * dl_m * tas_idy_a  # cm/month
+        pet = 10 * pet  # mm/month
+
+    elif method in ["allen98", "FAO_PM98"]:
+        _tasmax = inputs.convert("tasmax", "degC")
+        _tasmin = inputs.convert("tasmin", "degC")
+        _hurs = inputs.convert("hurs", "1")
+        sfcWind = inputs.variables["sfcWind"]
+        if sfcWind is None:
+            raise ValueError("Wind speed is required for Allen98 method.")
+
+        # wind speed at two meters
+        wa2 = wind_speed_height_conversion(sfcWind, h_source="10 m", h_target="2 m")
+        wa2 = convert_units_to(wa2, "m s-1")
+
+        rsds, rsus, rlds, rlus = (inputs.variables[name] for name in ["rsds", "rsus", "rlds", "rlus"])
+        with xr.set_options(keep_attrs=True):
+            # mean temperature [degC]
+            tas_m = (_tasmax + _tasmin) / 2
+            # mean saturation vapour pressure [kPa]
+            es = (1 / 2) * (saturation_vapor_pressure(_tasmax) + saturation_vapor_pressure(_tasmin))
+            es = convert_units_to(es, "kPa")
+            # mean actual vapour pressure [kPa]
+            # assign units as xarray removes conflicting units (_hurs is 1)
+            ea = (es * _hurs).assign_attrs(units="kPa")
+
+            # slope of saturation vapour pressure curve  [kPa degC-1]
+            delta = (4098 * es / (tas_m + 237.3) ** 2).assign_attrs(units="kPa degC-1")
+            # net radiation
+            Rn = convert_units_to(rsds - rsus - (rlus - rlds), "MJ m-2 d-1")
+
+            P = 101.325  # Atmospheric pressure [kPa]
+            gamma = 0.665e-03 * P  # psychrometric const = C_p*P/(eps*lam) [kPa degC-1]
+            pet = fao_allen98(Rn, tas_m, wa2, es, ea, delta, f"{gamma} kPa degC")
+
+    else:
+        raise NotImplementedError(f"'{method}' method is not implemented.")
+
+    pet = pet.assign_attrs(units="mm")
+    rate = amount2rate(pet, out_units="mm/d")
+    out: xr.DataArray = convert_units_to(rate, "kg m-2 s-1", context="hydro")
+    return out
+
+
 @declare_units(
     tasmin="[temperature]",
     tasmax="[temperature]",
@@ -1991,389 +2333,398 @@ def potential_evapotranspiration(
     :cite:cts:`baier_estimation_1965,george_h_hargreaves_reference_1985,tanguy_historical_2018,thornthwaite_approach_1948,mcguinness_comparison_1972,allen_crop_1998,droogers2002`
     """  # noqa: E501
     # ^ Ignoring "line too long" as it comes from un-splittable constructs
-    if lat is None:
-        _lat = _gather_lat(tasmin if tas is None else tas)
-    else:
-        _lat = lat
-
-    pet: xr.DataArray
-    if method in ["baierrobertson65", "BR65"]:
-        _tasmin = convert_units_to(tasmin, "degF")
-        _tasmax = convert_units_to(tasmax, "degF")
-
-        re = extraterrestrial_solar_radiation(_tasmin.time, _lat, chunks=_tasmin.chunksizes)
-        re = convert_units_to(re, "cal cm-2 day-1")
-
-        # Baier et Robertson(1965) formula
-        pet = 0.094 * (-87.03 + 0.928 * _tasmax + 0.933 * (_tasmax - _tasmin) + 0.0486 * re)
-        pet = pet.clip(0)
-
-    elif method in ["hargreaves85", "HG85"]:
-        _tasmin = convert_units_to(tasmin, "degC")
-        _tasmax = convert_units_to(tasmax, "degC")
-        if tas is None:
-            _tas = (_tasmin + _tasmax) / 2
-        else:
-            _tas = convert_units_to(tas, "degC")
-
-        ra = extraterrestrial_solar_radiation(_tasmin.time, _lat, chunks=_tasmin.chunksizes)
-        ra = convert_units_to(ra, "MJ m-2 d-1")
-
-        # Is used to convert the radiation to evaporation equivalents in mm (kg/MJ)
-        ra = ra * 0.408
-
-        # Hargreaves and Samani (1985) formula
-        pet = 0.0023 * ra * (_tas + 17.8) * (_tasmax - _tasmin) ** 0.5
-        pet = pet.clip(0)
-
-    elif method in ["droogersallen02", "DA02"]:
-        _tasmin = convert_units_to(tasmin, "degC")
-        _tasmax = convert_units_to(tasmax, "degC")
-        _pr = convert_units_to(pr, "mm/month", context="hydro")
-        if tas is None:
-            _tas = (_tasmin + _tasmax) / 2
-        else:
-            _tas = convert_units_to(tas, "degC")
-
-        _tasmin = _tasmin.resample(time="MS").mean()
-        _tasmax = _tasmax.resample(time="MS").mean()
-        _tas = _tas.resample(time="MS").mean()
-        _pr = _pr.resample(time="MS").mean()
-
-        # Monthly accumulated radiation
-        time_d = _get_D_from_M(_tasmin.time)
-        ra = extraterrestrial_solar_radiation(time_d, _lat)
-        ra = convert_units_to(ra, "MJ m-2 d-1")
-        ra = ra.resample(time="MS").sum()
-        # Is used to convert the radiation to evaporation equivalents in mm (kg/MJ)
-        ra = ra * 0.408
-
-        tr = _tasmax - _tasmin
-        tr = tr.where(tr > 0, 0)
-
-        # Droogers and Allen (2002) formula
-        ab = tr - 0.0123 * _pr
-        pet = 0.0013 * ra * (_tas + 17.0) * ab**0.76
-        pet = xr.where(np.isnan(ab**0.76), 0, pet)
-        pet = pet.clip(0)  # mm/month
-
-    elif method in ["mcguinnessbordne05", "MB05"]:
-        if tas is None:
-            _tasmin = convert_units_to(tasmin, "degC")
-            _tasmax = convert_units_to(tasmax, "degC")
-            _tas: xr.DataArray = (_tasmin + _tasmax) / 2
-            _tas = _tas.assign_attrs(units="degC")
-        else:
-            _tas = convert_units_to(tas, "degC")
-
-        tasK = convert_units_to(_tas, "K")
-
-        ext_rad = extraterrestrial_solar_radiation(_tas.time, _lat, solar_constant="1367 W m-2", chunks=_tas.chunksizes)
-        latentH = 4185.5 * (751.78 - 0.5655 * tasK)
-        radDIVlat = ext_rad / latentH
-
-        # parameters from calibration provided by Dr Maliko Tanguy @ CEH
-        # (calibrated for PET over the UK)
-        a = peta
-        b = petb
-
-        pet = radDIVlat * a * _tas + radDIVlat * b
-
-    elif method in ["thornthwaite48", "TW48"]:
-        if tas is None:
-            _tasmin = convert_units_to(tasmin, "degC")
-            _tasmax = convert_units_to(tasmax, "degC")
-            _tas = (_tasmin + _tasmax) / 2
-        else:
-            _tas = convert_units_to(tas, "degC")
-        _tas = _tas.clip(0)
-        _tas = _tas.resample(time="MS").mean(dim="time")
-
-        # Thornthwaite measures half-days
-        time_d = _get_D_from_M(_tas.time)
-        dl = cast(xr.DataArray, day_lengths(time_d, _lat) / 12)
-        dl_m = dl.resample(time="MS").mean(dim="time")
-
-        # annual heat index
-        id_m = (_tas / 5) ** 1.514
-        id_y = id_m.resample(time="YS").sum(dim="time")
-
-        tas_idy_a = []
-        for base_time, indexes in _tas.resample(time="YS").groups.items():
-            tas_y = _tas.isel(time=indexes)
-            id_v = id_y.sel(time=base_time)
-            a = 6.75e-7 * id_v**3 - 7.71e-5 * id_v**2 + 0.01791 * id_v + 0.49239
-
-            frac = (10 * tas_y / id_v) ** a
-            tas_idy_a.append(frac)
+    inputs = _PETInputs(
+        tasmin=tasmin,
+        tasmax=tasmax,
+        tas=tas,
+        lat=lat,
+        hurs=hurs,
+        rsds=rsds,
+        rsus=rsus,
+        rlds=rlds,
+        rlus=rlus,
+        sfcWind=sfcWind,
+        pr=pr,
+    )
+    return _potential_evapotranspiration(inputs, method, peta=peta, petb=petb)
 
-        tas_idy_a = xr.concat(tas_idy_a, dim="time")
 
-        # Thornthwaite(1948) formula
-        pet = 1.6 * dl_m * tas_idy_a  # cm/month
-        pet = 10 * pet  # mm/month
+@declare_units(
+    tasmin="[temperature]",
+    tasmax="[temperature]",
+    tas="[temperature]",
+    lat="[]",
+    hurs="[]",
+    rsds="[radiation]",
+    rsus="[radiation]",
+    rlds="[radiation]",
+    rlus="[radiation]",
+    sfcWind="[speed]",
+    pr="[precipitation]",
+)
+def potential_evapotranspiration_methods(
+    tasmin: xr.DataArray | None = None,
+    tasmax: xr.DataArray | None = None,
+    tas: xr.DataArray | None = None,
+    lat: xr.DataArray | None = None,
+    hurs: xr.DataArray | None = None,
+    rsds: xr.DataArray | None = None,
+    rsus: xr.DataArray | None = None,
+    rlds: xr.DataArray | None = None,
+    rlus: xr.DataArray | None = None,
+    sfcWind: xr.DataArray | None = None,
+    pr: xr.DataArray | None = None,
+    methods: Sequence[str] = ("BR65", "HG85", "MB05"),
+    peta: float = 0.00516409319477,
+    petb: float = 0.0874972822289,
+) -> xr.Dataset:
+    """
+    Potential evapotranspiration computed with several methods.
 
-    elif method in ["allen98", "FAO_PM98"]:
-        _tasmax = convert_units_to(tasmax, "degC")
-        _tasmin = convert_units_to(tasmin, "degC")
-        _hurs = convert_units_to(hurs, "1")
-        if sfcWind is None:
-            raise ValueError("Wind speed is required for Allen98 method.")
+    Unit conversions of the inputs and the extraterrestrial solar radiation are computed only once
+    and shared between the methods, which is cheaper than calling :py:func:`potential_evapotranspiration`
+    once per method.
 
-        # wind speed at two meters
-        wa2 = wind_speed_height_conversion(sfcWind, h_source="10 m", h_target="2 m")
-        wa2 = convert_units_to(wa2, "m s-1")
+    Parameters
+    ----------
+    tasmin : xarray.DataArray, optional
+        Minimum daily Temperature.
+    tasmax : xarray.DataArray, optional
+        Maximum daily Temperature.
+    tas : xarray.DataArray, optional
+        Mean daily Temperature.
+    lat : xarray.DataArray, optional
+        Latitude.
+        If not provided, it is sought on `tasmin` or `tas` using cf-xarray accessors.
+    hurs : xarray.DataArray, optional
+        Relative Humidity.
+    rsds : xarray.DataArray, optional
+        Surface Downwelling Shortwave Radiation.
+    rsus : xarray.DataArray, optional
+        Surface Upwelling Shortwave Radiation.
+    rlds : xarray.DataArray, optional
+        Surface Downwelling Longwave Radiation.
+    rlus : xarray.DataArray, optional
+        Surface Upwelling Longwave Radiation.
+    sfcWind : xarray.DataArray, optional
+        Surface Wind Velocity (at 10 m).
+    pr : xarray.DataArray
+        Mean daily Precipitation Flux.
+    methods : sequence of str
+        The methods to use. See :py:func:`potential_evapotranspiration` for the available methods
+        and the inputs they require.
+    peta : float
+        Used only with method MB05 as :math:`a` for calculation of PET.
+    petb : float
+        Used only with method MB05 as :math:`b` for calculation of PET.
 
-        with xr.set_options(keep_attrs=True):
-            # mean temperature [degC]
-            tas_m = (_tasmax + _tasmin) / 2
-            # mean saturation vapour pressure [kPa]
-            es = (1 / 2) * (saturation_vapor_pressure(_tasmax) + saturation_vapor_pressure(_tasmin))
-            es = convert_units_to(es, "kPa")
-            # mean actual vapour pressure [kPa]
-            # assign units as xarray removes conflicting units (_hurs is 1)
-            ea = (es * _hurs).assign_attrs(units="kPa")
+    Returns
+    -------
+    xarray.Dataset
+        Potential Evapotranspiration, with one variable per method, named after the method.
 
-            # slope of saturation vapour pressure curve  [kPa degC-1]
-            delta = (4098 * es / (tas_m + 237.3) ** 2).assign_attrs(units="kPa degC-1")
-            # net radiation
-            Rn = convert_units_to(rsds - rsus - (rlus - rlds), "MJ m-2 d-1")
+    Raises
+    ------
+    ValueError
+        If the methods yield outputs of different frequencies,
+        e.g. when mixing daily methods with "TW48" or "DA02", which are monthly.
 
-            P = 101.325  # Atmospheric pressure [kPa]
-            gamma = 0.665e-03 * P  # psychrometric const = C_p*P/(eps*lam) [kPa degC-1]
-            pet = fao_allen98(Rn, tas_m, wa2, es, ea, delta, f"{gamma} kPa degC")
+    See Also
+    --------
+    potential_evapotranspiration : Potential evapotranspiration with a single method.
+    """
+    inputs = _PETInputs(
+        tasmin=tasmin,
+        tasmax=tasmax,
+        tas=tas,
+        lat=lat,
+        hurs=hurs,
+        rsds=rsds,
+        rsus=rsus,
+        rlds=rlds,
+        rlus=rlus,
+        sfcWind=sfcWind,
+        pr=pr,
+    )
+    out = {method: _potential_evapotranspiration(inputs, method, peta=peta, petb=petb) for method in methods}
 
-    else:
-        raise NotImplementedError(f"'{method}' method is not implemented.")
+    sizes = {method: pet.time.size for method, pet in out.items()}
+    if len(set(sizes.values())) > 1:
+        raise ValueError(
+            f"The requested methods do not yield outputs of the same frequency ({sizes}). "
+            "Compute the monthly and the daily methods separately."
+        )
+    return xr.Dataset(out)
+
+
+# Coefficients of the UTCI polynomial, with the powers of tas, sfcWind, dt and wvp of each term.
+# Taken directly from the original Fortran code by Peter Bröde.
+# http://www.utci.org/public/UTCI%20Program%20Code/UTCI_a002.f90
+_UTCI_TERMS = [
+    (6.07562052e-1, 0, 0, 0, 0),
+    (-2.27712343e-2, 1, 0, 0, 0),
+    (8.06470249e-4, 2, 0, 0, 0),
+    (-1.54271372e-4, 3, 0, 0, 0),
+    (-3.24651735e-6, 4, 0, 0, 0),
+    (7.32602852e-8, 5, 0, 0, 0),
+    (1.35959073e-9, 6, 0, 0, 0),
+    (-2.25836520e0, 0, 1, 0, 0),
+    (8.80326035e-2, 1, 1, 0, 0),
+    (2.16844454e-3, 2, 1, 0, 0),
+    (-1.53347087e-5, 3, 1, 0, 0),
+    (-5.72983704e-7, 4, 1, 0, 0),
+    (-2.55090145e-9, 5, 1, 0, 0),
+    (-7.51269505e-1, 0, 2, 0, 0),
+    (-4.08350271e-3, 1, 2, 0, 0),
+    (-5.21670675e-5, 2, 2, 0, 0),
+    (1.94544667e-6, 3, 2, 0, 0),
+    (1.14099531e-8, 4, 2, 0, 0),
+    (1.58137256e-1, 0, 3, 0, 0),
+    (-6.57263143e-5, 1, 3, 0, 0),
+    (2.22697524e-7, 2, 3, 0, 0),
+    (-4.16117031e-8, 3, 3, 0, 0),
+    (-1.27762753e-2, 0, 4, 0, 0),
+    (9.66891875e-6, 1, 4, 0, 0),
+    (2.52785852e-9, 2, 4, 0, 0),
+    (4.56306672e-4, 0, 5, 0, 0),
+    (-1.74202546e-7, 1, 5, 0, 0),
+    (-5.91491269e-6, 0, 6, 0, 0),
+    (3.98374029e-1, 0, 0, 1, 0),
+    (1.83945314e-4, 1, 0, 1, 0),
+    (-1.73754510e-4, 2, 0, 1, 0),
+    (-7.60781159e-7, 3, 0, 1, 0),
+    (3.77830287e-8, 4, 0, 1, 0),
+    (5.43079673e-10, 5, 0, 1, 0),
+    (-2.00518269e-2, 0, 1, 1, 0),
+    (8.92859837e-4, 1, 1, 1, 0),
+    (3.45433048e-6, 2, 1, 1, 0),
+    (-3.77925774e-7, 3, 1, 1, 0),
+    (-1.69699377e-9, 4, 1, 1, 0),
+    (1.69992415e-4, 0, 2, 1, 0),
+    (-4.99204314e-5, 1, 2, 1, 0),
+    (2.47417178e-7, 2, 2, 1, 0),
+    (1.07596466e-8, 3, 2, 1, 0),
+    (8.49242932e-5, 0, 3, 1, 0),
+    (1.35191328e-6, 1, 3, 1, 0),
+    (-6.21531254e-9, 2, 3, 1, 0),
+    (-4.99410301e-6, 0, 4, 1, 0),
+    (-1.89489258e-8, 1, 4, 1, 0),
+    (8.15300114e-8, 0, 5, 1, 0),
+    (7.55043090e-4, 0, 0, 2, 0),
+    (-5.65095215e-5, 1, 0, 2, 0),
+    (-4.52166564e-7, 2, 0, 2, 0),
+    (2.46688878e-8, 3, 0, 2, 0),
+    (2.42674348e-10, 4, 0, 2, 0),
+    (1.54547250e-4, 0, 1, 2, 0),
+    (5.24110970e-6, 1, 1, 2, 0),
+    (-8.75874982e-8, 2, 1, 2, 0),
+    (-1.50743064e-9, 3, 1, 2, 0),
+    (-1.56236307e-5, 0, 2, 2, 0),
+    (-1.33895614e-7, 1, 2, 2, 0),
+    (2.49709824e-9, 2, 2, 2, 0),
+    (6.51711721e-7, 0, 3, 2, 0),
+    (1.94960053e-9, 1, 3, 2, 0),
+    (-1.00361113e-8, 0, 4, 2, 0),
+    (-1.21206673e-5, 0, 0, 3, 0),
+    (-2.18203660e-7, 1, 0, 3, 0),
+    (7.51269482e-9, 2, 0, 3, 0),
+    (9.79063848e-11, 3, 0, 3, 0),
+    (1.25006734e-6, 0, 1, 3, 0),
+    (-1.81584736e-9, 1, 1, 3, 0),
+    (-3.52197671e-10, 2, 1, 3, 0),
+    (-3.36514630e-8, 0, 2, 3, 0),
+    (1.35908359e-10, 1, 2, 3, 0),
+    (4.17032620e-10, 0, 3, 3, 0),
+    (-1.30369025e-9, 0, 0, 4, 0),
+    (4.13908461e-10, 1, 0, 4, 0),
+    (9.22652254e-12, 2, 0, 4, 0),
+    (-5.08220384e-9, 0, 1, 4, 0),
+    (-2.24730961e-11, 1, 1, 4, 0),
+    (1.17139133e-10, 0, 2, 4, 0),
+    (6.62154879e-10, 0, 0, 5, 0),
+    (4.03863260e-13, 1, 0, 5, 0),
+    (1.95087203e-12, 0, 1, 5, 0),
+    (-4.73602469e-12, 0, 0, 6, 0),
+    (5.12733497e0, 0, 0, 0, 1),
+    (-3.12788561e-1, 1, 0, 0, 1),
+    (-1.96701861e-2, 2, 0, 0, 1),
+    (9.99690870e-4, 3, 0, 0, 1),
+    (9.51738512e-6, 4, 0, 0, 1),
+    (-4.66426341e-7, 5, 0, 0, 1),
+    (5.48050612e-1, 0, 1, 0, 1),
+    (-3.30552823e-3, 1, 1, 0, 1),
+    (-1.64119440e-3, 2, 1, 0, 1),
+    (-5.16670694e-6, 3, 1, 0, 1),
+    (9.52692432e-7, 4, 1, 0, 1),
+    (-4.29223622e-2, 0, 2, 0, 1),
+    (5.00845667e-3, 1, 2, 0, 1),
+    (1.00601257e-6, 2, 2, 0, 1),
+    (-1.81748644e-6, 3, 2, 0, 1),
+    (-1.25813502e-3, 0, 3, 0, 1),
+    (-1.79330391e-4, 1, 3, 0, 1),
+    (2.34994441e-6, 2, 3, 0, 1),
+    (1.29735808e-4, 0, 4, 0, 1),
+    (1.29064870e-6, 1, 4, 0, 1),
+    (-2.28558686e-6, 0, 5, 0, 1),
+    (-3.69476348e-2, 0, 0, 1, 1),
+    (1.62325322e-3, 1, 0, 1, 1),
+    (-3.14279680e-5, 2, 0, 1, 1),
+    (2.59835559e-6, 3, 0, 1, 1),
+    (-4.77136523e-8, 4, 0, 1, 1),
+    (8.64203390e-3, 0, 1, 1, 1),
+    (-6.87405181e-4, 1, 1, 1, 1),
+    (-9.13863872e-6, 2, 1, 1, 1),
+    (5.15916806e-7, 3, 1, 1, 1),
+    (-3.59217476e-5, 0, 2, 1, 1),
+    (3.28696511e-5, 1, 2, 1, 1),
+    (-7.10542454e-7, 2, 2, 1, 1),
+    (-1.24382300e-5, 0, 3, 1, 1),
+    (-7.38584400e-9, 1, 3, 1, 1),
+    (2.20609296e-7, 0, 4, 1, 1),
+    (-7.32469180e-4, 0, 0, 2, 1),
+    (-1.87381964e-5, 1, 0, 2, 1),
+    (4.80925239e-6, 2, 0, 2, 1),
+    (-8.75492040e-8, 3, 0, 2, 1),
+    (2.77862930e-5, 0, 1, 2, 1),
+    (-5.06004592e-6, 1, 1, 2, 1),
+    (1.14325367e-7, 2, 1, 2, 1),
+    (2.53016723e-6, 0, 2, 2, 1),
+    (-1.72857035e-8, 1, 2, 2, 1),
+    (-3.95079398e-8, 0, 3, 2, 1),
+    (-3.59413173e-7, 0, 0, 3, 1),
+    (7.04388046e-7, 1, 0, 3, 1),
+    (-1.89309167e-8, 2, 0, 3, 1),
+    (-4.79768731e-7, 0, 1, 3, 1),
+    (7.96079978e-9, 1, 1, 3, 1),
+    (1.62897058e-9, 0, 2, 3, 1),
+    (3.94367674e-8, 0, 0, 4, 1),
+    (-1.18566247e-9, 1, 0, 4, 1),
+    (3.34678041e-10, 0, 1, 4, 1),
+    (-1.15606447e-10, 0, 0, 5, 1),
+    (-2.80626406e0, 0, 0, 0, 2),
+    (5.48712484e-1, 1, 0, 0, 2),
+    (-3.99428410e-3, 2, 0, 0, 2),
+    (-9.54009191e-4, 3, 0, 0, 2),
+    (1.93090978e-5, 4, 0, 0, 2),
+    (-3.08806365e-1, 0, 1, 0, 2),
+    (1.16952364e-2, 1, 1, 0, 2),
+    (4.95271903e-4, 2, 1, 0, 2),
+    (-1.90710882e-5, 3, 1, 0, 2),
+    (2.10787756e-3, 0, 2, 0, 2),
+    (-6.98445738e-4, 1, 2, 0, 2),
+    (2.30109073e-5, 2, 2, 0, 2),
+    (4.17856590e-4, 0, 3, 0, 2),
+    (-1.27043871e-5, 1, 3, 0, 2),
+    (-3.04620472e-6, 0, 4, 0, 2),
+    (5.14507424e-2, 0, 0, 1, 2),
+    (-4.32510997e-3, 1, 0, 1, 2),
+    (8.99281156e-5, 2, 0, 1, 2),
+    (-7.14663943e-7, 3, 0, 1, 2),
+    (-2.66016305e-4, 0, 1, 1, 2),
+    (2.63789586e-4, 1, 1, 1, 2),
+    (-7.01199003e-6, 2, 1, 1, 2),
+    (-1.06823306e-4, 0, 2, 1, 2),
+    (3.61341136e-6, 1, 2, 1, 2),
+    (2.29748967e-7, 0, 3, 1, 2),
+    (3.04788893e-4, 0, 0, 2, 2),
+    (-6.42070836e-5, 1, 0, 2, 2),
+    (1.16257971e-6, 2, 0, 2, 2),
+    (7.68023384e-6, 0, 1, 2, 2),
+    (-5.47446896e-7, 1, 1, 2, 2),
+    (-3.59937910e-8, 0, 2, 2, 2),
+    (-4.36497725e-6, 0, 0, 3, 2),
+    (1.68737969e-7, 1, 0, 3, 2),
+    (2.67489271e-8, 0, 1, 3, 2),
+    (3.23926897e-9, 0, 0, 4, 2),
+    (-3.53874123e-2, 0, 0, 0, 3),
+    (-2.21201190e-1, 1, 0, 0, 3),
+    (1.55126038e-2, 2, 0, 0, 3),
+    (-2.63917279e-4, 3, 0, 0, 3),
+    (4.53433455e-2, 0, 1, 0, 3),
+    (-4.32943862e-3, 1, 1, 0, 3),
+    (1.45389826e-4, 2, 1, 0, 3),
+    (2.17508610e-4, 0, 2, 0, 3),
+    (-6.66724702e-5, 1, 2, 0, 3),
+    (3.33217140e-5, 0, 3, 0, 3),
+    (-2.26921615e-3, 0, 0, 1, 3),
+    (3.80261982e-4, 1, 0, 1, 3),
+    (-5.45314314e-9, 2, 0, 1, 3),
+    (-7.96355448e-4, 0, 1, 1, 3),
+    (2.53458034e-5, 1, 1, 1, 3),
+    (-6.31223658e-6, 0, 2, 1, 3),
+    (3.02122035e-4, 0, 0, 2, 3),
+    (-4.77403547e-6, 1, 0, 2, 3),
+    (1.73825715e-6, 0, 1, 2, 3),
+    (-4.09087898e-7, 0, 0, 3, 3),
+    (6.14155345e-1, 0, 0, 0, 4),
+    (-6.16755931e-2, 1, 0, 0, 4),
+    (1.33374846e-3, 2, 0, 0, 4),
+    (3.55375387e-3, 0, 1, 0, 4),
+    (-5.13027851e-4, 1, 1, 0, 4),
+    (1.02449757e-4, 0, 2, 0, 4),
+    (-1.48526421e-3, 0, 0, 1, 4),
+    (-4.11469183e-5, 1, 0, 1, 4),
+    (-6.80434415e-6, 0, 1, 1, 4),
+    (-9.77675906e-6, 0, 0, 2, 4),
+    (8.82773108e-2, 0, 0, 0, 5),
+    (-3.01859306e-3, 1, 0, 0, 5),
+    (1.04452989e-3, 0, 1, 0, 5),
+    (2.47090539e-4, 0, 0, 1, 5),
+    (1.48348065e-3, 0, 0, 0, 6),
+]
+# Coefficients indexed by the powers of wvp, dt, sfcWind and tas, in the nesting order of the Horner scheme.
+_UTCI_COEFFICIENTS = np.zeros((7, 7, 7, 7))
+for _coef, _n_t, _n_v, _n_d, _n_p in _UTCI_TERMS:
+    _UTCI_COEFFICIENTS[_n_p, _n_d, _n_v, _n_t] = _coef
+
+
+@vectorize(
+    [
+        float32(float32, float32, float32, float32),
+        float64(float64, float64, float64, float64),
+    ],
+    nopython=True,
+    cache=True,
+)
+def _utci(tas, sfcWind, dt, wvp):  # pragma: no cover
+    """
+    Return the empirical polynomial function for UTCI. See :py:func:`universal_thermal_climate_index`.
 
-    pet = pet.assign_attrs(units="mm")
-    rate = amount2rate(pet, out_units="mm/d")
-    out: xr.DataArray = convert_units_to(rate, "kg m-2 s-1", context="hydro")
-    return out
+    The sixth order polynomial of the four variables is evaluated with a nested Horner scheme, in double precision.
 
+    Parameters
+    ----------
+    tas : float
+        Surface temperature, °C (Ta).
+    sfcWind : float
+        Surface wind speed, m/s (va).
+    dt : float
+        Difference between the mean radiant temperature and the surface temperature, K (D_Tmrt).
+    wvp : float
+        Water vapour partial pressure, kPa (Pa).
 
-@vectorize
-def _utci(tas, sfcWind, dt, wvp):
-    """Return the empirical polynomial function for UTCI. See :py:func:`universal_thermal_climate_index`."""
-    # Taken directly from the original Fortran code by Peter Bröde.
-    # http://www.utci.org/public/UTCI%20Program%20Code/UTCI_a002.f90
-    # tas -> Ta (surface temperature, °C)
-    # sfcWind -> va (surface wind speed, m/s)
-    # dt -> D_Tmrt (tas - t_mrt, K)
-    # wvp -> Pa (water vapour partial pressure, kPa)
-    return (
-        tas
-        + 6.07562052e-1
-        + -2.27712343e-2 * tas
-        + 8.06470249e-4 * tas * tas
-        + -1.54271372e-4 * tas * tas * tas
-        + -3.24651735e-6 * tas * tas * tas * tas
-        + 7.32602852e-8 * tas * tas * tas * tas * tas
-        + 1.35959073e-9 * tas * tas * tas * tas * tas * tas
-        + -2.25836520e0 * sfcWind
-        + 8.80326035e-2 * tas * sfcWind
-        + 2.16844454e-3 * tas * tas * sfcWind
-        + -1.53347087e-5 * tas * tas * tas * sfcWind
-        + -5.72983704e-7 * tas * tas * tas * tas * sfcWind
-        + -2.55090145e-9 * tas * tas * tas * tas * tas * sfcWind
-        + -7.51269505e-1 * sfcWind * sfcWind
-        + -4.08350271e-3 * tas * sfcWind * sfcWind
-        + -5.21670675e-5 * tas * tas * sfcWind * sfcWind
-        + 1.94544667e-6 * tas * tas * tas * sfcWind * sfcWind
-        + 1.14099531e-8 * tas * tas * tas * tas * sfcWind * sfcWind
-        + 1.58137256e-1 * sfcWind * sfcWind * sfcWind
-        + -6.57263143e-5 * tas * sfcWind * sfcWind * sfcWind
-        + 2.22697524e-7 * tas * tas * sfcWind * sfcWind * sfcWind
-        + -4.16117031e-8 * tas * tas * tas * sfcWind * sfcWind * sfcWind
-        + -1.27762753e-2 * sfcWind * sfcWind * sfcWind * sfcWind
-        + 9.66891875e-6 * tas * sfcWind * sfcWind * sfcWind * sfcWind
-        + 2.52785852e-9 * tas * tas * sfcWind * sfcWind * sfcWind * sfcWind
-        + 4.56306672e-4 * sfcWind * sfcWind * sfcWind * sfcWind * sfcWind
-        + -1.74202546e-7 * tas * sfcWind * sfcWind * sfcWind * sfcWind * sfcWind
-        + -5.91491269e-6 * sfcWind * sfcWind * sfcWind * sfcWind * sfcWind * sfcWind
-        + 3.98374029e-1 * dt
-        + 1.83945314e-4 * tas * dt
-        + -1.73754510e-4 * tas * tas * dt
-        + -7.60781159e-7 * tas * tas * tas * dt
-        + 3.77830287e-8 * tas * tas * tas * tas * dt
-        + 5.43079673e-10 * tas * tas * tas * tas * tas * dt
-        + -2.00518269e-2 * sfcWind * dt
-        + 8.92859837e-4 * tas * sfcWind * dt
-        + 3.45433048e-6 * tas * tas * sfcWind * dt
-        + -3.77925774e-7 * tas * tas * tas * sfcWind * dt
-        + -1.69699377e-9 * tas * tas * tas * tas * sfcWind * dt
-        + 1.69992415e-4 * sfcWind * sfcWind * dt
-        + -4.99204314e-5 * tas * sfcWind * sfcWind * dt
-        + 2.47417178e-7 * tas * tas * sfcWind * sfcWind * dt
-        + 1.07596466e-8 * tas * tas * tas * sfcWind * sfcWind * dt
-        + 8.49242932e-5 * sfcWind * sfcWind * sfcWind * dt
-        + 1.35191328e-6 * tas * sfcWind * sfcWind * sfcWind * dt
-        + -6.21531254e-9 * tas * tas * sfcWind * sfcWind * sfcWind * dt
-        + -4.99410301e-6 * sfcWind * sfcWind * sfcWind * sfcWind * dt
-        + -1.89489258e-8 * tas * sfcWind * sfcWind * sfcWind * sfcWind * dt
-        + 8.15300114e-8 * sfcWind * sfcWind * sfcWind * sfcWind * sfcWind * dt
-        + 7.55043090e-4 * dt * dt
-        + -5.65095215e-5 * tas * dt * dt
-        + -4.52166564e-7 * tas * tas * dt * dt
-        + 2.46688878e-8 * tas * tas * tas * dt * dt
-        + 2.42674348e-10 * tas * tas * tas * tas * dt * dt
-        + 1.54547250e-4 * sfcWind * dt * dt
-        + 5.24110970e-6 * tas * sfcWind * dt * dt
-        + -8.75874982e-8 * tas * tas * sfcWind * dt * dt
-        + -1.50743064e-9 * tas * tas * tas * sfcWind * dt * dt
-        + -1.56236307e-5 * sfcWind * sfcWind * dt * dt
-        + -1.33895614e-7 * tas * sfcWind * sfcWind * dt * dt
-        + 2.49709824e-9 * tas * tas * sfcWind * sfcWind * dt * dt
-        + 6.51711721e-7 * sfcWind * sfcWind * sfcWind * dt * dt
-        + 1.94960053e-9 * tas * sfcWind * sfcWind * sfcWind * dt * dt
-        + -1.00361113e-8 * sfcWind * sfcWind * sfcWind * sfcWind * dt * dt
-        + -1.21206673e-5 * dt * dt * dt
-        + -2.18203660e-7 * tas * dt * dt * dt
-        + 7.51269482e-9 * tas * tas * dt * dt * dt
-        + 9.79063848e-11 * tas * tas * tas * dt * dt * dt
-        + 1.25006734e-6 * sfcWind * dt * dt * dt
-        + -1.81584736e-9 * tas * sfcWind * dt * dt * dt
-        + -3.52197671e-10 * tas * tas * sfcWind * dt * dt * dt
-        + -3.36514630e-8 * sfcWind * sfcWind * dt * dt * dt
-        + 1.35908359e-10 * tas * sfcWind * sfcWind * dt * dt * dt
-        + 4.17032620e-10 * sfcWind * sfcWind * sfcWind * dt * dt * dt
-        + -1.30369025e-9 * dt * dt * dt * dt
-        + 4.13908461e-10 * tas * dt * dt * dt * dt
-        + 9.22652254e-12 * tas * tas * dt * dt * dt * dt
-        + -5.08220384e-9 * sfcWind * dt * dt * dt * dt
-        + -2.24730961e-11 * tas * sfcWind * dt * dt * dt * dt
-        + 1.17139133e-10 * sfcWind * sfcWind * dt * dt * dt * dt
-        + 6.62154879e-10 * dt * dt * dt * dt * dt
-        + 4.03863260e-13 * tas * dt * dt * dt * dt * dt
-        + 1.95087203e-12 * sfcWind * dt * dt * dt * dt * dt
-        + -4.73602469e-12 * dt * dt * dt * dt * dt * dt
-        + 5.12733497e0 * wvp
-        + -3.12788561e-1 * tas * wvp
-        + -1.96701861e-2 * tas * tas * wvp
-        + 9.99690870e-4 * tas * tas * tas * wvp
-        + 9.51738512e-6 * tas * tas * tas * tas * wvp
-        + -4.66426341e-7 * tas * tas * tas * tas * tas * wvp
-        + 5.48050612e-1 * sfcWind * wvp
-        + -3.30552823e-3 * tas * sfcWind * wvp
-        + -1.64119440e-3 * tas * tas * sfcWind * wvp
-        + -5.16670694e-6 * tas * tas * tas * sfcWind * wvp
-        + 9.52692432e-7 * tas * tas * tas * tas * sfcWind * wvp
-        + -4.29223622e-2 * sfcWind * sfcWind * wvp
-        + 5.00845667e-3 * tas * sfcWind * sfcWind * wvp
-        + 1.00601257e-6 * tas * tas * sfcWind * sfcWind * wvp
-        + -1.81748644e-6 * tas * tas * tas * sfcWind * sfcWind * wvp
-        + -1.25813502e-3 * sfcWind * sfcWind * sfcWind * wvp
-        + -1.79330391e-4 * tas * sfcWind * sfcWind * sfcWind * wvp
-        + 2.34994441e-6 * tas * tas * sfcWind * sfcWind * sfcWind * wvp
-        + 1.29735808e-4 * sfcWind * sfcWind * sfcWind * sfcWind * wvp
-        + 1.29064870e-6 * tas * sfcWind * sfcWind * sfcWind * sfcWind * wvp
-        + -2.28558686e-6 * sfcWind * sfcWind * sfcWind * sfcWind * sfcWind * wvp
-        + -3.69476348e-2 * dt * wvp
-        + 1.62325322e-3 * tas * dt * wvp
-        + -3.14279680e-5 * tas * tas * dt * wvp
-        + 2.59835559e-6 * tas * tas * tas * dt * wvp
-        + -4.77136523e-8 * tas * tas * tas * tas * dt * wvp
-        + 8.64203390e-3 * sfcWind * dt * wvp
-        + -6.87405181e-4 * tas * sfcWind * dt * wvp
-        + -9.13863872e-6 * tas * tas * sfcWind * dt * wvp
-        + 5.15916806e-7 * tas * tas * tas * sfcWind * dt * wvp
-        + -3.59217476e-5 * sfcWind * sfcWind * dt * wvp
-        + 3.28696511e-5 * tas * sfcWind * sfcWind * dt * wvp
-        + -7.10542454e-7 * tas * tas * sfcWind * sfcWind * dt * wvp
-        + -1.24382300e-5 * sfcWind * sfcWind * sfcWind * dt * wvp
-        + -7.38584400e-9 * tas * sfcWind * sfcWind * sfcWind * dt * wvp
-        + 2.20609296e-7 * sfcWind * sfcWind * sfcWind * sfcWind * dt * wvp
-        + -7.32469180e-4 * dt * dt * wvp
-        + -1.87381964e-5 * tas * dt * dt * wvp
-        + 4.80925239e-6 * tas * tas * dt * dt * wvp
-        + -8.75492040e-8 * tas * tas * tas * dt * dt * wvp
-        + 2.77862930e-5 * sfcWind * dt * dt * wvp
-        + -5.06004592e-6 * tas * sfcWind * dt * dt * wvp
-        + 1.14325367e-7 * tas * tas * sfcWind * dt * dt * wvp
-        + 2.53016723e-6 * sfcWind * sfcWind * dt * dt * wvp
-        + -1.72857035e-8 * tas * sfcWind * sfcWind * dt * dt * wvp
-        + -3.95079398e-8 * sfcWind * sfcWind * sfcWind * dt * dt * wvp
-        + -3.59413173e-7 * dt * dt * dt * wvp
-        + 7.04388046e-7 * tas * dt * dt * dt * wvp
-        + -1.89309167e-8 * tas * tas * dt * dt * dt * wvp
-        + -4.79768731e-7 * sfcWind * dt * dt * dt * wvp
-        + 7.96079978e-9 * tas * sfcWind * dt * dt * dt * wvp
-        + 1.62897058e-9 * sfcWind * sfcWind * dt * dt * dt * wvp
-        + 3.94367674e-8 * dt * dt * dt * dt * wvp
-        + -1.18566247e-9 * tas * dt * dt * dt * dt * wvp
-        + 3.34678041e-10 * sfcWind * dt * dt * dt * dt * wvp
-        + -1.15606447e-10 * dt * dt * dt * dt * dt * wvp
-        + -2.80626406e0 * wvp * wvp
-        + 5.48712484e-1 * tas * wvp * wvp
-        + -3.99428410e-3 * tas * tas * wvp * wvp
-        + -9.54009191e-4 * tas * tas * tas * wvp * wvp
-        + 1.93090978e-5 * tas * tas * tas * tas * wvp * wvp
-        + -3.08806365e-1 * sfcWind * wvp * wvp
-        + 1.16952364e-2 * tas * sfcWind * wvp * wvp
-        + 4.95271903e-4 * tas * tas * sfcWind * wvp * wvp
-        + -1.90710882e-5 * tas * tas * tas * sfcWind * wvp * wvp
-        + 2.10787756e-3 * sfcWind * sfcWind * wvp * wvp
-        + -6.98445738e-4 * tas * sfcWind * sfcWind * wvp * wvp
-        + 2.30109073e-5 * tas * tas * sfcWind * sfcWind * wvp * wvp
-        + 4.17856590e-4 * sfcWind * sfcWind * sfcWind * wvp * wvp
-        + -1.27043871e-5 * tas * sfcWind * sfcWind * sfcWind * wvp * wvp
-        + -3.04620472e-6 * sfcWind * sfcWind * sfcWind * sfcWind * wvp * wvp
-        + 5.14507424e-2 * dt * wvp * wvp
-        + -4.32510997e-3 * tas * dt * wvp * wvp
-        + 8.99281156e-5 * tas * tas * dt * wvp * wvp
-        + -7.14663943e-7 * tas * tas * tas * dt * wvp * wvp
-        + -2.66016305e-4 * sfcWind * dt * wvp * wvp
-        + 2.63789586e-4 * tas * sfcWind * dt * wvp * wvp
-        + -7.01199003e-6 * tas * tas * sfcWind * dt * wvp * wvp
-        + -1.06823306e-4 * sfcWind * sfcWind * dt * wvp * wvp
-        + 3.61341136e-6 * tas * sfcWind * sfcWind * dt * wvp * wvp
-        + 2.29748967e-7 * sfcWind * sfcWind * sfcWind * dt * wvp * wvp
-        + 3.04788893e-4 * dt * dt * wvp * wvp
-        + -6.42070836e-5 * tas * dt * dt * wvp * wvp
-        + 1.16257971e-6 * tas * tas * dt * dt * wvp * wvp
-        + 7.68023384e-6 * sfcWind * dt * dt * wvp * wvp
-        + -5.47446896e-7 * tas * sfcWind * dt * dt * wvp * wvp
-        + -3.59937910e-8 * sfcWind * sfcWind * dt * dt * wvp * wvp
-        + -4.36497725e-6 * dt * dt * dt * wvp * wvp
-        + 1.68737969e-7 * tas * dt * dt * dt * wvp * wvp
-        + 2.67489271e-8 * sfcWind * dt * dt * dt * wvp * wvp
-        + 3.23926897e-9 * dt * dt * dt * dt * wvp * wvp
-        + -3.53874123e-2 * wvp * wvp * wvp
-        + -2.21201190e-1 * tas * wvp * wvp * wvp
-        + 1.55126038e-2 * tas * tas * wvp * wvp * wvp
-        + -2.63917279e-4 * tas * tas * tas * wvp * wvp * wvp
-        + 4.53433455e-2 * sfcWind * wvp * wvp * wvp
-        + -4.32943862e-3 * tas * sfcWind * wvp * wvp * wvp
-        + 1.45389826e-4 * tas * tas * sfcWind * wvp * wvp * wvp
-        + 2.17508610e-4 * sfcWind * sfcWind * wvp * wvp * wvp
-        + -6.66724702e-5 * tas * sfcWind * sfcWind * wvp * wvp * wvp
-        + 3.33217140e-5 * sfcWind * sfcWind * sfcWind * wvp * wvp * wvp
-        + -2.26921615e-3 * dt * wvp * wvp * wvp
-        + 3.80261982e-4 * tas * dt * wvp * wvp * wvp
-        + -5.45314314e-9 * tas * tas * dt * wvp * wvp * wvp
-        + -7.96355448e-4 * sfcWind * dt * wvp * wvp * wvp
-        + 2.53458034e-5 * tas * sfcWind * dt * wvp * wvp * wvp
-        + -6.31223658e-6 * sfcWind * sfcWind * dt * wvp * wvp * wvp
-        + 3.02122035e-4 * dt * dt * wvp * wvp * wvp
-        + -4.77403547e-6 * tas * dt * dt * wvp * wvp * wvp
-        + 1.73825715e-6 * sfcWind * dt * dt * wvp * wvp * wvp
-        + -4.09087898e-7 * dt * dt * dt * wvp * wvp * wvp
-        + 6.14155345e-1 * wvp * wvp * wvp * wvp
-        + -6.16755931e-2 * tas * wvp * wvp * wvp * wvp
-        + 1.33374846e-3 * tas * tas * wvp * wvp * wvp * wvp
-        + 3.55375387e-3 * sfcWind * wvp * wvp * wvp * wvp
-        + -5.13027851e-4 * tas * sfcWind * wvp * wvp * wvp * wvp
-        + 1.02449757e-4 * sfcWind * sfcWind * wvp * wvp * wvp * wvp
-        + -1.48526421e-3 * dt * wvp * wvp * wvp * wvp
-        + -4.11469183e-5 * tas * dt * wvp * wvp * wvp * wvp
-        + -6.80434415e-6 * sfcWind * dt * wvp * wvp * wvp * wvp
-        + -9.77675906e-6 * dt * dt * wvp * wvp * wvp * wvp
-        + 8.82773108e-2 * wvp * wvp * wvp * wvp * wvp
-        + -3.01859306e-3 * tas * wvp * wvp * wvp * wvp * wvp
-        + 1.04452989e-3 * sfcWind * wvp * wvp * wvp * wvp * wvp
-        + 2.47090539e-4 * dt * wvp * wvp * wvp * wvp * wvp
-        + 1.48348065e-3 * wvp * wvp * wvp * wvp * wvp * wvp
-    )
+    Returns
+    -------
+    float
+        UTCI, °C.
+    """
+    t = np.float64(tas)
+    v = np.float64(sfcWind)
+    d = np.float64(dt)
+    p = np.float64(wvp)
+    out = 0.0
+    for n_p in range(6, -1, -1):
+        out_d = 0.0
+        for n_d in range(6 - n_p, -1, -1):
+            out_v = 0.0
+            for n_v in range(6 - n_p - n_d, -1, -1):
+                out_t = 0.0
+                for n_t in range(6 - n_p - n_d - n_v, -1, -1):
+                    out_t = out_t * t + _UTCI_COEFFICIENTS[n_p, n_d, n_v, n_t]
+                out_v = out_v * v + out_t
+            out_d = out_d * d + out_v
+        out = out * p + out_d
+    return t + out
 
 
 @declare_units(
@@ -2452,6 +2803,8 @@ def universal_thermal_climate_index(
     humidity and saturation vapour pressure computed according to the ITS-90 equation.
 
     This code was inspired by the `pythermalcomfort` and `thermofeel` packages.
+    The polynomial approximation of the UTCI is evaluated element-wise by a compiled kernel, in double precision,
+    and the output has the same data type as the inputs.
 
     For more information: https://www.utci.org/
 
@@ -2478,7 +2831,7 @@ def universal_thermal_climate_index(
         pa,
         input_core_dims=[[], [], [], []],
         dask="parallelized",
-        output_dtypes=[tas.dtype],
+        output_dtypes=[np.result_type(tas, sfcWind, delta, pa)],
     )
 
     utci = utci.assign_attrs({"units": "degC"})
@@ -2522,7 +2875,7 @@ def _fdir_ratio(
     ----------
     :cite:cts:`liljegren_modeling_2008,kong_explicit_2022`
     """
-    d = distance_from_sun(dates)
+    d = cast_to_preserved_dtype(distance_from_sun(dates), rsds)
     s_star = rsds * ((1367 * csza * (d ** (-2))) ** (-1))
     s_star = xr.where(s_star > 0.85, 0.85, s_star)
     fdir_ratio = np.exp(3 - 1.34 * s_star - 1.65 * (s_star ** (-1)))
@@ -2611,6 +2964,7 @@ def mean_radiant_temperature(
         )
     else:
         raise NotImplementedError("Argument 'stat' must be one of 'instant' or 'sunlit'.")
+    csza = cast_to_preserved_dtype(csza, rsds)
 
     fdir_ratio = _fdir_ratio(dates, csza, rsds)
 
@@ -2886,7 +3240,7 @@ def wind_power_potential(
     v = wind_speed * f
 
     out: xr.DataArray = xr.apply_ufunc(_wind_power_factor, v, cut_in, rated, cut_out)
-    out = out.assign_attrs(units="")
+    out = cast_to_preserved_dtype(out, wind_speed).assign_attrs(units="")
     return out
 
 
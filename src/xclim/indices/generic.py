@@ -34,6 +34,7 @@ from xclim.core.units import (
     to_agg_units,
     units2pint,
 )
+from xclim.core.utils import cast_to_preserved_dtype
 from xclim.indices import run_length as rl
 from xclim.indices.helpers import resample_map
 
@@ -494,7 +495,7 @@ def spell_mask(
             raise ValueError(f"Argument 'weights' is only supported if 'win_reducer' is 'mean'. Got :  {win_reducer}")
         if len(weights) != window:
             raise ValueError(f"Weights have a different length ({len(weights)}) than the window ({window}).")
-        weights = xr.DataArray(weights, dims=("window",))
+        weights = cast_to_preserved_dtype(xr.DataArray(weights, dims=("window",)), data)
 
     if window == 1:  # Fast path
         is_in_spell = compare(data, op, thresh)
@@ -1705,7 +1706,8 @@ def get_zones(
     if exclude_boundary_zones:
         zones = zones.where((zones != _get_zone(bins[0] - 1)) & (zones != _get_zone(bins[-1])))
 
-    return zones
+    # Zones are integers, unless they are masked with NaN
+    return cast_to_preserved_dtype(zones, da)
 
 
 def detrend(ds: xr.DataArray | xr.Dataset, dim="time", deg=1) -> xr.DataArray | xr.Dataset:
@@ -1731,7 +1733,7 @@ def detrend(ds: xr.DataArray | xr.Dataset, dim="time", deg=1) -> xr.DataArray |
     # is a DataArray
     # detrend along a single dimension
     coeff = ds.polyfit(dim=dim, deg=deg)
-    trend = xr.polyval(ds[dim], coeff.polyfit_coefficients)
+    trend = cast_to_preserved_dtype(xr.polyval(ds[dim], coeff.polyfit_coefficients), ds)
     with xr.set_options(keep_attrs=True):
         return ds - trend
 
@@ -8,8 +8,10 @@ but are not particularly index-like themselves (those should go in the :py:mod:`
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Callable, Mapping
 from datetime import timedelta
+from functools import wraps
 from inspect import stack
 from typing import Any, Literal, cast
 
@@ -17,6 +19,7 @@ import cftime
 import numba as nb
 import numpy as np
 import xarray as xr
+from dask.base import tokenize
 from xarray import CFTimeIndex
 
 try:
@@ -35,9 +38,9 @@ except ImportError:
 
 from xclim.core import DayOfYearStr, Quantified
 from xclim.core.calendar import ensure_cftime_array, get_calendar, parse_offset, select_time
-from xclim.core.options import MAP_BLOCKS, OPTIONS
+from xclim.core.options import MAP_BLOCKS, OPTIONS, SOLAR_GEOMETRY_CACHE
 from xclim.core.units import convert_units_to
-from xclim.core.utils import _chunk_like, uses_dask
+from xclim.core.utils import _chunk_like, cast_to_preserved_dtype, uses_dask
 
 __all__ = [
     "cosine_of_solar_zenith_angle",
@@ -62,6 +65,66 @@ def _wrap_radians(da):
         return ((da + np.pi) % (2 * np.pi)) - np.pi
 
 
+_SOLAR_GEOMETRY: OrderedDict[str, xr.DataArray] = OrderedDict()
+
+
+def _geometry_token(arg: Any) -> Any:
+    """Reduce a DataArray argument to what the solar geometry depends on: its values, indexes and units."""
+    if isinstance(arg, xr.DataArray):
+        return arg.dims, arg.data, dict(arg.indexes), arg.attrs.get("units")
+    return arg
+
+
+def _cache_solar_geometry(func: Callable) -> Callable:
+    """
+    Cache the outputs of a solar geometry function.
+
+    The size of the cache is controlled by the `solar_geometry_cache` option of :py:class:`xclim.set_options`.
+
+    Outputs are keyed on the function name and on the values, indexes and units of all arguments. The token of
+    numpy-backed arrays is computed from their values and the one of dask-backed arrays from their graph name. Scalar
+    coordinates and other attributes are not part of the key, so that inputs on the same grid share their fields, and
+    the non-index coordinates of the inputs are assigned to the cached output. The least recently used fields are
+    dropped when the cache is full.
+    """
+
+    @wraps(func)
+    def _cached_func(*args, **kwargs):
+        maxsize = OPTIONS[SOLAR_GEOMETRY_CACHE]
+        if maxsize == 0:
+            _SOLAR_GEOMETRY.clear()
+            return func(*args, **kwargs)
+
+        key = tokenize(
+            func.__name__, [_geometry_token(arg) for arg in args], {k: _geometry_token(v) for k, v in kwargs.items()}
+        )
+        if key in _SOLAR_GEOMETRY:
+            _SOLAR_GEOMETRY.move_to_end(key)
+        else:
+            _SOLAR_GEOMETRY[key] = func(
+                *[arg.reset_coords(drop=True) if isinstance(arg, xr.DataArray) else arg for arg in args],
+                **{k: v.reset_coords(drop=True) if isinstance(v, xr.DataArray) else v for k, v in kwargs.items()},
+            )
+            while len(_SOLAR_GEOMETRY) > maxsize:
+                _SOLAR_GEOMETRY.popitem(last=False)
+
+        # A shallow copy, so that modifications of the attributes are not shared
+        out = _SOLAR_GEOMETRY[key].copy(deep=False)
+        coords = {}
+        for arg in [*args, *kwargs.values()]:
+            if isinstance(arg, xr.DataArray):
+                coords.update(
+                    {
+                        name: crd
+                        for name, crd in arg.coords.items()
+                        if name not in arg.indexes and set(crd.dims) <= set(out.dims)
+                    }
+                )
+        return out.assign_coords(coords)
+
+    return _cached_func
+
+
 def distance_from_sun(dates: xr.DataArray) -> xr.DataArray:
     """
     Sun-earth distance.
@@ -116,6 +179,7 @@ def day_angle(time: xr.DataArray) -> xr.DataArray:
     return ((decimal_year % 1) * 2 * np.pi).assign_attrs(units="rad")
 
 
+@_cache_solar_geometry
 def solar_declination(time: xr.DataArray, method="spencer") -> xr.DataArray:
     """
     Solar declination.
@@ -192,6 +256,7 @@ def time_correction_for_solar_angle(time: xr.DataArray) -> xr.DataArray:
     return _wrap_radians(convert_units_to(tc, "rad"))
 
 
+@_cache_solar_geometry
 def eccentricity_correction_factor(
     time: xr.DataArray, method: Literal["spencer", "simple"] = "spencer"
 ) -> xr.DataArray:
@@ -238,6 +303,7 @@ def eccentricity_correction_factor(
     raise NotImplementedError("Method must be one of 'simple' or 'spencer'.")
 
 
+@_cache_solar_geometry
 def cosine_of_solar_zenith_angle(
     time: xr.DataArray,
     declination: xr.DataArray,
@@ -397,6 +463,7 @@ def _sunlit_integral_of_cosine_of_solar_zenith_angle(declination, lat, h_sunset,
     return out
 
 
+@_cache_solar_geometry
 def extraterrestrial_solar_radiation(
     times: xr.DataArray,
     lat: xr.DataArray,
@@ -447,6 +514,7 @@ def extraterrestrial_solar_radiation(
     ).assign_attrs(units="J m-2 d-1")
 
 
+@_cache_solar_geometry
 def day_lengths(
     dates: xr.DataArray,
     lat: Quantified | xr.Dataset | xr.DataTree,
@@ -844,7 +912,7 @@ def wind_speed_height_conversion(
                 f"Heights must be greater than {1 + 5.42 / 67.8}"
             )
         with xr.set_options(keep_attrs=True):
-            return ua * np.log(67.8 * h_target - 5.42) / np.log(67.8 * h_source - 5.42)
+            return ua * cast_to_preserved_dtype(np.log(67.8 * h_target - 5.42) / np.log(67.8 * h_source - 5.42), ua)
     else:
         raise NotImplementedError(f"'{method}' method is not implemented.")
 
@@ -1056,6 +1124,74 @@ def _add_one_day(time: xr.DataArray) -> xr.DataArray:
     return time + np.timedelta64(1, "D")
 
 
+@nb.njit(cache=True)
+def _hourly_temperature(hour, tasmin, tasmax, next_tasmin, daylength):  # pragma: no cover
+    """
+    Compute the temperature at a given hour from the daily extremes.
+
+    Scalar version of the profile used in :py:func:`make_hourly_temperature`, meant to be called from numba kernels
+    that need hourly values without allocating the hourly array.
+
+    Parameters
+    ----------
+    hour : int
+        Hour of the day, from 0 to 23.
+    tasmin : float
+        Daily minimum temperature.
+    tasmax : float
+        Daily maximum temperature.
+    next_tasmin : float
+        Minimum temperature of the following day.
+    daylength : float
+        Length of the day in hours.
+
+    Returns
+    -------
+    float
+        Hourly temperature.
+    """
+    if hour < daylength:
+        return (tasmax - tasmin) * np.sin((np.pi * hour) / (daylength + 4)) + tasmin
+    tas_sunset = (tasmax - tasmin) * np.sin((np.pi * daylength) / (daylength + 4)) + tasmin
+    hours_after_sunset = hour + 1 - daylength
+    if hours_after_sunset < 1:
+        hours_after_sunset = 1.0
+    return tas_sunset - ((tas_sunset - next_tasmin) / np.log(24 - (daylength - 1))) * np.log(hours_after_sunset)
+
+
+def _hourly_temperature_parameters(tasmin: xr.DataArray, tasmax: xr.DataArray) -> xr.Dataset:
+    """
+    Gather the daily parameters of the hourly temperature profile.
+
+    These are the inputs of :py:func:`_hourly_temperature`, with the same conventions as
+    :py:func:`make_hourly_temperature`: the minimum temperature of the day following the last one is the last
+    minimum temperature.
+
+    Parameters
+    ----------
+    tasmin : xarray.DataArray
+        Daily minimum temperature.
+    tasmax : xarray.DataArray
+        Daily maximum temperature, in the same units as `tasmin`.
+
+    Returns
+    -------
+    xarray.Dataset
+        Daily `tasmin`, `tasmax`, `next_tasmin` and `daylength` (in hours).
+    """
+    is_last = tasmin.time == tasmin.time[-1]
+    next_tasmin = tasmin.roll(time=-1).where(~is_last, tasmin)
+    daylength = day_lengths(tasmin.time, _gather_lat(tasmin))
+    return xr.Dataset(
+        {
+            "tasmin": tasmin,
+            "tasmax": tasmax,
+            "next_tasmin": next_tasmin,
+            "daylength": daylength,
+        }
+    )
+
+
 def make_hourly_temperature(tasmin: xr.DataArray, tasmax: xr.DataArray) -> xr.DataArray:
     """
     Compute hourly temperatures from tasmin and tasmax.
@@ -1079,6 +1215,11 @@ def make_hourly_temperature(tasmin: xr.DataArray, tasmax: xr.DataArray) -> xr.Da
     -------
     xarray.DataArray
         Hourly temperature.
+
+    Notes
+    -----
+    The hourly array is 24 times larger than the inputs. To compute chill metrics without allocating it, see
+    :py:func:`xclim.indices.chill_units_from_daily` and :py:func:`xclim.indices.chill_portions_from_daily`.
     """
     data = xr.merge([tasmin, tasmax])
     data = data.assign_coords(time=data.time.dt.floor("D"))
@@ -19,8 +19,8 @@ import xarray as xr
 from numba import njit
 
 from xclim.core import DateStr, DayOfYearStr
-from xclim.core.options import OPTIONS, RUN_LENGTH_UFUNC
-from xclim.core.utils import lazy_indexing, uses_dask
+from xclim.core.options import OPTIONS, PRESERVE_DTYPE, RUN_LENGTH_UFUNC
+from xclim.core.utils import cast_to_preserved_dtype, lazy_indexing, uses_dask
 from xclim.indices.helpers import resample_map
 
 npts_opt = 9000
@@ -139,6 +139,34 @@ def _smallest_uint(da, dim):
     return np.uint64
 
 
+def _single_precision(da, dim) -> bool:
+    """Whether run lengths and positions along `dim`, which may be NaN, are computed as float32 instead of float64."""
+    # float32 represents all integers up to 2**24 exactly
+    return OPTIONS[PRESERVE_DTYPE] and da[dim].size < 2**24
+
+
+def _cast_single_precision(out: xr.DataArray, da: xr.DataArray, dim: str, coord: bool | str | None = None):
+    """
+    Cast floating point run lengths or positions along `dim` to float32, if `_single_precision`.
+
+    Integer and datetime outputs are returned as is, as are the values of a coordinate (`coord=True`),
+    which are not bounded by the size of `dim`.
+    """
+    if (
+        _single_precision(da, dim)
+        and np.issubdtype(out.dtype, np.floating)
+        and out.dtype.itemsize > 4
+        and (not coord or isinstance(coord, str))
+    ):
+        return out.astype(np.float32)
+    return out
+
+
+def _nan_float(da, dim) -> type:
+    """Floating point type of the run lengths and positions along `dim`, which may be NaN."""
+    return np.float32 if _single_precision(da, dim) else float
+
+
 # Specifying `one` allows in-place multiplication *=
 @njit
 def _cumsum_reset_np(arr, index, one):
@@ -257,6 +285,9 @@ def rle(
 
     # Get cumulative sum for each series of 1, e.g. da == 100110111 -> cs_s == 100120123
     cs_s = _cumsum_reset(da, dim)
+    if _single_precision(da, dim) and not np.issubdtype(cs_s.dtype, np.floating):
+        # The lengths are masked with NaN below, promote them to float32 instead of float64
+        cs_s = cs_s.astype(np.float32)
 
     # Keep total length of each series (and also keep 0's), e.g. 100120123 -> 100N20NN3
     # Keep numbers with a 0 to the right and also the last number
@@ -631,7 +662,7 @@ def _boundary_run(
         else:
             out = find_boundary_run(d, position)
 
-    return out
+    return _cast_single_precision(out, da, dim, coord)
 
 
 def first_run(
@@ -1174,7 +1205,7 @@ def run_end_after_date(
     """
     mid_idx = index_of_date(da[dim], date, max_idxs=1, default=0)
     if mid_idx.size == 0:  # The date is not within the group. Happens at boundaries.
-        return xr.full_like(da.isel({dim: 0}), np.nan, float).drop_vars(dim)
+        return xr.full_like(da.isel({dim: 0}), np.nan, _nan_float(da, dim)).drop_vars(dim)
 
     end = first_run(
         (~da).where(da[dim] >= da[dim][mid_idx][0]),
@@ -1192,6 +1223,7 @@ def run_end_after_date(
         last = da[dim].size - 1
 
     end = xr.where(end.isnull() & beg.notnull(), last, end)
+    end = _cast_single_precision(end, da, dim, coord)
     return end.where(beg.notnull()).drop_vars(dim, errors="ignore")
 
 
@@ -1228,7 +1260,7 @@ def first_run_after_date(
     """
     mid_idx = index_of_date(da[dim], date, max_idxs=1, default=0)
     if mid_idx.size == 0:  # The date is not within the group. Happens at boundaries.
-        return xr.full_like(da.isel({dim: 0}), np.nan, float).drop_vars(dim)
+        return xr.full_like(da.isel({dim: 0}), np.nan, _nan_float(da, dim)).drop_vars(dim)
 
     return first_run(
         da.where(da[dim] >= da[dim][mid_idx][0]),
@@ -1272,7 +1304,7 @@ def last_run_before_date(
     mid_idx = index_of_date(da[dim], date, default=-1)
 
     if mid_idx.size == 0:  # The date is not within the group. Happens at boundaries.
-        return xr.full_like(da.isel({dim: 0}), np.nan, float).drop_vars(dim)
+        return xr.full_like(da.isel({dim: 0}), np.nan, _nan_float(da, dim)).drop_vars(dim)
 
     run = da.where(da[dim] <= da[dim][mid_idx][0])
     return last_run(run, window=window, dim=dim, coord=coord)
@@ -1312,7 +1344,7 @@ def first_run_before_date(
     if date is not None:
         mid_idx = index_of_date(da[dim], date, max_idxs=1, default=0)
         if mid_idx.size == 0:  # The date is not within the group. Happens at boundaries.
-            return xr.full_like(da.isel({dim: 0}), np.nan, float).drop_vars(dim)
+            return xr.full_like(da.isel({dim: 0}), np.nan, _nan_float(da, dim)).drop_vars(dim)
         # Mask anything after the mid_date + window - 1
         # Thus, the latest run possible can begin on the day just before mid_idx
         da = da.where(da[dim] < da[dim][mid_idx + window - 1][0])
@@ -1557,7 +1589,7 @@ def statistics_run_ufunc(
     xr.DataArray
         A function operating along the time dimension of a dask-array.
     """
-    return xr.apply_ufunc(
+    out = xr.apply_ufunc(
         statistics_run_1d,
         x,
         input_core_dims=[[dim]],
@@ -1567,6 +1599,7 @@ def statistics_run_ufunc(
         output_dtypes=[float],
         keep_attrs=True,
     )
+    return _cast_single_precision(out, x, dim)
 
 
 def first_run_ufunc(
@@ -1603,8 +1636,7 @@ def first_run_ufunc(
         keep_attrs=True,
         kwargs={"window": window},
     )
-
-    return ind
+    return _cast_single_precision(ind, x, dim)
 
 
 def index_of_date(
@@ -1797,6 +1829,11 @@ def _find_events(da_start, da_stop, data, window_start, window_stop):
         dask="parallelized",
         vectorize=True,
     )
+    # Only the event start, in seconds, needs double precision
+    ds["event_length"] = _cast_single_precision(ds.event_length, da_start, "time")
+    ds["event_effective_length"] = _cast_single_precision(ds.event_effective_length, da_start, "time")
+    if data is not None:
+        ds["event_sum"] = cast_to_preserved_dtype(ds.event_sum, data)
 
     # convert back start to a time
     if time_min.dtype == "O":
@@ -6,6 +6,7 @@ import sys
 import numpy as np
 import pandas as pd
 import pytest
+import xarray as xr
 from numpy.testing import assert_almost_equal
 from scipy import integrate, stats
 from sklearn import datasets
@@ -117,6 +118,91 @@ def test_spatial_analogs_multi_index(open_dataset):
     xca.spatial_analogs(target_stacked, candidates_stacked, dist_dim="sample", method=method)
 
 
+@pytest.mark.parametrize("use_dask,n_workers", [(True, 1), (False, 1), (False, 3)])
+@pytest.mark.parametrize(
+    "method",
+    [
+        "seuclidean",
+        "nearest_neighbor",
+        "zech_aslan",
+        "szekely_rizzo",
+        "friedman_rafsky",
+        "kolmogorov_smirnov",
+        "kldiv",
+        "mahalanobis",
+    ],
+)
+def test_spatial_analogs_batched(method, use_dask, n_workers, random):
+    # The batched implementations give the same results as the metrics applied on each candidate.
+    def sample(**sizes):
+        dims = ("time", *sizes.keys())
+        shape = (20, *sizes.values())
+        return xr.Dataset(
+            {
+                "a": (dims, random.standard_normal(shape)),
+                "b": (dims, random.standard_normal(shape) * 3 + 10),
+            },
+            coords={"time": np.arange(20)},
+        )
+
+    target = sample()
+    candidates = sample(lat=4, lon=5).isel(time=slice(None, 15))
+    candidates["a"][:, 1, 2] = np.nan
+    if use_dask:
+        candidates = candidates.chunk({"lon": 2})
+
+    out = xca.spatial_analogs(target, candidates, method=method, n_workers=n_workers)
+    assert out.dims == ("lat", "lon")
+    assert out.attrs["metric"] == method
+
+    x = target.to_array().values.T
+    exp = np.array(
+        [
+            [xca.metrics[method](x, candidates.isel(lat=i, lon=j).to_array().values.T) for j in range(5)]
+            for i in range(4)
+        ]
+    )
+    assert np.isnan(out[1, 2])
+    np.testing.assert_allclose(out, exp, rtol=1e-12)
+
+
+@pytest.mark.parametrize("use_dask", [True, False])
+def test_spatial_analogs_top_k(use_dask, random):
+    dims = ("time", "lat", "lon")
+    candidates = xr.Dataset(
+        {
+            "a": (dims, random.standard_normal((20, 4, 5)) + np.arange(5)),
+            "b": (dims, random.standard_normal((20, 4, 5)) * 3 + 10),
+        },
+        coords={"time": np.arange(20), "lat": np.arange(4) + 45.0, "lon": np.arange(5) - 70.0},
+    )
+    candidates["a"][:, 2, 1] = np.nan
+    target = candidates.isel(lat=1, lon=1, time=slice(5, None)).drop_vars(["lat", "lon"])
+    if use_dask:
+        candidates = candidates.chunk({"lat": 2})
+
+    out = xca.spatial_analogs(target, candidates, method="zech_aslan", top_k=3, shortlist=8)
+    assert out.dims == ("analog",)
+    assert out.attrs["prefilter"] == "seuclidean"
+
+    # The shortlist holds the 8 best candidates according to the prefilter
+    coarse = xca.spatial_analogs(target, candidates, method="seuclidean").stack(cell=["lat", "lon"]).dropna("cell")
+    shortlist = coarse.sortby(coarse).cell[:8]
+    full = xca.spatial_analogs(target, candidates, method="zech_aslan").stack(cell=["lat", "lon"])
+    exp = full.sel(cell=shortlist).sortby(full.sel(cell=shortlist))[:3]
+    np.testing.assert_allclose(out, exp)
+    np.testing.assert_array_equal(out.lat, exp.lat)
+    np.testing.assert_array_equal(out.lon, exp.lon)
+
+    # Without shortlist, the candidates with missing values are never returned
+    out = xca.spatial_analogs(target, candidates, method="seuclidean", top_k=25)
+    assert out.analog.size == 19
+    np.testing.assert_allclose(out, coarse.sortby(coarse))
+
+    with pytest.raises(ValueError, match="single target"):
+        xca.spatial_analogs(candidates.isel(lat=0), candidates, top_k=3)
+
+
 class TestSEuclidean:
     def test_simple(self, exact_randn):
         d = 2
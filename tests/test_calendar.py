@@ -9,12 +9,17 @@ from numpy.testing import assert_array_equal
 from xarray.coding.cftimeindex import CFTimeIndex
 
 from xclim.core.calendar import (
+    _convert_doy_date,
+    _infer_freq,
+    _is_leap_year,
+    _time_field,
     adjust_doy_calendar,
     climatological_mean_doy,
     common_calendar,
     compare_offsets,
     construct_offset,
     convert_doy,
+    datetime_classes,
     days_since_to_doy,
     doy_to_days_since,
     ensure_cftime_array,
@@ -116,6 +121,13 @@ def test_percentile_doy_no_copy(tas_series, use_dask):
     assert not np.testing.assert_array_equal(original_tas, tas)
 
 
+def test_percentile_doy_leap_chunks(tas_series):
+    # Interpolating doy 1-365 to 1-366 keeps a single chunk along dayofyear.
+    tas = tas_series(np.arange(366 * 2), start="1/1/2000").chunk(dict(time=50))
+    p1 = percentile_doy(tas, window=5, per=50)
+    assert p1.chunks[p1.get_axis_num("dayofyear")] == (366,)
+
+
 def test_percentile_doy_invalid():
     tas = xr.DataArray(
         [0, 1],
@@ -440,6 +452,41 @@ def test_convert_doy():
     np.testing.assert_allclose(out.isel(lat=0), [31.0, 200.48, 190.0, 59.83607, 299.71885])
 
 
+@pytest.mark.parametrize("cal", ["standard", "proleptic_gregorian", "julian", "noleap", "all_leap", "360_day"])
+def test_is_leap_year(cal):
+    years = np.array([-4, 1, 4, 1500, 1582, 1600, 1700, 1900, 2000, 2023, 2024])
+    exp = [cftime.is_leap_year(y, cal) for y in years]
+    np.testing.assert_array_equal(_is_leap_year(years, cal), exp)
+    np.testing.assert_array_equal(_is_leap_year(years[1:], cal), exp[1:])
+
+
+@pytest.mark.parametrize("source_cal", ["standard", "noleap", "all_leap", "360_day", "julian"])
+@pytest.mark.parametrize("target_cal", ["proleptic_gregorian", "noleap", "all_leap", "360_day"])
+def test_convert_doy_date_elementwise(source_cal, target_cal):
+    years = np.array([1500, 1900, 2000, 2001, 2004])
+    doys = np.array([1, 31.5, 59, 60, 61, 150.25, 240, 359, 360, 365, 366, np.nan])
+    doy = xr.DataArray(
+        np.tile(doys, (years.size, 1)),
+        dims=("time", "x"),
+        coords={"time": [datetime_classes[source_cal](y, 1, 1) for y in years]},
+        attrs={"is_dayofyear": 1, "calendar": source_cal},
+    )
+
+    out = convert_doy(doy, target_cal, align_on="date")
+
+    exp = [
+        [
+            np.nan
+            if np.isnan(d)
+            else _convert_doy_date(d, y, datetime_classes[source_cal], datetime_classes[target_cal])
+            for d in doys
+        ]
+        for y in years
+    ]
+    np.testing.assert_allclose(out, exp)
+    np.testing.assert_allclose(convert_doy(doy.chunk(x=4), target_cal, align_on="date"), exp)
+
+
 @pytest.mark.parametrize("use_cftime", [True, False])
 @pytest.mark.parametrize(
     "sf,w,s,m,f,ss",
@@ -484,3 +531,63 @@ def test_stack_periods_special(tas_series):
 
     da2 = unstack_periods(da_stck.drop_vars("horizon_length"), dim="horizon")
     xr.testing.assert_identical(da2, da.isel(time=slice(0, da2.time.size)))
+
+
+@pytest.mark.parametrize("use_dask", [True, False])
+def test_stack_periods_strided(tas_series, use_dask):
+    da = tas_series(np.arange(365 * 50.0), start="2000-01-01", calendar="noleap")
+    da = xr.concat([da, da + 1], "x").assign_coords(x=[1, 2], x_name=("x", ["a", "b"]))
+    if use_dask:
+        da = da.chunk(time=365 * 5, x=1)
+
+    da_stck = stack_periods(da, window=30, stride=10)
+    assert da_stck.dims == ("period", "x", "time")
+    assert da_stck.period.size == 3
+    assert "x_name" in da_stck.coords
+    if use_dask:
+        # The chunks of the other dimensions are kept
+        assert da_stck.chunks[1] == (1, 1)
+    else:
+        # A read-only view of the input
+        assert np.shares_memory(da_stck.values, da.values)
+        assert not da_stck.values.flags.writeable
+    np.testing.assert_array_equal(da_stck.isel(period=1, x=1), da.isel(x=1, time=slice(3650, 3650 + 10950)))
+
+    # Same result as with unequal lengths, which are concatenated
+    exp = stack_periods(da, window=30, stride=10, min_length=20)
+    xr.testing.assert_identical(da_stck, exp.isel(period=slice(0, 3)).assign_coords(period=da_stck.period))
+
+    da2 = unstack_periods(da_stck)
+    xr.testing.assert_identical(da2, da.isel(time=slice(0, da2.time.size)))
+
+
+@pytest.mark.parametrize(
+    "calendar,start",
+    [
+        ("standard", "1990-01-01"),
+        ("standard", "1580-06-01"),
+        ("proleptic_gregorian", "1895-06-01"),
+        ("julian", "1990-01-01"),
+        ("noleap", "0001-01-01"),
+        ("all_leap", "1990-01-01"),
+        ("360_day", "1990-01-01"),
+    ],
+)
+def test_time_field(calendar, start):
+    time = xr.DataArray(
+        xr.date_range(start, periods=3000, freq="19h", calendar=calendar, use_cftime=True), dims=("time",), name="time"
+    )
+    time = time.assign_coords(time=time)
+    for field in ["year", "month", "day", "dayofyear"]:
+        out = _time_field(time, field)
+        exp = getattr(time.dt, field)
+        xr.testing.assert_identical(out, exp)
+        # Cached with the index
+        assert np.shares_memory(out.values, _time_field(time, field).values)
+        with pytest.raises(ValueError, match="read-only"):
+            out.values[0] = 0
+    assert _infer_freq(time) == xr.infer_freq(time)
+
+    # Not an index
+    other = xr.DataArray(time.values, dims=("x",))
+    assert_array_equal(_time_field(other, "dayofyear"), other.dt.dayofyear)
@@ -14,10 +14,12 @@
 from __future__ import annotations
 
 import sys
+import warnings
 from pathlib import Path
 
 import numpy as np
 import pytest
+import scipy.stats as spstats
 import xarray as xr
 from scipy.stats.mstats import mquantiles
 
@@ -56,6 +58,21 @@ class TestEnsembleStats:
         ens2 = ensembles.create_ensemble(dict(zip(reals, files, strict=False)))
         xr.testing.assert_identical(ens1, ens2)
 
+    def test_create_ensemble_parallel(self, ensemble_dataset_objects, nimbus):
+        files = [nimbus.fetch(f) for f in ensemble_dataset_objects["nc_files"]]
+        ens = ensembles.create_ensemble(files)
+        ens_par = ensembles.create_ensemble(files, n_workers=4)
+        xr.testing.assert_identical(ens, ens_par)
+        assert ens_par.tg_mean.chunks is not None
+
+        ds = xr.Dataset({"tas": xr.DataArray(np.arange(24), dims=("time",))}).assign_coords(
+            time=xr.Variable("time", np.arange(24), {"units": "days since 2000-01-01", "calendar": "noleap"})
+        )
+        ens = ensembles.create_ensemble([ds, ds], n_workers=None)
+        assert ens.time.dt.calendar == "noleap"
+        # The inputs are not modified.
+        assert ds.time.dtype == int
+
     def test_no_time(self, tmp_path, ensemble_dataset_objects, open_dataset):
         # create again using xr.Dataset objects
         f1 = Path(tmp_path / "notime")
@@ -191,6 +208,26 @@ class TestEnsembleStats:
         out1 = ensembles.ensemble_percentiles(ens.load(), split=False)
         np.testing.assert_array_equal(out1["tg_mean"], out2["tg_mean"])
 
+    @pytest.mark.parametrize("method", ["linear", "hazen", "weibull", "interpolated_inverted_cdf"])
+    @pytest.mark.parametrize("use_dask", [False, True])
+    def test_calc_perc_weighted(self, method, use_dask):
+        rng = np.random.default_rng(42)
+        ens = xr.DataArray(rng.normal(size=(7, 20)), dims=("realization", "x"), name="tas")
+        ens[2, 3] = np.nan
+        if use_dask:
+            ens = ens.chunk(realization=2, x=5)
+
+        # Equal weights give the same results as the unweighted percentiles
+        weights = xr.DataArray(np.full(7, 2.5), dims=("realization",))
+        out = ensembles.ensemble_percentiles(ens, values=[10, 50, 90], weights=weights, method=method, split=False)
+        exp = ensembles.ensemble_percentiles(ens, values=[10, 50, 90], method=method, split=False)
+        xr.testing.assert_allclose(out, exp)
+
+        weights = xr.DataArray([1, 0, 3.5, 5, 0.5, 2, 1], dims=("realization",))
+        out = ensembles.ensemble_percentiles(ens, values=[10, 50, 90], weights=weights, split=False)
+        exp = ens.compute().weighted(weights).quantile([0.1, 0.5, 0.9], dim="realization")
+        np.testing.assert_allclose(out.transpose("percentiles", ...), exp)
+
     def test_calc_perc_nans(self, ensemble_dataset_objects, open_dataset):
         ds_all = []
         for n in ensemble_dataset_objects["nc_files_simple"]:
@@ -255,6 +292,24 @@ class TestEnsembleStats:
         np.testing.assert_array_equal(out1.tg_mean_max[0, 5, 5], out2.tg_mean_max[0, 5, 5])
         np.testing.assert_array_equal(out1.tg_mean_min[0, 5, 5], out2.tg_mean_min[0, 5, 5])
 
+    @pytest.mark.parametrize("weighted", [False, True])
+    @pytest.mark.parametrize("min_members", [1, 3])
+    def test_calc_mean_std_min_max_streaming(self, ensemble_dataset_objects, open_dataset, weighted, min_members):
+        ds_all = [open_dataset(n) for n in ensemble_dataset_objects["nc_files"]]
+        ens = ensembles.create_ensemble(ds_all)
+        weights = None
+        if weighted:
+            weights = xr.DataArray(np.linspace(0.5, 2, len(ds_all)), dims=("realization",))
+
+        exp = ensembles.ensemble_mean_std_max_min(ens, weights=weights, min_members=min_members)
+        out = ensembles.ensemble_mean_std_max_min_streaming(ds_all, weights=weights, min_members=min_members)
+
+        assert set(out.data_vars) == set(exp.data_vars)
+        for v in exp.data_vars:
+            xr.testing.assert_allclose(out[v], exp[v].transpose(*out[v].dims))
+            assert out[v].attrs == exp[v].attrs
+        assert "Computation of statistics on" in out.attrs["history"]
+
     @pytest.mark.parametrize("aggfunc", [ensembles.ensemble_percentiles, ensembles.ensemble_mean_std_max_min])
     def test_stats_min_members(self, ensemble_dataset_objects, aggfunc, open_dataset):
         ds_all = [open_dataset(n) for n in ensemble_dataset_objects["nc_files_simple"]]
@@ -526,6 +581,56 @@ class TestEnsembleReduction:
         assert set(uncrit.dims) == {"realization", "lat", "time"}
         assert uncrit.time.size == 3
 
+    def test_kkz_incremental(self, random):
+        data = xr.DataArray(random.normal(size=(30, 500)), dims=("realization", "criteria"))
+
+        # Selection recomputing the distances to all selected members at each step
+        z = ((data - data.mean("realization")) / data.std("realization")).values
+        unselected = list(range(30))
+        selected = [unselected.pop(np.linalg.norm(z - z.mean(axis=0), axis=1).argmin())]
+        for _ in range(1, 10):
+            dist = np.linalg.norm(z[selected][:, np.newaxis] - z[unselected], axis=-1).min(axis=0)
+            selected.append(unselected.pop(dist.argmax()))
+
+        assert ensembles.kkz_reduce_ensemble(data, 10) == selected
+
+    def test_kmeans_pca_workers(self, random):
+        # 3 well separated groups of 8 members, with many criteria
+        centers = random.normal(scale=10, size=(3, 2000))
+        data = xr.DataArray(
+            np.repeat(centers, 8, axis=0) + random.normal(size=(24, 2000)), dims=("realization", "criteria")
+        )
+        ids, clusters, fig = ensembles.kmeans_reduce_ensemble(
+            data, method={"rsq_cutoff": 0.8}, random_state=42, make_graph=True
+        )
+
+        ids_w, clusters_w, fig_w = ensembles.kmeans_reduce_ensemble(
+            data, method={"rsq_cutoff": 0.8}, random_state=42, n_workers=4, make_graph=True
+        )
+        np.testing.assert_allclose(fig_w["rsq"], fig["rsq"])
+        assert ids_w == ids
+
+        ids_p, clusters_p, fig_p = ensembles.kmeans_reduce_ensemble(
+            data, method={"rsq_cutoff": 0.8}, random_state=42, n_components=23, make_graph=False
+        )
+        assert fig_p is None
+        assert ids_p == ids
+        assert len(ids_p) == 3
+
+        ids_r, _, _ = ensembles.kmeans_reduce_ensemble(
+            data, method={"n_clusters": 3}, random_state=np.random.RandomState(0), n_workers=2, n_components=5
+        )
+        assert len({c for i, c in enumerate(clusters) if i in ids_r}) == 3
+
+        # The R² profile does not depend on the number of workers with a RandomState either
+        _, _, fig_1 = ensembles.kmeans_reduce_ensemble(
+            data, method={"rsq_cutoff": 0.8}, random_state=np.random.RandomState(0), make_graph=True
+        )
+        _, _, fig_3 = ensembles.kmeans_reduce_ensemble(
+            data, method={"rsq_cutoff": 0.8}, random_state=np.random.RandomState(0), n_workers=3, make_graph=True
+        )
+        np.testing.assert_array_equal(fig_1["rsq"], fig_3["rsq"])
+
 
 # ## Tests for Robustness ##
 @pytest.fixture
@@ -672,6 +777,45 @@ def test_robustness_fractions(robust_data, test, exp_chng_frac, exp_pos_frac, ex
         np.testing.assert_array_almost_equal(changed, exp_changed)
 
 
+@pytest.mark.parametrize(
+    "test,func",
+    [
+        ("ttest", lambda f, r: spstats.ttest_1samp(f, np.nanmean(r), nan_policy="omit")[1]),
+        ("welch-ttest", lambda f, r: spstats.ttest_ind(f, r, equal_var=False, nan_policy="omit")[1]),
+        ("mannwhitney-utest", lambda f, r: spstats.mannwhitneyu(f, r, nan_policy="omit")[1]),
+        ("brownforsythe-test", lambda f, r: spstats.levene(f, r, center="median")[1]),
+    ],
+)
+@pytest.mark.parametrize("use_dask", [False, True])
+def test_robustness_significance_tests_scipy(random, test, func, use_dask):
+    fut = random.normal(size=(6, 5, 30)).round(1)  # Rounding creates ties
+    ref = random.normal(size=(6, 25)).round(1)
+    fut[0, :, 2:] = np.nan  # Too few values: NaN p-values
+    fut[1] = random.normal(size=(5, 30))
+    fut[1, :, 6:] = np.nan  # Exact Mann-Whitney U-test: small sample without ties
+    ref[1] = random.normal(size=25)
+    fut[2, :, ::3] = np.nan
+    fut[3] = fut[3, 0]  # Null variances
+    ref[4, :10] = np.nan
+    fut = xr.DataArray(fut, dims=("lat", "realization", "time"))
+    ref = xr.DataArray(ref, dims=("lat", "time"))
+    if use_dask:
+        fut = fut.chunk(lat=2)
+        ref = ref.chunk(lat=2)
+
+    _, pvals = ensembles._robustness.SIGNIFICANCE_TESTS[test](fut, ref)
+
+    exp = np.full(pvals.shape, np.nan)
+    with np.errstate(all="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for i in range(fut.lat.size):
+            for j in range(fut.realization.size):
+                f, r = fut[i, j].values, ref[i].values
+                if not (np.isnan(f).all() or np.isnan(r).all()):
+                    exp[i, j] = func(f, r)
+    np.testing.assert_allclose(pvals.transpose("lat", "realization"), exp, rtol=1e-10)
+
+
 def test_robustness_fractions_weighted(robust_data):
     ref, fut = robust_data
     weights = xr.DataArray([1, 0.1, 3.5, 5], coords={"realization": ref.realization})
@@ -758,3 +902,34 @@ def test_robustness_coefficient():
 
     R = ensembles.robustness_coefficient(fut.to_dataset(), ref.to_dataset())
     np.testing.assert_almost_equal(R.tas, 0.83743842)
+
+
+@pytest.mark.parametrize("use_dask", [False, True])
+def test_robustness_coefficient_blocks(random, use_dask):
+    def knutti_sedlacek(reference, future):
+        # Direct computation of the integrals on a fine grid of the CDFs
+        x = np.sort(np.concatenate([reference, future.flatten(), future.mean(axis=-1)]))
+
+        def area(a, b):
+            cdf_a = np.searchsorted(np.sort(a), x, side="right") / a.size
+            cdf_b = np.searchsorted(np.sort(b), x, side="right") / b.size
+            return np.sum(np.diff(x) * (cdf_a - cdf_b)[:-1] ** 2)
+
+        return 1 - area(future.flatten(), future.mean(axis=-1)) / area(reference, future.mean(axis=-1))
+
+    ref = xr.DataArray(random.normal(size=(4, 3, 30)).round(1), dims=("lat", "lon", "time"), name="tas")
+    fut = xr.DataArray(random.normal(1, size=(5, 3, 4, 20)).round(1), dims=("realization", "lon", "lat", "time"))
+    fut[0, 0, 0, 3] = np.nan
+    if use_dask:
+        ref, fut = ref.chunk(lat=2), fut.chunk(lon=1)
+
+    R = ensembles.robustness_coefficient(fut, ref)
+
+    assert set(R.dims) == {"lat", "lon"}
+    R = R.transpose("lat", "lon")
+    assert np.isnan(R[0, 0])
+    for i in range(4):
+        for j in range(3):
+            if i + j > 0:
+                exp = knutti_sedlacek(ref[i, j].values, fut.isel(lat=i, lon=j).values)
+                np.testing.assert_allclose(R[i, j], exp, rtol=1e-10)
@@ -6,7 +6,9 @@ import numpy as np
 import pytest
 import xarray as xr
 
-from xclim.core.calendar import doy_to_days_since, select_time
+from xclim.core.calendar import doy_to_days_since, mask_between_doys, select_time
+from xclim.core.options import set_options
+from xclim.core.utils import uses_dask
 from xclim.indices import generic, run_length
 from xclim.testing.helpers import assert_lazy
 
@@ -653,6 +655,25 @@ class TestTimeSelection:
             # No real bounds on year 6
         np.testing.assert_array_equal(out.notnull().resample(time="YS-JUL").sum(), exp)
 
+    @pytest.mark.parametrize("temporal", [True, False])
+    def test_select_time_doys_2D_dask(self, temporal):
+        da = self.series("2003-02-13", "2007-12-31", "default").expand_dims(lat=[0, 10])
+        if temporal:
+            time = xr.date_range("2003-07-01", freq="YS-JUL", periods=5)
+            start = xr.DataArray([50, 340, 100, np.nan, np.nan], dims=("time",), coords={"time": time})
+            end = xr.DataArray([100, 20, np.nan, 200, np.nan], dims=("time",), coords={"time": time})
+            start, end = start.expand_dims(lat=da.lat), end.expand_dims(lat=da.lat)
+        else:
+            start = xr.DataArray([50, 340], dims=("lat",), coords={"lat": da.lat})
+            end = xr.DataArray([200, np.nan], dims=("lat",), coords={"lat": da.lat})
+        exp = mask_between_doys(da, (start, end))
+
+        # The mask is computed lazily, and without broadcasting the bounds along time
+        out = mask_between_doys(da.chunk(time=365), (start.chunk(lat=1), end.chunk(lat=1)))
+        assert uses_dask(out)
+        assert out.chunksizes["time"] == da.chunk(time=365).chunksizes["time"]
+        xr.testing.assert_identical(out.compute(), exp)
+
     def test_select_time_dates(self):
         da = self.series("2003-02-13", "2004-11-01", "all_leap")
         da = da.where(da.time.dt.dayofyear != 92, drop=True)  # no 04-01
@@ -916,3 +937,23 @@ def test_season_length_from_boundaries(tas_series):
     # this gives a single season length
     length2 = run_length.season_length(tas, window=1)
     np.testing.assert_array_equal(length, length2)
+
+
+@pytest.mark.parametrize("preserve", [True, False])
+def test_preserve_dtype(tas_series, preserve):
+    tas = tas_series(np.arange(365, dtype=np.float32) / 10 + 270, start="2001-01-01")
+    exp = np.float32 if preserve else np.float64
+    with set_options(preserve_dtype=preserve):
+        assert generic.detrend(tas).dtype == exp
+        assert generic.first_day_threshold_reached(tas, threshold="280 K", op=">", after_date="01-01").dtype == exp
+        assert generic.get_zones(tas, zone_min="270 K", zone_max="300 K", zone_step="5 K").dtype == exp
+        # Integer zones are left as is
+        zones = generic.get_zones(
+            tas, zone_min="270 K", zone_max="300 K", zone_step="5 K", exclude_boundary_zones=False
+        )
+        assert np.issubdtype(zones.dtype, np.integer)
+        events = generic.thresholded_events(tas, thresh="280 K", op=">", window=3)
+        assert events.event_length.dtype == exp
+        assert events.event_sum.dtype == exp
+        # Always bool
+        assert generic.spell_mask(tas, 3, "mean", ">", 280, weights=[0.2, 0.3, 0.5]).dtype == bool
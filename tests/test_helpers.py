@@ -50,6 +50,49 @@ def test_extraterrestrial_radiation(method):
     )
 
 
+def test_solar_geometry_cache():
+    times = xr.DataArray(xr.date_range("1900-01-01", "1900-12-31", freq="D"), dims=("time",), name="time")
+    lat = xr.DataArray([-45.0, 0.0, 45.0], dims=("lat",), attrs={"units": "degree_north"})
+    exp = helpers.extraterrestrial_solar_radiation(times, lat)
+    assert len(helpers._SOLAR_GEOMETRY) == 0
+
+    with set_options(solar_geometry_cache=3):
+        out = helpers.extraterrestrial_solar_radiation(times, lat)
+        # The radiation and the three geometry fields it is computed from, the oldest one was dropped
+        assert len(helpers._SOLAR_GEOMETRY) == 3
+        out.attrs["units"] = "W m-2"
+        out2 = helpers.extraterrestrial_solar_radiation(times, lat)
+        xr.testing.assert_identical(out2, exp)
+        assert len(helpers._SOLAR_GEOMETRY) == 3
+
+        helpers.extraterrestrial_solar_radiation(times, lat + 1)
+        assert len(helpers._SOLAR_GEOMETRY) == 3
+
+    # Disabling the cache empties it
+    helpers.day_lengths(times, lat)
+    assert len(helpers._SOLAR_GEOMETRY) == 0
+
+
+def test_solar_geometry_cache_scalar_coords():
+    times = xr.DataArray(xr.date_range("1900-01-01", "1900-12-31", freq="D"), dims=("time",), name="time")
+    lat = xr.DataArray([-45.0, 0.0, 45.0], dims=("lat",), attrs={"units": "degree_north"})
+    times_h = times.assign_coords(height=2)
+    lat_h = lat.assign_coords(realization="r1")
+    exp = helpers.extraterrestrial_solar_radiation(times_h, lat_h)
+
+    with set_options(solar_geometry_cache=8):
+        helpers.extraterrestrial_solar_radiation(times, lat)
+        assert len(helpers._SOLAR_GEOMETRY) == 4
+        # Inputs on the same grid that only differ by their scalar coordinates share the cached fields
+        out = helpers.extraterrestrial_solar_radiation(times_h, lat_h)
+        assert len(helpers._SOLAR_GEOMETRY) == 4
+        xr.testing.assert_identical(out, exp)
+
+        out = helpers.extraterrestrial_solar_radiation(times, lat)
+        assert "height" not in out.coords
+        assert "realization" not in out.coords
+
+
 class TestDayLength:
     @staticmethod
     def data_setup(lats: np.ndarray, start_date: str = "1992-12-01", end_date: str = "1994-01-01"):
@@ -3,6 +3,7 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 import pytest
+import xarray as xr
 
 from xclim import indices as xci
 from xclim import land
@@ -198,6 +199,38 @@ class TestAntecedentPrecipitationIndex:
             out_manual[idxend - 1] = weighted_sum
         np.testing.assert_allclose(out, out_manual, atol=1e-7)
 
+    def test_incremental(self, pr_series):
+        a = np.arange(50.0)
+        a[30] = np.nan
+        pr = pr_series(a, units="mm d-1")
+        out = xci.antecedent_precipitation_index(pr)
+
+        # The preceding days fill the window, the result is the same as if computed over the whole series.
+        pr0 = pr.isel(time=slice(0, 20))
+        out1 = xci.antecedent_precipitation_index(pr.isel(time=slice(20, None)), pr0=pr0)
+        np.testing.assert_allclose(out1, out.isel(time=slice(20, None)))
+        np.testing.assert_array_equal(out1.isnull().sum(), 7)
+
+        # Units of the preceding days are converted
+        pr0 = convert_units_to(pr0, "kg m-2 s-1", context="hydro")
+        out2 = xci.antecedent_precipitation_index(pr.isel(time=slice(20, None)), pr0=pr0)
+        np.testing.assert_allclose(out2, out1)
+
+    @pytest.mark.parametrize("p_exp", [0.935, 1.0, 1.05])
+    def test_long_series(self, pr_series, p_exp):
+        # Six years of data, the carried sum must not accumulate rounding errors
+        a = np.random.default_rng(42).gamma(0.5, 5, size=6 * 365)
+        a[1000] = np.nan
+        pr = pr_series(a, units="mm d-1")
+        window = 7
+        out = xci.antecedent_precipitation_index(pr, window=window, p_exp=p_exp)
+
+        weights = p_exp ** np.arange(window - 1, -1, -1)
+        exp = np.full(a.size, np.nan)
+        exp[window - 1 :] = np.lib.stride_tricks.sliding_window_view(a, window) @ weights
+        np.testing.assert_allclose(out, exp, rtol=1e-10)
+        np.testing.assert_array_equal(out[1000 : 1000 + window].isnull(), True)
+
 
 class TestRR:
     def test_simple(self, q_series, area_series, pr_series):
@@ -306,7 +339,6 @@ class TestLagSnowpackFlowPeaks:
 
 
 class TestSenSlope:
-    @pytest.mark.skipif(pymannkendall is None, reason="This requires pymankendall")
     def test_simple(self, q_series):
         # 5 years of increasing data with slope of 1
         q = np.arange(1, 1826)
@@ -342,6 +374,37 @@ class TestSenSlope:
         ratio = out["ratio"]
         np.testing.assert_allclose(ratio.values, [0.5, 0.5, 0.5, 0.5, 0.5], atol=1e-15)
 
+    @pytest.mark.skipif(pymannkendall is None, reason="This requires pymankendall")
+    def test_pymannkendall(self, q_series, random):
+        # Rounded values to get ties, with missing values
+        q = np.round(random.gamma(2, 10, size=20 * 365) / 5 + np.linspace(0, 3, 20 * 365))
+        q[random.random(q.size) < 0.01] = np.nan
+        q[: 3 * 365] = np.nan
+        q = q_series(q)
+
+        out = xci.sen_slope(q)
+
+        q_year = q.resample(time="YS-DEC").mean()
+        q_season = q.resample(time="QS-DEC").mean()
+        for i, season in enumerate(["DJF", "MAM", "JJA", "SON", "Year"]):
+            x = q_year if season == "Year" else q_season.where(q_season.time.dt.month % 12 // 3 == i, drop=True)
+            exp = pymannkendall.original_test(x.values)
+            np.testing.assert_allclose(out.Sen_slope.sel(season=season), exp.slope, rtol=1e-12)
+            np.testing.assert_allclose(out.p_value.sel(season=season), exp.p, atol=1e-14)
+
+    def test_multidim(self, q_series, random):
+        q = q_series(random.gamma(2, 10, size=10 * 365))
+        qs = xr.concat([q, q * 2, q[::-1].assign_coords(time=q.time)], "site").assign_attrs(units="m3 s-1")
+
+        out = xci.sen_slope(qs.chunk(time=365), qs.chunk(time=365) * 2)
+        assert out.Sen_slope_obs.dims == ("season", "site")
+        for i in range(3):
+            exp = xci.sen_slope(qs.isel(site=i), qs.isel(site=i) * 2)
+            for var in exp.data_vars:
+                np.testing.assert_allclose(out[var].isel(site=i), exp[var])
+        np.testing.assert_allclose(out.Sen_slope_obs.isel(site=1), 2 * out.Sen_slope_obs.isel(site=0))
+        np.testing.assert_allclose(out.ratio, 0.5)
+
 
 class TestBFI_seasonal_and_winter_to_summer_ratio:
     def test_simple(self, q_series):
@@ -458,6 +458,22 @@ def test_missing(tas_series):
     assert out.isnull()
 
 
+def test_missing_preserve_dtype(tas_series):
+    a = tas_series(np.ones(365, dtype=np.float32), start="1/1/2000")
+    a[5] = np.nan
+
+    # Masking the missing values promotes the integer counts to float64
+    out = atmos.tx_days_above(a.rename("tasmax").assign_attrs(standard_name="air_temperature"), freq="MS")
+    assert out.dtype == np.float64
+    with xclim.set_options(preserve_dtype=True):
+        out = atmos.tx_days_above(a.rename("tasmax").assign_attrs(standard_name="air_temperature"), freq="MS")
+        assert out.dtype == np.float32
+        assert out[0].isnull()
+
+        out = uniIndTemp(a, freq="MS")
+        assert out.dtype == np.float32
+
+
 def test_missing_from_context(tas_series):
     a = tas_series(np.ones(365, float), start="1/1/2000")
     # Null value
@@ -30,6 +30,7 @@ from xclim.core.calendar import percentile_doy
 from xclim.core.options import set_options
 from xclim.core.units import convert_units_to, units
 from xclim.indices.converters import prsnd_to_prsn
+from xclim.indices.helpers import make_hourly_temperature
 from xclim.indices.stats import standardized_index, standardized_index_fit_params
 
 K2C = 273.15
@@ -398,6 +399,29 @@ class TestAgroclimaticIndices:
         # Only the last day contains negative chill units.
         assert out[0] == 0.5 * num_cu_05 + num_cu_1 - 0.5 * 3
 
+    @pytest.mark.parametrize("use_dask", [True, False])
+    def test_chill_from_daily(self, tasmin_series, tasmax_series, use_dask):
+        doy = np.arange(3 * 365)
+        tn = 5 - 10 * np.cos(2 * np.pi * doy / 365) + 3 * np.sin(doy)
+        tasmin = tasmin_series(tn + K2C, start="2000-01-01").expand_dims(lat=[45.0, 50.0])
+        tasmax = tasmax_series(tn + 12 + K2C, start="2000-01-01").expand_dims(lat=[45.0, 50.0])
+        tasmin.lat.attrs.update(units="degrees_north", standard_name="latitude")
+        tas = make_hourly_temperature(tasmin, tasmax)
+        if use_dask:
+            tasmin = tasmin.chunk(time=100)
+            tasmax = tasmax.chunk(time=100)
+
+        for positive_only in [False, True]:
+            exp = xci.chill_units(tas, positive_only=positive_only)
+            out = xci.chill_units_from_daily(tasmin, tasmax, positive_only=positive_only)
+            assert out.attrs["units"] == "1"
+            np.testing.assert_allclose(out, exp.transpose(*out.dims))
+
+        exp = xci.chill_portions(tas, date_bounds=("09-01", "03-30"), freq="YS-JUL")
+        out = xci.chill_portions_from_daily(tasmin, tasmax, date_bounds=("09-01", "03-30"), freq="YS-JUL")
+        assert set(out.dims) == set(exp.dims)
+        np.testing.assert_allclose(out, exp.transpose(*out.dims))
+
     def test_cool_night_index(self, open_dataset):
         ds = open_dataset("cmip5/tas_Amon_CanESM2_rcp85_r1i1p1_200701-200712.nc")
         ds = ds.rename({"tas": "tasmin"})
@@ -3398,6 +3422,58 @@ def test_dewpoint_from_specific_humidity(huss_series, ps_series, method, tas_ser
     )
     np.testing.assert_allclose(tdps, tdps_exp, atol=0.1, rtol=0.05)
 
+    # The pressure is converted to Pa
+    tdps_hpa = xci.dewpoint_from_specific_humidity(huss=huss, ps=convert_units_to(ps, "hPa"), method=method)
+    np.testing.assert_allclose(tdps_hpa, tdps)
+
+
+@pytest.mark.parametrize("use_dask", [True, False])
+def test_humidity_kernels_dtype(tas_series, hurs_series, huss_series, ps_series, use_dask):
+    tas = tas_series(np.array([-20, -10, -1, 10, 20, 25, 30, 40]) + K2C)
+    hurs = hurs_series(np.array([90, 20, 70, 90, 80, 20, 100, 60]))
+    ps = ps_series(1000 * np.array([100] * 4 + [101] * 4))
+    huss = huss_series(np.array([0.0, 1e-4, 1e-3, 5e-3, 1e-2, 2e-2, 3e-2, 4e-2]))
+    kws = {"method": "ecmwf", "ice_thresh": "-23 degC", "interp_power": 2}
+    funcs = {
+        "esat": lambda tas, hurs, huss, ps: xci.saturation_vapor_pressure(tas, **kws),
+        "hurs": lambda tas, hurs, huss, ps: xci.relative_humidity(tas, huss=huss, ps=ps, **kws),
+        "huss": lambda tas, hurs, huss, ps: xci.specific_humidity(tas, hurs, ps, invalid_values="mask", **kws),
+        "tdps": lambda tas, hurs, huss, ps: xci.dewpoint_from_specific_humidity(huss, ps),
+        "heat_index": lambda tas, hurs, huss, ps: xci.heat_index(tas, hurs),
+    }
+    f32 = [da.astype(np.float32) for da in (tas, hurs, huss, ps)]
+    if use_dask:
+        f32 = [da.chunk(time=4) for da in f32]
+    for name, func in funcs.items():
+        exp = func(tas, hurs, huss, ps)
+        out = func(*f32)
+        assert out.dtype == np.float32, name
+        np.testing.assert_allclose(out, exp, rtol=1e-5, err_msg=name)
+
+
+@pytest.mark.parametrize("preserve", [True, False])
+def test_converters_preserve_dtype(tasmin_series, tasmax_series, pr_series, rsds_series, lat_series, preserve):
+    lat = lat_series([45])
+    tn = tasmin_series(np.linspace(0, 10, 365, dtype=np.float32) + K2C).expand_dims(lat=lat)
+    tx = tasmax_series(np.linspace(10, 20, 365, dtype=np.float32) + K2C).expand_dims(lat=lat)
+    pr = pr_series(np.full(365, 1e-5, dtype=np.float32)).expand_dims(lat=lat)
+    rsds = rsds_series(np.full(365, 100, dtype=np.float32)).expand_dims(lat=lat)
+    funcs = {
+        "pet": lambda: xci.potential_evapotranspiration(tn, tx, lat=lat, method="HG85"),
+        "pet_tw48": lambda: xci.potential_evapotranspiration(tn, tx, lat=lat, method="TW48"),
+        "snowfall": lambda: xci.snowfall_approximation(pr, tn, method="brown"),
+        "clearness_index": lambda: xci.clearness_index(rsds.assign_coords(lat=lat)),
+        "wind_power": lambda: xci.wind_power_potential(rsds.assign_attrs(units="m s-1") / 20),
+        "api": lambda: xci.antecedent_precipitation_index(pr),
+    }
+    with set_options(preserve_dtype=preserve):
+        for name, func in funcs.items():
+            out = func()
+            assert out.dtype == (np.float32 if preserve else np.float64), name
+            if preserve:
+                with set_options(preserve_dtype=False):
+                    np.testing.assert_allclose(out, func(), rtol=1e-5, err_msg=name)
+
 
 def test_degree_days_exceedance_date(tas_series):
     tas = tas_series(np.ones(366) + K2C, start="2000-01-01")
@@ -3721,6 +3797,74 @@ def test_rain_season(pr_series, result_type, method_dry_start):
     np.testing.assert_array_equal(out_arr, out_exp)
 
 
+@pytest.mark.parametrize(
+    "method_dry_start,method_dry_end,exp",
+    [
+        (
+            "per_day",
+            "per_day",
+            [
+                [[159, 133, 246], [np.nan] * 3, [134, 132, 126]],
+                [[np.nan, 274, 275], [np.nan] * 3, [289, np.nan, 247]],
+                [[208, 141, 29], [np.nan] * 3, [155, 234, 121]],
+            ],
+        ),
+        (
+            "total",
+            "total",
+            [
+                [[159, 133, 165], [np.nan] * 3, [134, 132, 126]],
+                [[np.nan, 250, np.nan], [np.nan] * 3, [298, np.nan, np.nan]],
+                [[208, 117, 200], [np.nan] * 3, [164, 234, 239]],
+            ],
+        ),
+        (
+            "per_day",
+            "total",
+            [
+                [[159, 133, 246], [np.nan] * 3, [134, 132, 126]],
+                [[np.nan, 250, np.nan], [np.nan] * 3, [298, np.nan, np.nan]],
+                [[208, 117, 119], [np.nan] * 3, [164, 234, 239]],
+            ],
+        ),
+        (
+            "total",
+            "per_day",
+            [
+                [[159, 133, 165], [np.nan] * 3, [134, 132, 126]],
+                [[np.nan, 274, 275], [np.nan] * 3, [289, np.nan, 247]],
+                [[208, 141, 110], [np.nan] * 3, [155, 234, 121]],
+            ],
+        ),
+    ],
+)
+def test_rain_season_multidim(random, method_dry_start, method_dry_end, exp):
+    # Expected start, end and length (per point and year) computed with the implementation based on run lengths
+    time = pd.date_range("2000-01-01", periods=3 * 365, freq="D")
+    values = random.gamma(0.4, 8, size=(3, time.size))
+    values = np.where(random.random(values.shape) > 0.3, values, 0)
+    values[1] = 0  # Always dry, no season is found
+    values[2, 500:520] = np.nan  # Missing values around the start of the season
+    pr = xr.DataArray(values, dims=("lon", "time"), coords={"time": time, "lon": [0, 1, 2]}, attrs={"units": "mm/d"})
+
+    kwargs = {
+        "method_dry_start": method_dry_start,
+        "method_dry_end": method_dry_end,
+        "thresh_wet_start": "10 mm",
+        "thresh_dry_end": "2 mm",
+        "window_dry_end": 10,
+    }
+    out = xci.rain_season(pr, **kwargs)
+    out_dask = xci.rain_season(pr.chunk(time=100), **kwargs)
+    for da, da_dask, e in zip(out, out_dask, exp, strict=True):
+        assert da.dims == ("time", "lon")
+        np.testing.assert_array_equal(da.transpose("lon", "time"), e)
+        np.testing.assert_array_equal(da_dask, da)
+
+    with pytest.raises(ValueError, match="Unknown method_dry_end"):
+        xci.rain_season(pr, method_dry_end="per_week")
+
+
 def test_high_precip_low_temp(pr_series, tasmin_series):
     pr = pr_series([0, 1, 2, 0, 0])
     tas = tasmin_series(np.array([0, 0, 1, 1]) + K2C)
@@ -4023,6 +4167,24 @@ class TestPotentialEvapotranspiration:
         )
         np.testing.assert_allclose(out.isel(lat=0, time=2), [1.208832768 / 86400], rtol=1e-2)
 
+    def test_methods(self, tasmin_series, tasmax_series, tas_series, lat_series):
+        lat = lat_series([45])
+        tn = tasmin_series(np.array([0, 5, 10]) + 273.15).expand_dims(lat=lat)
+        tx = tasmax_series(np.array([10, 15, 20]) + 273.15).expand_dims(lat=lat)
+        tm = tas_series(np.array([5, 10, 15]) + 273.15).expand_dims(lat=lat)
+
+        out = xci.potential_evapotranspiration_methods(tn, tx, tm, lat=lat, methods=["BR65", "HG85", "MB05"])
+        assert isinstance(out, xr.Dataset)
+        assert list(out.data_vars) == ["BR65", "HG85", "MB05"]
+        for method, pet in out.data_vars.items():
+            exp = xci.potential_evapotranspiration(tn, tx, tm, lat=lat, method=method)
+            xr.testing.assert_identical(pet, exp.rename(method))
+
+        # TW48 is computed on monthly means
+        tm = tas_series(np.full(90, 283.15)).expand_dims(lat=lat)
+        with pytest.raises(ValueError, match="same frequency"):
+            xci.potential_evapotranspiration_methods(tas=tm, lat=lat, methods=["MB05", "TW48"])
+
 
 def test_water_budget_from_tas(pr_series, tasmin_series, tasmax_series, tas_series, lat_series):
     lat = lat_series([45])
@@ -4264,6 +4426,48 @@ def test_universal_thermal_climate_index(
     np.testing.assert_allclose(utci, expected, rtol=1e-03)
 
 
+def test_universal_thermal_climate_index_polynomial(tas_series, hurs_series, sfcWind_series):
+    from xclim.indices.converters import _utci
+
+    # Reference values of the term by term evaluation of the polynomial, over the range of validity of UTCI
+    # Columns are tas [°C], sfcWind [m s-1], mrt - tas [K] and water vapour pressure [kPa]
+    tas, sfcWind, dt, wvp = np.array(
+        [
+            [-40.0, 1.0, -20.0, 0.2],
+            [-10.0, 5.0, 10.0, 0.5],
+            [0.0, 0.5, 0.0, 0.6],
+            [15.0, 3.0, 25.0, 1.5],
+            [25.0, 10.0, -5.0, 2.5],
+            [35.0, 2.0, 30.0, 4.0],
+            [45.0, 17.0, 15.0, 5.0],
+        ]
+    ).T
+    exp = [
+        -38.301647897483825,
+        -24.164745964482425,
+        1.562269841802087,
+        19.88470870224361,
+        18.40873043515975,
+        45.91633716602553,
+        57.04736521395507,
+    ]
+    np.testing.assert_allclose(_utci(tas, sfcWind, dt, wvp), exp, rtol=1e-12)
+
+    # The data type of the inputs is preserved
+    tas = tas_series(np.array([16, 25]) + K2C).astype(np.float32)
+    hurs = hurs_series(np.array([36, 50])).astype(np.float32)
+    sfcWind = sfcWind_series(np.array([2, 3])).astype(np.float32)
+    utci = xci.universal_thermal_climate_index(tas=tas, hurs=hurs, sfcWind=sfcWind, mrt=tas + 6)
+    assert utci.dtype == np.float32
+    np.testing.assert_allclose(utci[0], 17.70, rtol=1e-03)
+
+    utci_dask = xci.universal_thermal_climate_index(
+        tas=tas.chunk(time=1), hurs=hurs, sfcWind=sfcWind.chunk(time=1), mrt=tas + 6
+    )
+    assert utci_dask.dtype == np.float32
+    np.testing.assert_array_equal(utci_dask, utci)
+
+
 @pytest.mark.parametrize("stat,expected", [("sunlit", 295.0), ("instant", 294.9)])
 def test_mean_radiant_temperature(
     rsds_series,
@@ -19,6 +19,8 @@ from xclim.core.options import OPTIONS, register_missing_method
         ("cf_compliance", "raise"),
         ("check_missing", "wmo"),
         ("check_missing", "any"),
+        ("solar_geometry_cache", 16),
+        ("preserve_dtype", True),
         ("missing_options", {"wmo": {"nm": 10, "nc": 3}}),
         ("missing_options", {"pct": {"subfreq": None, "tolerance": 0.1}}),
         (
@@ -47,6 +49,9 @@ def test_set_options_valid(option, value):
         ("data_validation", True),
         ("check_missing", "from_context"),
         ("cf_compliance", False),
+        ("solar_geometry_cache", -1),
+        ("solar_geometry_cache", True),
+        ("preserve_dtype", "float32"),
         ("missing_options", {"pct": {"nm": 45}}),
         ("missing_options", {"wmo": {"nm": 45, "nc": 3}}),
         (
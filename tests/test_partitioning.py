@@ -10,6 +10,7 @@ from xclim.ensembles import (
     lafferty_sriver,
 )
 from xclim.ensembles._filters import _concat_hist, _model_in_all_scens, _single_member
+from xclim.testing.helpers import assert_lazy
 
 
 def test_hawkins_sutton_smoke(open_dataset):
@@ -155,3 +156,29 @@ def test_general_partition(lafferty_sriver_ds):
 
     assert u1.equals(u2)
     np.testing.assert_allclose(g1.values, g2.values, atol=0.1)
+
+
+def test_partitioning_gridded(random):
+    """Gridded ensembles are partitioned blockwise, with the same results as individual series."""
+    mean = np.arange(-2, 3)[np.newaxis, :, np.newaxis] + np.arange(10, 41, 10)[:, np.newaxis, np.newaxis]
+    x = random.standard_normal((4, 5, 3, 60, 2)) + mean[..., np.newaxis, np.newaxis]
+    x[0, 1, 2, :10] = np.nan
+    time = xr.date_range("1970-01-01", periods=60, freq="YE")
+    da = xr.DataArray(x, dims=("scenario", "model", "downscaling", "time", "lat"), coords={"time": time})
+    dac = da.chunk({"lat": 1, "time": 20})
+
+    with assert_lazy:
+        g, u = lafferty_sriver(dac)
+    assert u.chunks is not None
+    g1, u1 = lafferty_sriver(da.isel(lat=1))
+    xr.testing.assert_allclose(u.isel(lat=1).transpose(*u1.dims), u1)
+    xr.testing.assert_allclose(g.isel(lat=1), g1)
+
+    _, u = general_partition(dac, var_first=["model", "downscaling"], mean_first=["scenario"], sm="poly")
+    _, u2 = general_partition(da, var_first=["model", "downscaling"], mean_first=["scenario"], sm=da.mean("time"))
+    assert set(u.uncertainty.values) == set(u2.uncertainty.values)
+
+    dhs = da.isel(downscaling=0)
+    _, u = hawkins_sutton(dhs.chunk({"lat": 1}))
+    _, u1 = hawkins_sutton(dhs.isel(lat=0))
+    xr.testing.assert_allclose(u.isel(lat=0).transpose(*u1.dims), u1)
@@ -707,3 +707,44 @@ def test_find_events(use_dask, ufunc):
     events = rl.find_events(cond, window=2, window_stop=3)
     exp = [[4.0], [9.0], [7.0]]
     np.testing.assert_equal(events.event_length, np.pad(exp, [(0, 0), (0, 2)], constant_values=np.nan))
+
+
+@pytest.mark.parametrize("use_dask", [True, False])
+@pytest.mark.parametrize("preserve", [True, False])
+def test_preserve_dtype(use_dask, ufunc, preserve):
+    values = np.zeros((2, 365), dtype=bool)
+    values[0, 100:110] = True
+    values[0, 150:170] = True
+    da = xr.DataArray(values, dims=("x", "time"), coords={"time": pd.date_range("2000-01-01", periods=365, freq="D")})
+    if use_dask:
+        da = da.chunk(x=1)
+
+    exp = np.float32 if preserve else np.float64
+    with set_options(preserve_dtype=preserve):
+        outs = {
+            "first_run": rl.first_run(da, window=3, ufunc_1dim=ufunc),
+            "last_run": rl.last_run(da, window=3, ufunc_1dim=ufunc),
+            "first_run_doy": rl.first_run(da, window=3, coord="dayofyear"),
+            "season_end": rl.season_end(da, window=5),
+            "run_end_after_date": rl.run_end_after_date(da, window=3, date="04-15"),
+        }
+        for name, out in outs.items():
+            assert out.dtype == exp, name
+        longest = rl.longest_run(da, ufunc_1dim=ufunc)
+        if preserve:
+            assert longest.dtype == np.float32
+
+        events = rl.find_events(da, window=3)
+        assert events.event_length.dtype == exp
+
+        # Coordinate values are not bounded by the size of the dimension, they are not cast
+        big = da.rename(time="x2").assign_coords(x2=np.arange(365) + 2.0**25 + 0.5)
+        first = rl.first_run(big, window=3, dim="x2", coord=True, ufunc_1dim=ufunc)
+        assert first.dtype == np.float64
+        np.testing.assert_array_equal(first, [100 + 2.0**25 + 0.5, np.nan])
+
+    np.testing.assert_array_equal(outs["first_run"], [100, np.nan])
+    np.testing.assert_array_equal(outs["last_run"], [169, np.nan])
+    np.testing.assert_array_equal(outs["first_run_doy"], [101, np.nan])
+    np.testing.assert_array_equal(outs["run_end_after_date"], [111, np.nan])
+    np.testing.assert_array_equal(longest, [20, 0])
@@ -148,6 +148,52 @@ class TestConvertUnitsTo:
         assert out.uas.attrs["units"] == "pc yr-1"
         assert out.snd.attrs["units"] == "km"
 
+    @pytest.mark.parametrize(
+        "src,tgt,context",
+        [
+            ("degC", "K", "none"),
+            ("K", "degF", "none"),
+            ("degF", "degC", "none"),
+            ("mm/d", "kg m-2 s-1", "hydro"),
+            ("m s-1", "km/h", "none"),
+            ("%", "1", "none"),
+        ],
+    )
+    def test_conversion_as_pint(self, src, tgt, context):
+        values = np.array([-40.0, 0, 12.5, np.nan])
+        da = xr.DataArray(values, dims=("x",), attrs={"units": src})
+        out = convert_units_to(da, tgt, context=context)
+        # Multiplicative conversions skip pint, but give the same results
+        with units.context(context):
+            exp = units.convert(values, units2pint(src), units2pint(tgt))
+        np.testing.assert_allclose(out, exp, rtol=1e-14)
+        assert out.attrs["units"] == pint2cfunits(units2pint(tgt))
+
+    def test_identity_no_copy(self, pr_series):
+        # Without a standard name, there is no CF conversion of the flux to a rate.
+        pr = pr_series(np.ones(10))
+        del pr.attrs["standard_name"]
+        out = convert_units_to(pr, "mm/s", context="hydro")
+        assert out.attrs["units"] == "mm s-1"
+        assert np.shares_memory(out.values, pr.values)
+
+    def test_conversion_offset_exact(self, tas_series):
+        tas = tas_series(np.array([273.15, 283.15]))
+        out = convert_units_to(tas, "degC")
+        np.testing.assert_array_equal(out, [0, 10])
+        np.testing.assert_array_equal(convert_units_to(out, "K"), tas)
+
+    @pytest.mark.parametrize(
+        "src,tgt,context",
+        [("degF", "degC", "none"), ("degC", "degF", "none"), ("mm/d", "kg m-2 s-1", "hydro")],
+    )
+    def test_conversion_matches_scalar(self, src, tgt, context):
+        # Arrays and thresholds are converted with the same rounding, so values on a threshold stay on it.
+        da = xr.DataArray(np.arange(0, 100, 0.5), dims=("x",), attrs={"units": src})
+        out = convert_units_to(da, tgt, context=context)
+        exp = [convert_units_to(f"{v} {src}", tgt, context=context) for v in da.values]
+        np.testing.assert_array_equal(out, exp)
+
 
 class TestUnitConversion:
     def test_pint2cfunits(self):
@@ -182,6 +228,19 @@ class TestUnitConversion:
         assert str2pint("m kg/s") == Q_(1, units="meter kilogram/second")
         assert str2pint("11.8 degC days") == Q_(11.8, units="delta_degree_Celsius days")
         assert str2pint("nan m^2 K^-3").units == Q_(1, units="m²/K³").units
+        assert str2pint("5") == Q_(5)
+
+    def test_memoized(self):
+        # Quantities are mutable, a new one is returned every time
+        q = str2pint("2 m")
+        assert q is not str2pint("2 m")
+        q *= 3
+        assert str2pint("2 m") == units.Quantity(2, units="m")
+
+        attrs = pint2cfattrs(units.delta_degC)
+        attrs["units"] = "K"
+        assert pint2cfattrs(units.delta_degC) == {"units": "degC", "units_metadata": "temperature: difference"}
+        assert units2pint({"units": "degC", "units_metadata": "temperature: difference"}) == units.delta_degC
 
 
 class TestCheckUnits:
@@ -251,6 +310,22 @@ def test_rate2amount(pr_series):
         np.testing.assert_array_equal(am_ys, 86400 * np.array([365, 366, 365]))
 
 
+@pytest.mark.parametrize("freq", ["D", "MS"])
+def test_rate2amount_out_units(pr_series, freq):
+    pr = pr_series(np.arange(365.0) / 86400, start="2019-01-01").assign_attrs(units="cm s-1")
+    with xr.set_options(keep_attrs=True):
+        pr = pr.resample(time=freq).mean()
+
+    # The conversion to the output units is folded in the multiplication by the period lengths
+    am = rate2amount(pr, out_units="mm")
+    assert am.attrs["units"] == "mm"
+    np.testing.assert_allclose(am, convert_units_to(rate2amount(pr), "mm"), rtol=1e-14)
+
+    rate = amount2rate(am, out_units="mm/d")
+    assert rate.attrs["units"] == "mm d-1"
+    np.testing.assert_allclose(rate, convert_units_to(pr, "mm/d"), rtol=1e-14)
+
+
 @pytest.mark.parametrize("srcfreq, exp", [("h", 3600), ("min", 60), ("s", 1), ("ns", 1e-9)])
 def test_rate2amount_subdaily(srcfreq, exp):
     pr = xr.DataArray(
@@ -445,3 +520,21 @@ def test_infer_sampling_units_errors():
     da = da[[0, 1, 5, 6]]
     with pytest.raises(ValueError, match="Unable to find"):
         infer_sampling_units(da)
+
+
+@pytest.mark.parametrize("preserve", [True, False])
+def test_preserve_dtype(pr_series, tas_series, preserve):
+    pr = pr_series(np.ones(365 * 2, dtype=np.float32), start="2019-01-01")
+    tas = tas_series(np.full(365, 273.15, dtype=np.float32))
+    exp = np.float32 if preserve else np.float64
+    with set_options(preserve_dtype=preserve):
+        assert convert_units_to(tas, "degF").dtype == np.float32
+        assert convert_units_to(pr, "mm/d").dtype == np.float32
+
+        with xr.set_options(keep_attrs=True):
+            pr_ms = pr.resample(time="MS").mean()
+        # Monthly periods have different lengths, computed in double precision
+        am = rate2amount(pr_ms)
+        assert am.dtype == exp
+        np.testing.assert_array_equal(am[:4], 86400 * np.array([31, 28, 31, 30]))
+        assert amount2rate(am).dtype == exp